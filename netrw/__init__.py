@@ -5,7 +5,29 @@ _____
 Network Rewiring
 
 A 2022 NetSI Collabathon Product.
+
+Submodules are imported on first use (PEP 562), so that ``import netrw``
+and ``from netrw.rewire import ...`` only load numpy and networkx; the
+analysis tools bring in matplotlib and netrd when they are used.
 """
 
-from .analysis import *
-from .rewire import *
+import importlib
+
+_submodules = {"analysis", "rewire", "visualization", "distributions"}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        if name == "distributions":
+            name = "analysis.distributions"
+        return importlib.import_module("." + name, __name__)
+    analysis = importlib.import_module(".analysis", __name__)
+    if name in analysis._attributes:
+        return getattr(analysis, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    from .analysis import _attributes
+
+    return sorted(set(globals()) | _submodules | set(_attributes))
@@ -1 +1,48 @@
-from .distributions import *
+import importlib
+
+_submodules = {
+    "confusion",
+    "distance_trajectory",
+    "distributions",
+    "ensemble",
+    "plot_property_values_over_time",
+    "properties",
+    "properties_heatmap",
+    "properties_overtime",
+    "robustness",
+    "rewiring_analysis",
+    "streaming",
+}
+
+# public names and the submodule they are imported from on first use
+_attributes = {
+    "get_property_distribution": "distributions",
+    "integrated_autocorrelation_time": "distributions",
+    "split_rhat": "distributions",
+    "sample_property_distribution": "distributions",
+    "StreamingStats": "streaming",
+    "Property": "properties",
+    "PropertyEvaluator": "properties",
+    "rewire_ensemble": "ensemble",
+    "ensemble_degrees": "ensemble",
+    "ensemble_edge_overlap": "ensemble",
+    "ensemble_assortativity": "ensemble",
+    "ensemble_spectral_moments": "ensemble",
+    "parameter_sweep": "properties_heatmap",
+    "plot_properties_heatmap": "properties_heatmap",
+    "percolation_curves": "robustness",
+    "schneider_robustness": "robustness",
+}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    if name in _attributes:
+        module = importlib.import_module("." + _attributes[name], __name__)
+        return getattr(module, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _submodules | set(_attributes))
@@ -1,8 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from ..rewire import BlockRNG
+
+
+def _ensemble_sample_distances(G, rw, distances, timesteps):
+    """Rewire one ensemble member and measure every distance against it."""
+    rG = rw(G, timesteps=timesteps)
+    return [dist(rG, G) for dist in distances]
 
 
 def rewiring_distance_confusion_matrix(
-    G, rewiring_methods, distance_measures, timesteps=100, ensemble_size=10
+    G,
+    rewiring_methods,
+    distance_measures,
+    timesteps=100,
+    ensemble_size=10,
+    seed=None,
+    n_jobs=1,
+    cache=None,
 ):
     """Plotting distances from start graph for different rewiring schemes and distance metrics
 
@@ -20,6 +35,14 @@ def rewiring_distance_confusion_matrix(
         the number of iterations
     ensemble_size : int, default: 10
         the number of rewiring trajectories to run.
+    seed : int, optional
+        seed for the rewirers. Every (method, sample) pair gets its own child
+        stream, so the result does not depend on `n_jobs`.
+    n_jobs : int, default: 1
+        number of worker processes the method x sample grid is spread over.
+    cache : RewireCache, optional
+        on-disk cache of rewired graphs. With a fixed `seed`, repeated runs
+        load the ensembles from the cache instead of rewiring again.
 
     Returns
     -------
@@ -29,17 +52,43 @@ def rewiring_distance_confusion_matrix(
 
     Notes
     -----
+    Each rewired graph is generated once and compared to `G` with all the
+    distance measures, so the cost of rewiring does not grow with the number
+    of distances.
+
     Currently this method does not support keyword args for the rewiring methods
     and distance metrics.
     """
     n = len(rewiring_methods)
     m = len(distance_measures)
-    C = np.zeros([n, m])
+    distances = [distance() for distance in distance_measures]
+
+    # one child stream per method, and one per sample within each method
+    method_streams = BlockRNG(seed).spawn(n)
+    grid = []
     for i in range(n):
-        rw = rewiring_methods[i]()
-        for j in range(m):
-            dist = distance_measures[i]()
-            for k in range(ensemble_size):
-                rG = rw.full_rewire(G, timesteps=timesteps)
-                C[i, j] += dist(rG, G) / ensemble_size
+        rw = rewiring_methods[i](seed=method_streams[i], cache=cache)
+        rewirers = rw.spawn(ensemble_size)
+        grid += [(i, rw) for rw in rewirers]
+
+    if n_jobs == 1:
+        rows = [
+            _ensemble_sample_distances(G, rw, distances, timesteps) for _, rw in grid
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            rows = list(
+                executor.map(
+                    _ensemble_sample_distances,
+                    [G] * len(grid),
+                    [rw for _, rw in grid],
+                    [distances] * len(grid),
+                    [timesteps] * len(grid),
+                    chunksize=max(1, len(grid) // (4 * n_jobs)),
+                )
+            )
+
+    C = np.zeros([n, m])
+    for (i, _), row in zip(grid, rows):
+        C[i] += np.asarray(row) / ensemble_size
     return C
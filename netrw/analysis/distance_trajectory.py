@@ -1,14 +1,12 @@
-from matplotlib import pyplot as plt
 import networkx as nx
 import numpy as np
 import warnings, copy
-import netrd
 from ..rewire import NetworkXEdgeSwap
 
 
 def distanceTrajectory(
     G,
-    distance=netrd.distance.Hamming,
+    distance=None,
     rewire=NetworkXEdgeSwap,
     num_steps=100,
     num_runs=100,
@@ -22,7 +20,7 @@ def distanceTrajectory(
     ----------
     G : networkx Graph or DiGraph
 
-    distance : netrd graph distance class
+    distance : netrd graph distance class, default: netrd.distance.Hamming
 
     rewire : netrw rewire class
 
@@ -43,6 +41,11 @@ def distanceTrajectory(
        the netrw rewire class
     """
 
+    if distance is None:
+        import netrd
+
+        distance = netrd.distance.Hamming
+
     G0 = copy.deepcopy(G)
 
     # check whether input for num rewire in a number of rewiring steps (int)
@@ -73,7 +76,7 @@ def distanceTrajectory(
 
 def plotDistanceTrajectory(
     G,
-    distance=netrd.distance.Hamming,
+    distance=None,
     num_steps=100,
     show=["mean", "median", "std-env"],
     labels=None,
@@ -86,6 +89,12 @@ def plotDistanceTrajectory(
     ylabel=None,
     **kwargs
 ):
+    from matplotlib import pyplot as plt
+
+    if distance is None:
+        import netrd
+
+        distance = netrd.distance.Hamming
 
     # check whether input for num steps in a number of rewiring steps (int)
     # or a list of steps
@@ -1,9 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+import warnings
 import numpy as np
 
 
 def get_property_distribution(
-    G, rewiring_method, property, skip=10, num_samples=1000, **kwargs
+    G, rewiring_method, property, skip=10, num_samples=1000, seed=None, **kwargs
 ):
     """_summary_
 
@@ -21,20 +23,249 @@ def get_property_distribution(
         How often to store the property of interest.
     num_samples : int, default: 1000
         The number of samples to form the empirical distribution.
+    seed : int, optional
+        Seed for the rewiring method.
     **kwargs : optional keyword args for the rewiring method
 
     Returns
     -------
     numpy array
         an array of properties from each point outputted in the rewiring process.
+
+    See Also
+    --------
+    sample_property_distribution : multi-chain sampler that picks burn-in and
+        thinning from the autocorrelation of the chains.
     """
     G = deepcopy(G)
-    rw = rewiring_method()
+    rw = rewiring_method(seed=seed)
     properties = np.zeros(num_samples)
     for i in range(num_samples):
         for j in range(skip):
             G = rw.step_rewire(G, copy_graph=False, **kwargs)
             if j >= skip - 1:
                 properties[i] = property(G)
-        print(i)
     return properties
+
+
+def integrated_autocorrelation_time(x, c=5):
+    """
+    Estimate the integrated autocorrelation time of a chain.
+
+    The autocorrelation function is computed with an FFT and summed up to the
+    smallest window M with M >= c * tau(M) (Sokal's automatic windowing).
+
+    Parameters
+    ----------
+    x : 1D array
+        The chain.
+    c : float, default: 5
+        Window constant.
+
+    Returns
+    -------
+    float
+        The autocorrelation time, in steps of `x`. At least 1.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if n < 2 or np.var(x) == 0:
+        return 1.0
+
+    size = 2 ** int(np.ceil(np.log2(2 * n)))
+    f = np.fft.rfft(x - np.mean(x), n=size)
+    acf = np.fft.irfft(f * np.conj(f), n=size)[:n]
+    acf /= acf[0]
+
+    taus = 2 * np.cumsum(acf) - 1
+    window = np.arange(n) >= c * taus
+    M = np.argmax(window) if np.any(window) else n - 1
+    return max(taus[M], 1.0)
+
+
+def split_rhat(chains):
+    """
+    Split-chain potential scale reduction factor (R-hat) of Gelman et al.
+
+    Parameters
+    ----------
+    chains : 2D array
+        One chain per row, all of the same length.
+
+    Returns
+    -------
+    float
+        R-hat; values close to 1 indicate that the chains have mixed.
+    """
+    chains = np.asarray(chains, dtype=float)
+    half = chains.shape[1] // 2
+    if half < 2:
+        return np.inf
+    chains = np.vstack([chains[:, :half], chains[:, half : 2 * half]])
+
+    W = np.mean(np.var(chains, axis=1, ddof=1))
+    B = half * np.var(np.mean(chains, axis=1), ddof=1)
+    if W == 0:
+        return 1.0 if B == 0 else np.inf
+    var_hat = (half - 1) / half * W + B / half
+    return np.sqrt(var_hat / W)
+
+
+def _advance_chain(G, rw, properties, steps, record_every, kwargs):
+    """Run one chain for `steps` recorded samples and return its new state and trace."""
+    trace = np.zeros((steps, len(properties)))
+    for t in range(steps):
+        for _ in range(record_every):
+            G = rw.step_rewire(G, copy_graph=False, **kwargs)
+        trace[t] = [prop(G) for prop in properties]
+    return G, rw, trace
+
+
+def sample_property_distribution(
+    G,
+    rewiring_method,
+    properties,
+    n_chains=4,
+    target_ess=400,
+    rhat_threshold=1.05,
+    record_every=1,
+    check_every=100,
+    max_steps=100000,
+    burn_in_factor=2,
+    n_jobs=1,
+    seed=None,
+    **kwargs
+):
+    """Sample the distribution of graph properties with several MCMC chains.
+
+    Runs `n_chains` independent rewiring chains from `G` and records the
+    properties along the way. Every `check_every` recorded steps, the
+    integrated autocorrelation time tau of every property is re-estimated,
+    the burn-in is set to `burn_in_factor` * tau and the chains are thinned
+    by tau / 2. Sampling stops once the effective sample size (ESS) of every
+    property reaches `target_ess`, its split R-hat is below `rhat_threshold`
+    and the burn-in is less than half of the chains, or after `max_steps`
+    recorded steps per chain.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The initial graph
+    rewiring_method : Rewire method
+        The class that will rewire the graph step-by-step. Must have the method `step_rewire`.
+    properties : function or list of functions
+        functions that accept a NetworkX Graph object as an input and return a number.
+        With `n_jobs` > 1 they must be picklable (module-level functions, not lambdas).
+    n_chains : int, default: 4
+        The number of independent chains.
+    target_ess : int, default: 400
+        The effective sample size, over all chains, to reach for every property.
+    rhat_threshold : float, default: 1.05
+        The largest split R-hat accepted as converged.
+    record_every : int, default: 1
+        Number of rewiring steps between two recorded property values.
+    check_every : int, default: 100
+        Number of recorded steps per chain between two convergence checks.
+    max_steps : int, default: 100000
+        Maximum number of recorded steps per chain.
+    burn_in_factor : float, default: 2
+        The burn-in, in multiples of the autocorrelation time.
+    n_jobs : int, default: 1
+        Number of worker processes the chains are spread over.
+    seed : int, optional
+        Seed for the rewiring method; every chain runs on its own child stream.
+    **kwargs : optional keyword args for the rewiring method
+
+    Returns
+    -------
+    samples : numpy array
+        The thinned post-burn-in samples of all chains, of shape
+        (num_samples,) for a single property function and
+        (num_samples, len(properties)) for a list.
+    diagnostics : dict
+        "tau" (autocorrelation time of every property, in recorded steps),
+        "ess" and "rhat" (per property), "burn_in" and "thin" (in recorded
+        steps), "steps" (recorded steps per chain) and "converged".
+    """
+    single = callable(properties)
+    if single:
+        properties = [properties]
+
+    rewirers = rewiring_method(seed=seed).spawn(n_chains)
+    graphs = [deepcopy(G) for _ in range(n_chains)]
+    traces = [np.zeros((0, len(properties))) for _ in range(n_chains)]
+
+    executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        converged = False
+        while traces[0].shape[0] < max_steps:
+            steps = min(check_every, max_steps - traces[0].shape[0])
+            args = (
+                graphs,
+                rewirers,
+                [properties] * n_chains,
+                [steps] * n_chains,
+                [record_every] * n_chains,
+                [kwargs] * n_chains,
+            )
+            if executor is None:
+                results = list(map(_advance_chain, *args))
+            else:
+                results = list(executor.map(_advance_chain, *args))
+            graphs = [r[0] for r in results]
+            rewirers = [r[1] for r in results]
+            traces = [np.vstack([trace, r[2]]) for trace, r in zip(traces, results)]
+
+            diagnostics = _diagnostics(np.array(traces), burn_in_factor)
+            if (
+                np.all(diagnostics["ess"] >= target_ess)
+                and np.all(diagnostics["rhat"] < rhat_threshold)
+                and diagnostics["burn_in"] < diagnostics["steps"] / 2
+            ):
+                converged = True
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    diagnostics["converged"] = converged
+    if not converged:
+        warnings.warn(
+            "Chains did not reach the target effective sample size or R-hat in %i steps."
+            % max_steps
+        )
+
+    traces = np.array(traces)
+    samples = traces[:, diagnostics["burn_in"] :: diagnostics["thin"], :]
+    samples = samples.reshape(-1, len(properties))
+    if single:
+        samples = samples[:, 0]
+    return samples, diagnostics
+
+
+def _diagnostics(traces, burn_in_factor):
+    """Autocorrelation, burn-in, thinning, ESS and R-hat of (chains, steps, properties) traces."""
+    n_chains, steps, n_props = traces.shape
+    tau = np.array(
+        [
+            max(
+                integrated_autocorrelation_time(traces[c, :, p])
+                for c in range(n_chains)
+            )
+            for p in range(n_props)
+        ]
+    )
+    burn_in = min(int(np.ceil(burn_in_factor * np.max(tau))), steps - 1)
+    thin = max(1, int(np.max(tau) / 2))
+
+    kept = traces[:, burn_in:, :]
+    ess = n_chains * kept.shape[1] / tau
+    rhat = np.array([split_rhat(kept[:, :, p]) for p in range(n_props)])
+    return {
+        "tau": tau,
+        "ess": ess,
+        "rhat": rhat,
+        "burn_in": burn_in,
+        "thin": thin,
+        "steps": steps,
+    }
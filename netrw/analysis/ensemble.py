@@ -0,0 +1,142 @@
+import networkx as nx
+import numpy as np
+from ..rewire.edge_array import to_edge_array, to_sparse, stack_edge_arrays
+
+
+def rewire_ensemble(
+    G, rewiring_method, k, seed=None, stacked="csr", cache=None, **kwargs
+):
+    """
+    Rewire G ``k`` times and stack the samples into one sparse matrix.
+
+    Parameters
+    ----------
+    G : networkx graph
+    rewiring_method : netrw rewire class
+        Every sample is rewired from G by ``full_rewire``, each with its own
+        child stream of ``seed``.
+    k : int
+        Number of samples.
+    seed : int, optional
+    stacked : {"csr", "coo", None}, default: "csr"
+        ``"csr"`` gives the (k n, k n) block-diagonal adjacency matrix of the
+        samples, ``"coo"`` a 3-D (k, n, n) COO array (see
+        ``stack_edge_arrays``), None the list of rewired graphs.
+    cache : RewireCache, optional
+        On-disk cache of rewired graphs. With a fixed ``seed``, repeated
+        calls load the samples from the cache instead of rewiring again.
+    **kwargs
+        Passed to ``full_rewire``.
+
+    Returns
+    -------
+    samples : sparse array or list of networkx graphs
+        Nodes are indexed in ``G.nodes()`` order.
+    """
+    rewirers = rewiring_method(seed=seed, cache=cache).spawn(k)
+    graphs = [rw(G, **kwargs) for rw in rewirers]
+    if stacked is None:
+        return graphs
+
+    index = {u: i for i, u in enumerate(G)}
+    samples = [
+        np.array([(index[u], index[v]) for u, v in H.edges()], dtype=np.int64)
+        for H in graphs
+    ]
+    return stack_edge_arrays(samples, len(index), G.is_directed(), format=stacked)
+
+
+def _blocks(S, n):
+    """Block-diagonal CSR form of a stacked ensemble, with k and n."""
+    import scipy.sparse as sp
+
+    if S.ndim == 3:
+        k, n, _ = S.shape
+        sample, row, col = S.coords
+        A = sp.coo_array(
+            (S.data, (sample * n + row, sample * n + col)), shape=(k * n, k * n)
+        )
+        return A.tocsr(), k, n
+    if n is None:
+        raise ValueError("The number of nodes n is needed for block matrices.")
+    return S.tocsr(), S.shape[0] // n, n
+
+
+def _block_sums(x, k, n):
+    return np.asarray(x).reshape(k, n).sum(axis=1)
+
+
+def ensemble_degrees(S, n=None):
+    """Degrees (out-degrees if directed) of every sample, shape (k, n)."""
+    A, k, n = _blocks(S, n)
+    return np.asarray(A.sum(axis=1)).reshape(k, n)
+
+
+def ensemble_edge_overlap(S, G0, n=None):
+    """
+    Fraction of the edges of G0 present in every sample, shape (k,).
+
+    G0 is a networkx graph on the same nodes, in the same order, or its
+    sparse adjacency matrix.
+    """
+    import scipy.sparse as sp
+
+    A, k, n = _blocks(S, n)
+    if isinstance(G0, nx.Graph):
+        G0 = to_sparse(n, to_edge_array(G0)[1], directed=G0.is_directed())
+    A0 = sp.csr_array(G0 != 0, dtype=float)
+    B = sp.kron(sp.eye(k), A0, format="csr")
+    shared = (A != 0).multiply(B).sum(axis=1)
+    return _block_sums(shared, k, n) / A0.sum()
+
+
+def ensemble_assortativity(S, n=None):
+    """
+    Degree assortativity of every sample, shape (k,): the Pearson
+    correlation of the degrees at the ends of the edges (out-degree of the
+    source and in-degree of the target if directed), as in
+    ``nx.degree_assortativity_coefficient``.
+    """
+    A, k, n = _blocks(S, n)
+    A = (A != 0).tocoo()
+    out_degree = np.bincount(A.row, minlength=k * n)
+    in_degree = np.bincount(A.col, minlength=k * n)
+    x = out_degree[A.row].astype(float)
+    y = in_degree[A.col].astype(float)
+
+    # per-sample sums, with the sample of every entry given by its row
+    sample = A.row // n
+    count = np.bincount(sample, minlength=k)
+    sx, sy = (np.bincount(sample, z, minlength=k) for z in (x, y))
+    sxx, syy, sxy = (np.bincount(sample, z, minlength=k) for z in (x * x, y * y, x * y))
+    cov = count * sxy - sx * sy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return cov / np.sqrt((count * sxx - sx**2) * (count * syy - sy**2))
+
+
+def ensemble_spectral_moments(S, orders=(2, 3, 4), n=None):
+    """
+    Spectral moments ``tr(A^p) / n`` of every sample, shape (k, len(orders)).
+
+    ``tr(A^p)`` is computed as the sum of the entries of
+    ``A^a * (A^(p - a))^T`` with ``a = p // 2``, so the highest matrix
+    power needed is about half of the highest order.
+    """
+    A, k, n = _blocks(S, n)
+    orders = list(orders)
+    powers = {1: A}
+    for p in range(2, (max(orders) + 1) // 2 + 1):
+        powers[p] = powers[p - 1] @ A
+
+    moments = np.zeros((k, len(orders)))
+    for c, p in enumerate(orders):
+        if p == 0:
+            moments[:, c] = n
+            continue
+        a = p // 2
+        if a == 0:
+            diagonal = A.diagonal()
+        else:
+            diagonal = powers[a].multiply(powers[p - a].T).sum(axis=1)
+        moments[:, c] = _block_sums(diagonal, k, n)
+    return moments / n
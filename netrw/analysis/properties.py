@@ -0,0 +1,220 @@
+import numpy as np
+from ..rewire.edge_array import to_edge_array, to_sparse
+
+# functions computing the intermediate quantities, and what they need
+_intermediates = {}
+
+
+def _intermediate(name, *requires):
+    def register(function):
+        _intermediates[name] = (function, requires)
+        return function
+
+    return register
+
+
+class _Intermediates(dict):
+    """Intermediate quantities of one graph, each computed on first use."""
+
+    def __init__(self, G):
+        super().__init__(graph=G)
+
+    def __missing__(self, name):
+        function, requires = _intermediates[name]
+        value = self[name] = function(*(self[r] for r in requires))
+        return value
+
+
+@_intermediate("edges", "graph")
+def _edges(G):
+    return to_edge_array(G)[1]
+
+
+@_intermediate("n", "graph")
+def _n(G):
+    return G.number_of_nodes()
+
+
+@_intermediate("degrees", "edges", "n")
+def _degrees(edges, n):
+    return np.bincount(edges.ravel(), minlength=n)
+
+
+@_intermediate("adjacency", "edges", "n")
+def _adjacency(edges, n):
+    # symmetric CSR matrix without self-loops
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    A = to_sparse(n, edges, np.ones(len(edges)))
+    A.data[:] = 1
+    return A
+
+
+@_intermediate("components", "adjacency")
+def _components(A):
+    from scipy.sparse.csgraph import connected_components
+
+    return connected_components(A, directed=False)[1]
+
+
+@_intermediate("triangles", "adjacency")
+def _triangles(A):
+    return np.asarray((A @ A).multiply(A).sum(axis=1)).ravel() / 2
+
+
+@_intermediate("distances", "adjacency")
+def _distances(A):
+    from scipy.sparse.csgraph import shortest_path
+
+    return shortest_path(A, directed=False, unweighted=True)
+
+
+class Property:
+    """
+    A network property computed from intermediate quantities shared with
+    the other properties of a ``PropertyEvaluator``.
+
+    Parameters
+    ----------
+    name : str
+    function : callable
+        Called with the intermediate quantities in ``requires``, as
+        positional arguments in that order, and returns a number.
+    requires : tuple of str, default: ("graph",)
+        Intermediate quantities the property needs, among
+
+        - ``graph``: the networkx graph,
+        - ``n``: the number of nodes,
+        - ``edges``: the edges as an (m, 2) array of node indices,
+        - ``degrees``: the degree of every node,
+        - ``adjacency``: the symmetric scipy.sparse CSR adjacency matrix,
+          without self-loops,
+        - ``components``: the connected component label of every node,
+        - ``triangles``: the number of triangles at every node,
+        - ``distances``: the (n, n) array of shortest path lengths, inf
+          between components.
+
+        Nodes are indexed in ``G.nodes()`` order.
+    """
+
+    def __init__(self, name, function, requires=("graph",)):
+        unknown = set(requires) - set(_intermediates) - {"graph"}
+        if unknown:
+            raise ValueError("Unknown intermediate quantities %s." % sorted(unknown))
+        self.name = name
+        self.function = function
+        self.requires = tuple(requires)
+
+    def __call__(self, G):
+        return PropertyEvaluator([self])(G)[0]
+
+    def __repr__(self):
+        return "Property(%r)" % self.name
+
+    def __reduce__(self):
+        # the properties of this module are pickled by reference, so that
+        # they can be sent to worker processes
+        if globals().get(self.name) is self:
+            return self.name
+        return Property, (self.name, self.function, self.requires)
+
+
+class PropertyEvaluator:
+    """
+    Evaluate several properties of a graph at once.
+
+    Every intermediate quantity the properties need is computed once per
+    graph, and the properties are computed from those arrays, so adding a
+    property that uses the same degrees, components or distances as the
+    others costs little.
+
+    Parameters
+    ----------
+    properties : list of Property
+    names : list of str, optional
+        Names of the properties, by default their own.
+
+    Examples
+    --------
+    >>> from netrw.analysis.properties import PropertyEvaluator, assortativity, transitivity
+    >>> evaluate = PropertyEvaluator([assortativity, transitivity])
+    >>> values = evaluate(G)  # array of the two values
+    """
+
+    def __init__(self, properties, names=None):
+        self.properties = list(properties)
+        if names is None:
+            names = [p.name for p in self.properties]
+        if len(names) != len(self.properties):
+            raise ValueError("There must be one name per property.")
+        self.names = list(names)
+
+    def __len__(self):
+        return len(self.properties)
+
+    def __call__(self, G):
+        """Values of the properties of G, as an array."""
+        cache = _Intermediates(G)
+        return np.array(
+            [p.function(*(cache[r] for r in p.requires)) for p in self.properties],
+            dtype=float,
+        )
+
+
+def _component_pairs(components):
+    sizes = np.bincount(components)
+    return np.sum(sizes * (sizes - 1) / 2)
+
+
+def _assortativity(edges, degrees):
+    # Pearson correlation of the degrees at both ends of every edge
+    x = degrees[edges.ravel()]
+    y = degrees[edges[:, ::-1].ravel()]
+    return np.corrcoef(x, y)[0, 1]
+
+
+def _local_clustering(triangles, degrees):
+    pairs = degrees * (degrees - 1) / 2
+    return np.divide(triangles, pairs, out=np.zeros(len(pairs)), where=pairs > 0)
+
+
+number_of_nodes = Property("number_of_nodes", lambda n: n, ("n",))
+number_of_edges = Property("number_of_edges", len, ("edges",))
+min_degree = Property("min_degree", np.min, ("degrees",))
+max_degree = Property("max_degree", np.max, ("degrees",))
+mean_degree = Property("mean_degree", np.mean, ("degrees",))
+degree_second_moment = Property(
+    "degree_second_moment", lambda k: np.mean(k.astype(float) ** 2), ("degrees",)
+)
+assortativity = Property("assortativity", _assortativity, ("edges", "degrees"))
+number_connected_components = Property(
+    "number_connected_components",
+    lambda labels: len(np.unique(labels)),
+    ("components",),
+)
+largest_component_size = Property(
+    "largest_component_size", lambda labels: np.bincount(labels).max(), ("components",)
+)
+transitivity = Property(
+    "transitivity",
+    lambda t, k: np.sum(t) / max(np.sum(k * (k - 1) / 2), 1),
+    ("triangles", "degrees"),
+)
+average_clustering = Property(
+    "average_clustering",
+    lambda t, k: np.mean(_local_clustering(t, k)),
+    ("triangles", "degrees"),
+)
+# averaged over the nodes of degree at least 2 only, as in
+# rewiring_analysis.average_local_clustering
+average_local_clustering = Property(
+    "average_local_clustering",
+    lambda t, k: np.sum(_local_clustering(t, k)) / np.sum(k > 1),
+    ("triangles", "degrees"),
+)
+# averaged over the pairs of nodes in the same component, as in
+# rewiring_analysis.average_shortest_path_length
+average_shortest_path_length = Property(
+    "average_shortest_path_length",
+    lambda d, labels: np.sum(d[np.isfinite(d)]) / 2 / _component_pairs(labels),
+    ("distances", "components"),
+)
@@ -0,0 +1,202 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+import numpy as np
+from .properties import Property, PropertyEvaluator
+
+
+def _evaluator(properties):
+    """PropertyEvaluator of a function, a Property or a list of either."""
+    if isinstance(properties, PropertyEvaluator):
+        return properties
+    if callable(properties):
+        properties = [properties]
+    return PropertyEvaluator(
+        [p if isinstance(p, Property) else Property(p.__name__, p) for p in properties]
+    )
+
+
+def _rewire_cell(G, rw, evaluate, params, kwargs):
+    """Properties of one rewiring of G with the parameters of one grid cell."""
+    H = rw(deepcopy(G), copy_graph=False, **params, **kwargs)
+    return evaluate(H)[None, :]
+
+
+def _rewire_checkpoints(G, rw, evaluate, params, checkpoint, steps, kwargs):
+    """
+    Properties after every number of steps in ``steps`` (increasing) of one
+    rewiring of G, which is continued from one checkpoint to the next.
+    """
+    H = deepcopy(G)
+    values = np.zeros((len(steps), len(evaluate)))
+    done = 0
+    for i, t in enumerate(steps):
+        if t > done:
+            H = rw(H, copy_graph=False, **{checkpoint: t - done}, **params, **kwargs)
+            done = t
+        values[i] = evaluate(H)
+    return values
+
+
+def parameter_sweep(
+    G,
+    rewiring_method,
+    properties,
+    grid,
+    num_samples=10,
+    checkpoint=None,
+    n_jobs=1,
+    seed=None,
+    cache=None,
+    **kwargs
+):
+    """
+    Ensemble of network properties over a grid of two rewiring parameters.
+
+    For every cell of the grid, G is rewired ``num_samples`` times by
+    ``full_rewire`` with the parameters of the cell, and the properties of
+    the rewired graphs are computed. If one of the two parameters is
+    ``checkpoint``, a number of rewiring steps, every rewiring runs along
+    that axis instead of restarting from G: the graph rewired for the
+    smallest number of steps is rewired further for the next one, and so
+    on, so a column of the grid costs as many steps as its largest value.
+    This assumes that rewiring for a + b steps is the same process as
+    rewiring for a steps and then for b steps, as for rewirers whose steps
+    are independent attempts (e.g. ``GlobalRewiring``), but not for
+    rewirers that adapt along the run, such as ``AlgebraicConnectivity``
+    or the local assortativity searches, so it is off by default.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The initial graph.
+    rewiring_method : netrw rewire class
+        Every rewiring runs on its own child stream of ``seed``, so the
+        results do not depend on ``n_jobs``.
+    properties : function, Property, list of either, or PropertyEvaluator
+        Functions that take a NetworkX graph and return a number (see
+        ``netrw.analysis.properties``). With ``n_jobs`` > 1 they must be
+        picklable (module-level functions, not lambdas).
+    grid : dict
+        Two parameters of ``full_rewire`` and their values, e.g.
+        ``{"p": [0.1, 0.5], "timesteps": [10, 100, 1000]}``. The first one
+        indexes the rows of the heatmap and the second one its columns.
+    num_samples : int, default: 10
+        Number of rewirings per cell.
+    checkpoint : str, optional
+        Parameter along which rewirings are continued from the previous
+        value, if it is in ``grid``, e.g. "timesteps"; its values must be
+        non-negative numbers of steps. By default every cell is rewired
+        from G.
+    n_jobs : int, default: 1
+        Number of worker processes the rewirings are spread over.
+    seed : int, optional
+    cache : RewireCache, optional
+        On-disk cache of rewired graphs. With a fixed ``seed``, repeated
+        sweeps load the rewirings from the cache instead of rewiring again.
+        With ``checkpoint``, only the first value of every rewiring can be
+        looked up, since the later ones continue its random stream.
+    **kwargs
+        Other parameters of ``full_rewire``, the same for every cell.
+
+    Returns
+    -------
+    values : dict
+        The property names and, for each, a numpy array of shape
+        (len(rows), len(columns), num_samples) of its values at every cell
+        and rewiring. ``plot_properties_heatmap`` draws their mean.
+    """
+    if len(grid) != 2:
+        raise ValueError("The grid must have exactly two parameters.")
+    evaluate = _evaluator(properties)
+    names = list(grid)
+    shape = tuple(len(grid[name]) for name in names)
+
+    if checkpoint in grid:
+        axis = names.index(checkpoint)
+        other = names[1 - axis]
+        if min(grid[checkpoint]) < 0:
+            raise ValueError(
+                "The values of %s must be non-negative to be checkpointed." % checkpoint
+            )
+        steps = sorted(set(grid[checkpoint]))
+        position = [steps.index(t) for t in grid[checkpoint]]
+        tasks = [(i, s) for i in range(len(grid[other])) for s in range(num_samples)]
+        worker = _rewire_checkpoints
+        args = (
+            [{other: grid[other][i]} for i, _ in tasks],
+            [checkpoint] * len(tasks),
+            [steps] * len(tasks),
+        )
+    else:
+        cells = [(i, j) for i in range(shape[0]) for j in range(shape[1])]
+        tasks = [(cell, s) for cell in cells for s in range(num_samples)]
+        worker = _rewire_cell
+        args = (
+            [
+                {names[0]: grid[names[0]][i], names[1]: grid[names[1]][j]}
+                for (i, j), _ in tasks
+            ],
+        )
+
+    rewirers = rewiring_method(seed=seed, cache=cache).spawn(len(tasks))
+    args = (
+        [G] * len(tasks),
+        rewirers,
+        [evaluate] * len(tasks),
+        *args,
+        [kwargs] * len(tasks),
+    )
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunksize = max(1, len(tasks) // (4 * n_jobs))
+            results = list(executor.map(worker, *args, chunksize=chunksize))
+    else:
+        results = list(map(worker, *args))
+
+    values = np.zeros(shape + (num_samples, len(evaluate)))
+    if checkpoint in grid:
+        for (i, s), result in zip(tasks, results):
+            if axis == 0:
+                values[:, i, s] = result[position]
+            else:
+                values[i, :, s] = result[position]
+    else:
+        for ((i, j), s), result in zip(tasks, results):
+            values[i, j, s] = result[0]
+
+    return {name: values[..., p] for p, name in enumerate(evaluate.names)}
+
+
+def plot_properties_heatmap(values, grid, label=""):
+    """
+    Plot the mean of a network property over a grid of two rewiring
+    parameters, as computed by ``parameter_sweep``.
+
+    Parameters
+    ----------
+    values : numpy array of shape (len(rows), len(columns), num_samples)
+        The values of one property from the output of ``parameter_sweep``.
+    grid : dict
+        The grid the values were computed on.
+    label : str, optional
+        Label of the colorbar.
+
+    Returns
+    -------
+    fig : matplotlib figure
+    """
+    import matplotlib.pyplot as plt
+
+    rows, columns = list(grid)
+    mean = np.mean(values, axis=-1)
+
+    fig, ax = plt.subplots()
+    image = ax.imshow(mean, origin="lower", aspect="auto", cmap="viridis")
+    ax.set_xticks(range(len(grid[columns])))
+    ax.set_xticklabels(grid[columns])
+    ax.set_yticks(range(len(grid[rows])))
+    ax.set_yticklabels(grid[rows])
+    ax.set_xlabel(columns)
+    ax.set_ylabel(rows)
+    fig.colorbar(image, ax=ax, label=label)
+    return fig
@@ -1,12 +1,12 @@
 from copy import deepcopy
 import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
-import netrw
-from netrw.rewire import KarrerRewirer, AlgebraicConnectivity, NetworkXEdgeSwap
+from .streaming import StreamingStats
 
 
-def properties_overtime(init_graph, rewire_method, property1, tmax, numit):
+def properties_overtime(
+    init_graph, rewire_method, property1, tmax, numit, seed=None, streaming=False
+):
     """
     Analyze the property values of a network as a function of rewire steps.
     Looks at how a network property changes as a rewiring process occurs.
@@ -25,25 +25,40 @@ def properties_overtime(init_graph, rewire_method, property1, tmax, numit):
     numit : int
         Number of rewiring iterations to perform on the initial graph. The given rewiring process will be performed numit
         times on the initial graph to look at the distribution of outcomes for this rewiring process on the initial graph.
+    seed : int, optional
+        Seed for the rewirer. Every iteration runs on its own child stream spawned from it, so the ensemble
+        is reproducible.
+    streaming : bool, default: False
+        If True, only a StreamingStats summary of the iterations is kept, so memory is O(tmax)
+        whatever numit is.
     Returns
     -------
     property_dict: dictionary
         Dictionary of output where the keys are the property name and the values are a 2D numpy arry of the network property
         calculated at each step and iteration of the rewiring process. Rows are single iteration over a rewiring process.
         Columns show different iterations of the rewiring process from the initial graph.
+        With streaming=True, the value is a StreamingStats of the iterations instead.
 
     """
     property_dict = {}
-    property_dict[property1.__name__] = np.zeros((numit, tmax))
-    rw = rewire_method()
+    if streaming:
+        property_dict[property1.__name__] = StreamingStats(tmax)
+    else:
+        property_dict[property1.__name__] = np.zeros((numit, tmax))
+    rewirers = rewire_method(seed=seed).spawn(numit)
+    trajectory = np.zeros(tmax)
 
-    for i in range(numit):
+    for i, rw in enumerate(rewirers):
         G0 = deepcopy(init_graph)
         propertyval = property1(G0)  # calculate property of initial network
-        property_dict[property1.__name__][i, 0] = propertyval
+        trajectory[0] = propertyval
         for j in range(1, tmax):
             G0 = rw.step_rewire(G0, copy_graph=False)  # rewire
             propertyval = property1(G0)  # calculate property of the rewired network
-            property_dict[property1.__name__][i, j] = propertyval
+            trajectory[j] = propertyval
+        if streaming:
+            property_dict[property1.__name__].add(trajectory)
+        else:
+            property_dict[property1.__name__][i] = trajectory
 
     return property_dict
@@ -1,13 +1,20 @@
 from copy import deepcopy
 import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
-import netrw
-from netrw.rewire import KarrerRewirer, AlgebraicConnectivity, NetworkXEdgeSwap
+from . import properties
+from .properties import PropertyEvaluator
+from .streaming import StreamingStats
 
 
 def various_properties_overtime(
-    init_graph, rewire_method, property_functions, function_names, tmax, numit
+    init_graph,
+    rewire_method,
+    property_functions,
+    function_names=None,
+    tmax=100,
+    numit=10,
+    seed=None,
+    streaming=False,
 ):
     """
     Analyze the property values of a network as a function of rewire steps.
@@ -19,39 +26,61 @@ def various_properties_overtime(
         Initial graph upon which rewiring will occur.
     rewire_method : netrw rewire class object
         Algorithm for rewiring a network with step_rewire option
-    property_functions : list of functions with input being NetworkX graphs
-    function_names : list of strings describing the functions
-        Network description property that outputs a single value for a given network. Should work with any function that
+    property_functions : PropertyEvaluator, or list of functions with input being NetworkX graphs
+        Network description properties that output a single value for a given network. Should work with any function that
         summarizes a NetworkX graph object into a single value. For example, nx.average_clustering, nx.average_shortest_path_length, etc.
-    tmax : int
+        A PropertyEvaluator computes the intermediate quantities its properties share (degrees,
+        components, distances, ...) once per step, see netrw.analysis.properties.
+    function_names : list of strings describing the functions, optional
+        Names of the properties, the keys of the output. By default the names of the properties of a
+        PropertyEvaluator, or the ``__name__`` of every function.
+    tmax : int, default: 100
         Number of rewiring steps to perform for each iteration.
-    numit : int
+    numit : int, default: 10
         Number of rewiring iterations to perform on the initial graph. The given rewiring process will be performed numit
         times on the initial graph to look at the distribution of outcomes for this rewiring process on the initial graph.
+    seed : int, optional
+        Seed for the rewirer. Every iteration runs on its own child stream spawned from it.
+    streaming : bool, default: False
+        If True, only a StreamingStats summary of the iterations is kept for every property, so
+        memory is O(tmax) whatever numit is.
     Returns
     -------
     property_dict: dictionary
         Dictionary of output where the keys are the iteration number and the values are a list of the network property calculated
-        at each step of the rewiring process.
+        at each step of the rewiring process. With streaming=True, the values are StreamingStats.
     """
 
+    if isinstance(property_functions, PropertyEvaluator):
+        evaluate = property_functions
+        if function_names is None:
+            function_names = property_functions.names
+    else:
+        evaluate = lambda G: [func(G) for func in property_functions]
+        if function_names is None:
+            function_names = [func.__name__ for func in property_functions]
+
     all_properties = {}
 
-    rw = rewire_method()
+    rewirers = rewire_method(seed=seed).spawn(numit)
 
     for name in function_names:
 
-        all_properties[name] = np.zeros((numit, tmax))
+        if streaming:
+            all_properties[name] = StreamingStats(tmax)
+        else:
+            all_properties[name] = np.zeros((numit, tmax))
+
+    # values of the current iteration
+    trajectories = np.zeros((len(function_names), tmax))
 
     # loop over rewiring instances
-    for i in range(numit):
+    for i, rw in enumerate(rewirers):
 
         G0 = deepcopy(init_graph)
 
         # calculate properties of initial network
-        for func, name in zip(property_functions, function_names):
-
-            all_properties[name][i, 0] = func(G0)
+        trajectories[:, 0] = evaluate(G0)
 
         # loop over timesteps
         for j in range(1, tmax):
@@ -59,12 +88,16 @@ def various_properties_overtime(
             G0 = rw.step_rewire(G0, copy_graph=False)  # rewire
 
             # calculate properties of the rewired network
+            trajectories[:, j] = evaluate(G0)
 
-            for name, func in zip(function_names, property_functions):
+        for name, trajectory in zip(function_names, trajectories):
 
-                all_properties[name][i, j] = func(G0)
+            if streaming:
+                all_properties[name].add(trajectory)
+            else:
+                all_properties[name][i] = trajectory
 
-        return all_properties
+    return all_properties
 
 
 def calculate_statistics(all_properties):
@@ -72,7 +105,7 @@ def calculate_statistics(all_properties):
     Find the mean, standard deviation, mean-std, and mean+std of the data from rewirings
 
     Inputs:
-        all_properties: dict of 2D np.arrays of shape numit x tmax with keys that are property names
+        all_properties: dict of 2D np.arrays of shape numit x tmax, or of StreamingStats, with keys that are property names
 
     Outputs:
         all_means: dict of mean values of each property at each timestep (keys are property names, values are 1D np.arrays of length tmax)
@@ -90,8 +123,12 @@ def calculate_statistics(all_properties):
 
     for name, data in all_properties.items():
 
-        all_means[name] = np.mean(data, axis=0)
-        all_stds[name] = np.std(data, axis=0)
+        if isinstance(data, StreamingStats):
+            all_means[name] = data.mean
+            all_stds[name] = data.std()
+        else:
+            all_means[name] = np.mean(data, axis=0)
+            all_stds[name] = np.std(data, axis=0)
         all_lowers[name] = all_means[name] - all_stds[name]
         all_uppers[name] = all_means[name] + all_stds[name]
 
@@ -134,9 +171,12 @@ def average_shortest_path_length(G):
     # calculate the total number of shortest paths
     Npairs = np.sum([N * (N - 1) / 2 for N in Nv])
 
-    # sum up all shortest path lengths
-    total = np.sum(
-        [np.sum(list(v[1].values())) for v in nx.all_pairs_shortest_path_length(G)]
+    # sum up all shortest path lengths (every pair is reached from both ends)
+    total = (
+        np.sum(
+            [np.sum(list(v[1].values())) for v in nx.all_pairs_shortest_path_length(G)]
+        )
+        / 2
     )
 
     # calculate average
@@ -144,47 +184,51 @@ def average_shortest_path_length(G):
     return barl
 
 
-property_functions = [
-    lambda G: G.number_of_nodes(),
-    lambda G: G.number_of_edges(),
-    lambda G: average_shortest_path_length(G),
-    lambda G: nx.number_connected_components(G),
-    lambda G: nx.assortativity.degree_assortativity_coefficient(G),
-    lambda G: np.sum(np.array(list(dict(nx.degree(G)).values())) ** 2)
-    / G.number_of_nodes(),
-    lambda G: np.min(np.array(list(dict(nx.degree(G)).values()))),
-    lambda G: np.max(np.array(list(dict(nx.degree(G)).values()))),
-    lambda G: average_local_clustering(G),
-]
-
-function_names = [
-    "Number of nodes",
-    "Number of edges",
-    "Average shortest path length",
-    "Number of components",
-    "Degree correlation coefficient",
-    "Second moment of degree distribution",
-    "Minimum degree",
-    "Maximum degree",
-    "Average local clustering coefficient",
-]
-
-
-# test run
-init_graph = nx.fast_gnp_random_graph(100, 0.03)
-rewire_method = NetworkXEdgeSwap
-tmax = 100
-numit = 10
-all_properties = various_properties_overtime(
-    init_graph, rewire_method, property_functions, function_names, tmax, numit
+property_functions = PropertyEvaluator(
+    [
+        properties.number_of_nodes,
+        properties.number_of_edges,
+        properties.average_shortest_path_length,
+        properties.number_connected_components,
+        properties.assortativity,
+        properties.degree_second_moment,
+        properties.min_degree,
+        properties.max_degree,
+        properties.average_local_clustering,
+    ],
+    names=[
+        "Number of nodes",
+        "Number of edges",
+        "Average shortest path length",
+        "Number of components",
+        "Degree correlation coefficient",
+        "Second moment of degree distribution",
+        "Minimum degree",
+        "Maximum degree",
+        "Average local clustering coefficient",
+    ],
 )
 
+function_names = property_functions.names
+
+if __name__ == "__main__":
+    # test run
+    from netrw.rewire import NetworkXEdgeSwap
+    import matplotlib.pyplot as plt
 
-# test plot
-for name in function_names:
-    fi, ax = plt.subplots(1, figsize=(5, 2), dpi=200)
-    plt.plot(range(tmax), np.mean(all_properties[name], axis=0))
-    plt.title(name)
-    plt.xlabel("$t$")
-    plt.tight_layout()
-    plt.savefig("figures/" + name)
+    init_graph = nx.fast_gnp_random_graph(100, 0.03)
+    rewire_method = NetworkXEdgeSwap
+    tmax = 100
+    numit = 10
+    all_properties = various_properties_overtime(
+        init_graph, rewire_method, property_functions, function_names, tmax, numit
+    )
+
+    # test plot
+    for name in function_names:
+        fi, ax = plt.subplots(1, figsize=(5, 2), dpi=200)
+        plt.plot(range(tmax), np.mean(all_properties[name], axis=0))
+        plt.title(name)
+        plt.xlabel("$t$")
+        plt.tight_layout()
+        plt.savefig("figures/" + name)
@@ -0,0 +1,166 @@
+import heapq
+import numpy as np
+from ..rewire.edge_array import to_edge_array
+from ..rewire.rng import BlockRNG
+
+
+def _find(parent, x):
+    """Roots of the entries x of a flat union-find forest, with path halving."""
+    while True:
+        p = parent[x]
+        done = p == x
+        if done.all():
+            return x
+        grandparent = parent[p]
+        parent[x] = grandparent
+        x = np.where(done, x, grandparent)
+
+
+def _newman_ziff(edges, n, orders):
+    """
+    Size of the largest component after removing the first q nodes of every
+    removal order, for q = 0, ..., n; shape (k, n + 1).
+
+    The nodes are added back in reverse order (Newman and Ziff, 2001): an
+    edge appears once both its ends are back, and the components are merged
+    by a union-find forest. The k orders are run in lockstep, one edge of
+    each at a time.
+    """
+    k = len(orders)
+    m = len(edges)
+    rows = np.arange(k)[:, None]
+
+    # position of every node in the order in which nodes are added back
+    added = np.empty((k, n), dtype=np.int64)
+    added[rows, orders[:, ::-1]] = np.arange(1, n + 1)
+    appears = np.maximum(added[:, edges[:, 0]], added[:, edges[:, 1]])
+    by_time = np.argsort(appears, axis=1, kind="stable")
+    appears = np.take_along_axis(appears, by_time, axis=1)
+    offset = rows * n
+    tails = edges[by_time, 0] + offset
+    heads = edges[by_time, 1] + offset
+
+    parent = np.arange(k * n)
+    size = np.ones(k * n, dtype=np.int64)
+    largest = np.ones((k, m + 1), dtype=np.int64)
+    giant = largest[:, 0].copy()
+    for t in range(m):
+        a = _find(parent, tails[:, t])
+        b = _find(parent, heads[:, t])
+        merge = a != b
+        big = np.where(size[a] >= size[b], a, b)[merge]
+        small = np.where(size[a] >= size[b], b, a)[merge]
+        parent[small] = big
+        size[big] += size[small]
+        giant[merge] = np.maximum(giant[merge], size[big])
+        largest[:, t + 1] = giant
+
+    # after q nodes are back, the edges that appeared by then are in
+    sizes = np.zeros((k, n + 1), dtype=np.int64)
+    q = np.arange(1, n + 1)
+    for j in range(k):
+        sizes[j, 1:] = largest[j, np.searchsorted(appears[j], q, side="right")]
+    return sizes[:, ::-1]
+
+
+def _adaptive_order(neighbors, degrees, rng):
+    """Removal order that always takes a node of largest current degree."""
+    degrees = degrees.copy()
+    removed = np.zeros(len(degrees), dtype=bool)
+    ties = rng.uniform(len(degrees))
+    heap = [(-d, ties[u], u) for u, d in enumerate(degrees.tolist())]
+    heapq.heapify(heap)
+    order = []
+    while heap:
+        d, tie, u = heapq.heappop(heap)
+        if removed[u] or -d != degrees[u]:
+            continue
+        removed[u] = True
+        order.append(u)
+        for v in neighbors[u]:
+            if not removed[v]:
+                degrees[v] -= 1
+                heapq.heappush(heap, (-degrees[v], ties[v], v))
+    return order
+
+
+def percolation_curves(G, attack="random", k=1, seed=None):
+    """
+    Fraction of the nodes in the largest (weakly) connected component while
+    the nodes of G are removed one at a time.
+
+    The curves are computed by the Newman-Ziff algorithm, adding the nodes
+    back in reverse order of removal and merging components in a union-find
+    forest, which takes near-linear time per order instead of a connected
+    component search after every removal; the k orders are run together.
+
+    Parameters
+    ----------
+    G : networkx graph
+    attack : {"random", "degree", "adaptive"} or array of shape (k, n)
+        Order of removal: uniformly random, by decreasing degree in G, or
+        by decreasing degree in what is left of the graph, recomputed after
+        every removal. Ties are broken at random. An array gives the removal
+        orders as lists of nodes.
+    k : int, default: 1
+        Number of orders, ignored if ``attack`` is an array.
+    seed : None, int, Generator or BlockRNG
+
+    Returns
+    -------
+    curves : numpy array of shape (k, n + 1)
+        Column q is the fraction of the n nodes in the largest component
+        after q nodes were removed.
+    """
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    nodes, edges = to_edge_array(G)
+    n = len(nodes)
+    degrees = np.bincount(edges.ravel(), minlength=n)
+
+    if not isinstance(attack, str):
+        index = {u: i for i, u in enumerate(nodes)}
+        orders = np.array([[index[u] for u in order] for order in attack])
+        if orders.ndim != 2 or orders.shape[1] != n:
+            raise ValueError("Every removal order must list all nodes of G.")
+    elif attack == "random":
+        orders = np.array([rng.permutation(n) for _ in range(k)])
+    elif attack == "degree":
+        orders = np.array([np.lexsort((rng.uniform(n), -degrees)) for _ in range(k)])
+    elif attack == "adaptive":
+        neighbors = [[] for _ in range(n)]
+        for u, v in edges.tolist():
+            neighbors[u].append(v)
+            neighbors[v].append(u)
+        orders = np.array([_adaptive_order(neighbors, degrees, rng) for _ in range(k)])
+    else:
+        raise ValueError(
+            'attack must be "random", "degree", "adaptive" or an array of orders.'
+        )
+
+    if n == 0:
+        return np.zeros((len(orders), 1))
+    orders = orders.reshape(-1, n).astype(np.int64)
+    return _newman_ziff(edges, n, orders) / n
+
+
+def schneider_robustness(G, attack="adaptive", k=1, seed=None):
+    """
+    Robustness R of Schneider et al. (2011): the fraction of the nodes in
+    the largest component, averaged over the removal of 1, ..., n nodes.
+
+    R is at most 1/2 (and about 1/n for a star under attack). The attacks
+    and arguments are those of ``percolation_curves``.
+
+    Schneider, C. M., Moreira, A. A., Andrade, J. S., Havlin, S., &
+    Herrmann, H. J. (2011). Mitigation of malicious attacks on networks.
+    PNAS, 108(10), 3838-3841. https://doi.org/10.1073/pnas.1009440108
+
+    Returns
+    -------
+    R : numpy array of shape (k,)
+        The robustness for every removal order.
+    """
+    curves = percolation_curves(G, attack, k, seed)
+    if curves.shape[1] == 1:
+        return np.zeros(len(curves))
+    return curves[:, 1:].mean(axis=1)
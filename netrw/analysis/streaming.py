@@ -0,0 +1,147 @@
+import numpy as np
+
+
+class StreamingStats:
+    """
+    Summary statistics of an ensemble of trajectories, accumulated one
+    trajectory at a time in memory that does not grow with their number.
+
+    For every time step the mean and variance are updated with Welford's
+    algorithm, along with the minimum and maximum, and the quantiles are
+    estimated with a KLL sketch (Karnin, Lang and Liberty 2016): a stack of
+    buffers of sorted values where every value of level ``h`` stands for
+    ``2**h`` of the inputs, and a full buffer is halved by keeping every
+    other value and moving those up a level. All time steps share the same
+    buffers, so the sketch is a handful of ``(length, k)`` arrays, about
+    ``3 * k * length`` floats in total.
+
+    Accumulators filled by different workers merge with ``merge``; the
+    counts, means, variances and extremes are then those of the whole
+    ensemble, and the sketch is the sketch of the union, with the same
+    error bound.
+
+    Parameters
+    ----------
+    length : int
+        Number of time steps of a trajectory.
+    k : int, default: 128
+        Size of the largest sketch buffer. The rank error of the quantiles
+        is of order ``1 / k``.
+
+    Attributes
+    ----------
+    count : int
+        Number of trajectories.
+    mean, min, max : numpy arrays of shape (length,)
+    """
+
+    def __init__(self, length, k=128):
+        self.length = length
+        self.k = k
+        self.count = 0
+        self.mean = np.zeros(length)
+        self.min = np.full(length, np.inf)
+        self.max = np.full(length, -np.inf)
+        self._m2 = np.zeros(length)
+        self._levels = [np.empty((length, 0))]
+        self._compactions = 0
+
+    def add(self, values):
+        """
+        Add one trajectory of ``length`` values, or several as the rows of
+        a 2D array.
+        """
+        values = np.asarray(values, dtype=float).reshape(-1, self.length)
+        for row in values:
+            self.count += 1
+            delta = row - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (row - self.mean)
+        self.min = np.minimum(self.min, values.min(axis=0, initial=np.inf))
+        self.max = np.maximum(self.max, values.max(axis=0, initial=-np.inf))
+        self._levels[0] = np.concatenate([self._levels[0], values.T], axis=1)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Add the trajectories summarized by ``other`` to this accumulator."""
+        if other.length != self.length or other.k != self.k:
+            raise ValueError("Only accumulators of the same length and k merge.")
+        if other.count == 0:
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 = self._m2 + other._m2 + delta**2 * self.count * other.count / count
+        self.mean = self.mean + delta * other.count / count
+        self.count = count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+        for h, buffer in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(np.empty((self.length, 0)))
+            self._levels[h] = np.concatenate([self._levels[h], buffer], axis=1)
+        self._compress()
+        return self
+
+    def _capacity(self, h):
+        # buffers shrink by 2/3 per level below the top one
+        depth = len(self._levels) - 1 - h
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self._levels):
+            buffer = self._levels[h]
+            if buffer.shape[1] >= self._capacity(h):
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty((self.length, 0)))
+                buffer = np.sort(buffer, axis=1)
+                even = buffer.shape[1] - buffer.shape[1] % 2
+                # alternate between the odd and even ranks to avoid a bias
+                offset = self._compactions % 2
+                self._compactions += 1
+                self._levels[h + 1] = np.concatenate(
+                    [self._levels[h + 1], buffer[:, offset:even:2]], axis=1
+                )
+                self._levels[h] = buffer[:, even:]
+            h += 1
+
+    def var(self, ddof=0):
+        """Variance over the trajectories at every time step."""
+        if self.count <= ddof:
+            return np.full(self.length, np.nan)
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """Standard deviation over the trajectories at every time step."""
+        return np.sqrt(self.var(ddof))
+
+    def quantile(self, q):
+        """
+        Estimated ``q`` quantile at every time step; an array of shape
+        (length,), or (len(q), length) for a sequence of quantiles.
+        """
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape + (self.length,), np.nan)
+
+        values = np.concatenate(self._levels, axis=1)
+        weights = np.concatenate(
+            [np.full(buffer.shape[1], 2.0**h) for h, buffer in enumerate(self._levels)]
+        )
+        order = np.argsort(values, axis=1)
+        values = np.take_along_axis(values, order, axis=1)
+        ranks = np.cumsum(weights[order], axis=1)
+
+        # first value whose cumulated weight reaches q * count
+        index = np.stack(
+            [(ranks < p * self.count).sum(axis=1) for p in np.atleast_1d(q)]
+        )
+        index = np.minimum(index, values.shape[1] - 1)
+        result = np.take_along_axis(values, index.T, axis=1).T
+        return result.reshape(q.shape + (self.length,))
+
+    def median(self):
+        return self.quantile(0.5)
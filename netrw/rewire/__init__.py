@@ -1,5 +1,21 @@
+from .rng import BlockRNG
 from .base import BaseRewirer
+from .moves import Move
+from .cache import RewireCache
+from .edge_array import (
+    to_edge_array,
+    from_edge_array,
+    from_sparse,
+    to_sparse,
+    stack_edge_arrays,
+)
+from .edge_io import write_edge_file, read_edge_file, load_edge_list
 from .karrer import KarrerRewirer
+from .networkXEdgeSwap import NetworkXEdgeSwap
+from .directed_swap import DirectedEdgeSwap, directed_double_edge_swap
+from .out_of_core import out_of_core_edge_swap, out_of_core_global_rewire
+from .parallel_swap import parallel_double_edge_swap
+from .null_model import mixing_diagnostics, sample_null_models
 from .global_rewiring import GlobalRewiring
 from .local_edge_rewire import LocalEdgeRewiring
 from .assortative import DegreeAssortativeRewirer
@@ -10,5 +26,14 @@ from .robust_rewiring import RobustRewirer
 from .spatial_small_worlds import SpatialSmallWorld
 from .assortative_local_maximization import AssortativityLocalMaximum
 from .assortative_local_minimization import AssortativityLocalMinimum
+from .assortative_tempering import AssortativityParallelTempering
+from .assortative_search import best_first_assortative_swap
+from .annealing import SimulatedAnnealing
+from .objectives import (
+    Objective,
+    AssortativityObjective,
+    TriangleObjective,
+    FunctionObjective,
+)
 
 __all__ = []
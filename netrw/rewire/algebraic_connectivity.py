@@ -2,7 +2,6 @@ from .base import BaseRewirer
 import networkx as nx
 import numpy as np
 import copy
-from scipy import linalg as la
 import warnings
 
 
@@ -23,16 +22,65 @@ class AlgebraicConnectivity(BaseRewirer):
     """
 
     def full_rewire(
-        self, G, timesteps=-1, copy_graph=True, directed=True, verbose=False
+        self, G, timesteps=-1, copy_graph=True, directed=True, verbose=False, batch=1
     ):
         """
         Rewire network to maximize algebraic connectivity. In Sydney et al. paper,
         they find that rewiring 30% of the edges is sufficient.
         """
-        return self.step_rewire(G, timesteps, copy_graph, directed, verbose)
+        return self.step_rewire(G, timesteps, copy_graph, directed, verbose, batch)
+
+    def fiedler(self, G, nodes):
+        """Algebraic connectivity and Fiedler vector of G, in ``nodes`` order."""
+        from scipy import linalg as la
+
+        L = nx.laplacian_matrix(G, nodelist=nodes).toarray()
+        vals, vecs = la.eigh(L)
+        return vals[1], vecs[:, 1]
+
+    def select(self, G, nodes, v, k):
+        """
+        Up to k edges to remove, by increasing alpha, and k non-edges to add,
+        by decreasing alpha, such that no two edges to remove and no two
+        edges to add share a node and G stays connected.
+        """
+        n = len(nodes)
+        A = nx.to_numpy_array(G, nodelist=nodes, weight=None)
+        i, j = np.triu_indices(n, 1)
+        alpha = np.abs(v[i] - v[j])
+        is_edge = A[i, j] > 0
+        edge_order = np.flatnonzero(is_edge)
+        edge_order = edge_order[np.argsort(alpha[edge_order], kind="stable")]
+        non_edge_order = np.flatnonzero(~is_edge)
+        non_edge_order = non_edge_order[
+            np.argsort(-alpha[non_edge_order], kind="stable")
+        ]
+
+        added = []
+        used = set()
+        for e in non_edge_order.tolist():
+            if len(added) == k:
+                break
+            if i[e] not in used and j[e] not in used:
+                used.update((i[e], j[e]))
+                added.append((nodes[i[e]], nodes[j[e]]))
+
+        removed = []
+        used = set()
+        for e in edge_order.tolist():
+            if len(removed) == len(added):
+                break
+            if i[e] in used or j[e] in used:
+                continue
+            edge = (nodes[i[e]], nodes[j[e]])
+            # the Fiedler value stays positive only if G stays connected
+            if self.propose(G, removed + [edge], added).evaluate(nx.is_connected):
+                used.update((i[e], j[e]))
+                removed.append(edge)
+        return removed, added[: len(removed)]
 
     def step_rewire(
-        self, G, timesteps=1, copy_graph=False, directed=True, verbose=False
+        self, G, timesteps=1, copy_graph=False, directed=True, verbose=False, batch=1
     ):
         """
         Rewire ``timesteps`` edges to maximize algebraic connectivity.
@@ -43,6 +91,11 @@ class AlgebraicConnectivity(BaseRewirer):
             copy_graph (bool) - return a copy of the network
             directed (bool) - compute for directed network on undirected copy
             verbose (bool) - indicator to return edges changed at each timestep
+            batch (int) - largest number of edges rewired per Fiedler vector.
+                The batch grows back towards it while the algebraic
+                connectivity keeps increasing at a steady rate per edge, and
+                is halved when the rate falls; a batch of more than one edge
+                that decreases it is undone.
 
         Return:
             G (networkx)
@@ -65,6 +118,8 @@ class AlgebraicConnectivity(BaseRewirer):
             raise ValueError(
                 "Disconnected graph. This method is implemented for undirected, connected graphs."
             )
+        if batch < 1:
+            raise ValueError("batch must be a positive integer.")
 
         # Initialize storing dictionaries if necessary
         if verbose:
@@ -77,76 +132,58 @@ class AlgebraicConnectivity(BaseRewirer):
 
         # Get necessary parameters
         nodes = list(G.nodes())
-        edges = list(G.edges())
         n = len(nodes)
-        m = len(edges)
+        m = len(G.edges())
 
         # Check for complete graph
         if m == int(n * (n - 1) / 2):
             raise Warning("Algebraic connectivity is already maximized.")
             return G
 
-        # Rewire ``timesteps`` edges
-        for t in range(timesteps):
-            # Reset edge and node list
-            nodes = list(G.nodes())
-            edges = list(G.edges())
-
-            # Compute fielder vector
-            L = nx.laplacian_matrix(G).toarray()
-            vals, vecs = la.eig(L)
-            fiedler_idx = np.where(np.argsort(np.abs(vals)))[0][0]
-            v = vecs[:, fiedler_idx]
-
-            # Get all values of alpha
-            alpha = np.abs(np.subtract.outer(v, v))
-
-            # Get alpha_values for edges and non_edges
-            non_edges = []
-            edge_alpha = []
-            non_edge_alpha = []
-            for i in range(n):
-                for j in range(i + 1, n):
-                    if (nodes[i], nodes[j]) in edges:
-                        edge_alpha.append(alpha[i, j])
-                    else:
-                        non_edges.append((nodes[i], nodes[j]))
-                        non_edge_alpha.append(alpha[i, j])
-
-            # Get max alpha
-            alpha_max = np.argmax(non_edge_alpha)
-
-            # Get minimum alpha
-            accept_min = False
-            if accept_min is False:
-                alpha_min = np.argmin(edge_alpha)
-
-                # Create G without e_min
-                g_copy = copy.deepcopy(G)
-                g_copy.remove_edge(edges[alpha_min][0], edges[alpha_min][1])
-
-                # Get fiedler value
-                lap_spec = nx.laplacian_spectrum(g_copy)
-
-                # Check that fiedler value is positive on G\e_{min}
-                if sorted(np.abs(lap_spec))[1] > 0:
-                    accept_min = True
-                else:
-                    # Delete e_{min} from possible edges
-                    edge_alpha[alpha_min] = np.inf
-                    # Check for lack of convergence
-                    if np.array(edge_alpha).all() == np.inf:
-                        raise ValueError("Failed to converge.")
+        # Rewire ``timesteps`` edges, up to ``batch`` per Fiedler vector. The
+        # batch size doubles, up to ``limit``, after steps that keep at least
+        # half the gain per edge of the previous step, and is halved after
+        # the others. A batch that decreases the connectivity is undone and
+        # caps the size below it, until two steps in a row improve at the cap.
+        connectivity, v = self.fiedler(G, nodes)
+        size = limit = batch
+        streak = 0
+        gain = None
+        t = 0
+        while t < timesteps:
+            removed, added = self.select(G, nodes, v, min(size, timesteps - t))
+            if not removed:
+                raise ValueError("Failed to converge.")
+
+            move = self.propose(G, removed, added)
+            new_connectivity, new_v = move.evaluate(lambda H: self.fiedler(H, nodes))
+            if new_connectivity < connectivity and len(removed) > 1:
+                move.rollback()
+                limit = len(removed) - 1
+                size = max(1, len(removed) // 2)
+                streak = 0
+                continue
+
+            new_gain = (new_connectivity - connectivity) / len(removed)
+            if new_gain > 0 and (gain is None or new_gain >= gain / 2):
+                streak += 1
+                if size >= limit and streak >= 2:
+                    limit = min(batch, limit + 1)
+                    streak = 0
+                size = min(limit, 2 * size)
+            else:
+                size = max(1, size // 2)
+                streak = 0
+            gain = new_gain if new_gain > 0 else None
+            move.commit()
+            connectivity, v = new_connectivity, new_v
 
             # Update dictionaries
-            if verbose:
-                removed_edges[t] = [(edges[alpha_min][0], edges[alpha_min][1])]
-                added_edges[t] = [(non_edges[alpha_max][0], non_edges[alpha_max][1])]
-
-            # Remove edge
-            G.remove_edge(edges[alpha_min][0], edges[alpha_min][1])
-            # Add edge
-            G.add_edge(non_edges[alpha_max][0], non_edges[alpha_max][1])
+            for e_min, e_max in zip(removed, added):
+                if verbose:
+                    removed_edges[t] = [e_min]
+                    added_edges[t] = [e_max]
+                t += 1
 
         # Return new network
         if verbose:
@@ -0,0 +1,275 @@
+from .base import BaseRewirer
+import copy
+import math
+import numpy as np
+
+
+class SimulatedAnnealing(BaseRewirer):
+    """
+    Rewire a network to optimize an arbitrary objective by simulated
+    annealing.
+
+    At every step a move is proposed, the objective reports the change the
+    move would cause (``objective.delta(removed, added)``) and the move is
+    accepted with the Metropolis rule at the current temperature. Only
+    accepted moves are applied, to the objective (``objective.commit()``)
+    and to the graph. Objectives with an incremental ``delta``, such as
+    ``AssortativityObjective`` or ``TriangleObjective``, make a step cost
+    O(1) or O(d) instead of a full re-evaluation of the graph.
+
+    Moves:
+        "swap" - degree-preserving double-edge swap (a, b), (c, d) -> (a, d), (c, b)
+        "rewire" - move one end of a random edge to a random node
+        "weight" - exchange the weights of two random edges
+
+    Cooling schedules:
+        "exponential" - T0 * (T_min / T0) ** (t / timesteps)
+        "linear" - T0 + (T_min - T0) * t / timesteps
+        "logarithmic" - T0 / log(e + t)
+        or any function ``schedule(t, timesteps)`` returning a temperature.
+
+    Kirkpatrick, S., Gelatt, C. D., & Vecchi, M. P. (1983). Optimization
+    by simulated annealing. Science, 220(4598), 671-680.
+    """
+
+    capabilities = {"directed": True, "weighted": True}
+
+    def full_rewire(
+        self,
+        G,
+        objective,
+        maximize=True,
+        moves="swap",
+        timesteps=-1,
+        T0=None,
+        T_min=None,
+        schedule="exponential",
+        weight="weight",
+        copy_graph=True,
+        verbose=False,
+    ):
+        """
+        Anneal G for ``timesteps`` proposed moves.
+
+        Parameters:
+            G (networkx)
+            objective (Objective) - objective to optimize, see netrw.rewire.objectives
+            maximize (bool) - maximize (True) or minimize (False) the objective
+            moves (str or list) - move set, "swap", "rewire" and/or "weight"
+            timesteps (int) - number of proposed moves. if -1, timesteps is 10 times the number of edges
+            T0 (float) - initial temperature. By default the median absolute
+                objective change of 100 random moves
+            T_min (float) - final temperature, default T0 / 1000
+            schedule (str or function) - cooling schedule
+            weight (str) - edge attribute exchanged by "weight" moves
+            copy_graph (bool) - return a copy of the network
+            verbose (bool) - indicator to return edges changed at each timestep
+
+        Returns:
+            G (networkx)
+            removed_edges (dict) - edges deleted at each accepted timestep
+            added_edges (dict) - edges added at each accepted timestep
+        """
+        if copy_graph:
+            G = copy.deepcopy(G)
+
+        if isinstance(moves, str):
+            moves = [moves]
+        for move in moves:
+            if move not in ("swap", "rewire", "weight"):
+                raise ValueError("Unknown move %s" % move)
+
+        if timesteps == -1:
+            timesteps = 10 * G.number_of_edges()
+
+        edges = list(G.edges())
+        nodes = list(G.nodes())
+        if len(edges) < 2:
+            if verbose:
+                return G, {}, {}
+            return G
+
+        objective.bind(G)
+
+        if T0 is None:
+            T0 = self._initial_temperature(G, objective, edges, nodes, moves, weight)
+        if T_min is None:
+            T_min = T0 / 1000
+        if not callable(schedule):
+            schedule = self._schedule(schedule, T0, T_min)
+
+        removed_edges, added_edges = self._anneal(
+            G,
+            objective,
+            edges,
+            nodes,
+            maximize,
+            moves,
+            timesteps,
+            schedule,
+            weight,
+            verbose,
+        )
+
+        if verbose:
+            return G, removed_edges, added_edges
+        return G
+
+    def _anneal(
+        self,
+        G,
+        objective,
+        edges,
+        nodes,
+        maximize,
+        moves,
+        timesteps,
+        schedule,
+        weight,
+        verbose,
+    ):
+        sign = 1 if maximize else -1
+        removed_edges = {}
+        added_edges = {}
+
+        for t in range(timesteps):
+            T = schedule(t, timesteps)
+            proposal = self._propose(G, edges, nodes, self.rng.choice(moves), weight)
+            if proposal is None:
+                continue
+            removed, added, slots = proposal
+
+            gain = sign * objective.delta(removed, added)
+            if gain < 0 and (T <= 0 or self.rng.random() >= math.exp(gain / T)):
+                continue
+
+            objective.commit()
+            self._apply(G, edges, removed, added, slots, weight)
+            if verbose:
+                removed_edges[t] = removed
+                added_edges[t] = added
+
+        return removed_edges, added_edges
+
+    def step_rewire(
+        self,
+        G,
+        objective,
+        T=0,
+        maximize=True,
+        moves="swap",
+        weight="weight",
+        copy_graph=False,
+        verbose=False,
+    ):
+        """
+        Propose one move and accept it with the Metropolis rule at
+        temperature T (T = 0 accepts only improvements). The objective is
+        bound to G unless it is bound to it already, so it can be reused
+        across steps; use full_rewire for long runs, since every step lists
+        the edges of G.
+        """
+        if copy_graph:
+            G = copy.deepcopy(G)
+        if isinstance(moves, str):
+            moves = [moves]
+        if getattr(objective, "G", None) is not G:
+            objective.bind(G)
+
+        edges = list(G.edges())
+        nodes = list(G.nodes())
+        removed_edges, added_edges = {}, {}
+        if len(edges) >= 2:
+            removed_edges, added_edges = self._anneal(
+                G,
+                objective,
+                edges,
+                nodes,
+                maximize,
+                moves,
+                1,
+                lambda t, timesteps: T,
+                weight,
+                verbose,
+            )
+
+        if verbose:
+            return G, removed_edges, added_edges
+        return G
+
+    def _schedule(self, name, T0, T_min):
+        if name == "exponential":
+            return lambda t, timesteps: T0 * (T_min / T0) ** (t / max(timesteps, 1))
+        if name == "linear":
+            return lambda t, timesteps: T0 + (T_min - T0) * t / max(timesteps, 1)
+        if name == "logarithmic":
+            return lambda t, timesteps: T0 / math.log(math.e + t)
+        raise ValueError("Unknown cooling schedule %s" % name)
+
+    def _initial_temperature(
+        self, G, objective, edges, nodes, moves, weight, samples=100
+    ):
+        changes = []
+        for _ in range(samples):
+            proposal = self._propose(G, edges, nodes, self.rng.choice(moves), weight)
+            if proposal is not None:
+                changes.append(abs(objective.delta(proposal[0], proposal[1])))
+        changes = [c for c in changes if c > 0]
+        if len(changes) == 0:
+            return 1.0
+        return float(np.median(changes))
+
+    def _propose(self, G, edges, nodes, move, weight):
+        """
+        Draw a move; return (removed, added, slots) where slots are the
+        positions in ``edges`` that the added edges replace, or None if the
+        drawn move is invalid.
+        """
+        m = len(edges)
+        i = self.rng.integers(m)
+
+        if move == "rewire":
+            a, b = edges[i]
+            # directed edges keep their source
+            if not G.is_directed() and self.rng.random() < 0.5:
+                a, b = b, a
+            c = self.rng.choice(nodes)
+            if c == a or c == b or G.has_edge(a, c):
+                return None
+            return [(a, b)], [(a, c)], [i]
+
+        j = self.rng.integers(m)
+        if i == j:
+            return None
+        (a, b), (c, d) = edges[i], edges[j]
+
+        if move == "weight":
+            w1 = G.edges[a, b].get(weight, 1)
+            w2 = G.edges[c, d].get(weight, 1)
+            if w1 == w2:
+                return None
+            return [(a, b, w1), (c, d, w2)], [(a, b, w2), (c, d, w1)], [i, j]
+
+        if not G.is_directed() and self.rng.random() < 0.5:
+            c, d = d, c
+        if a == d or c == b or a == c or b == d:
+            return None
+        if G.has_edge(a, d) or G.has_edge(c, b):
+            return None
+        return [(a, b), (c, d)], [(a, d), (c, b)], [i, j]
+
+    def _apply(self, G, edges, removed, added, slots, weight):
+        if len(added[0]) > 2:
+            for u, v, w in added:
+                G.edges[u, v][weight] = w
+            return
+
+        data = [G.edges[e[0], e[1]] for e in removed]
+        for u, v in removed:
+            G.remove_edge(u, v)
+        for (u, v), slot in zip(added, slots):
+            G.add_edge(u, v)
+            edges[slot] = (u, v)
+        if len(removed) == 1:
+            # a rewired edge keeps its attributes
+            G.edges[added[0][0], added[0][1]].update(data[0])
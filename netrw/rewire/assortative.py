@@ -1,6 +1,5 @@
 from . import BaseRewirer
 import copy
-import random
 import networkx as nx
 import numpy as np
 
@@ -14,6 +13,8 @@ class DegreeAssortativeRewirer(BaseRewirer):
 
     """
 
+    capabilities = {"degree_preserving": True}
+
     def step_rewire(self, G, p=0.5, assortative=True, copy_graph=True, verbose=False):
 
         """
@@ -30,13 +31,19 @@ class DegreeAssortativeRewirer(BaseRewirer):
         if copy_graph:
             G = copy.deepcopy(G)
 
-        (i, j), (k, l) = random.sample(list(G.edges), 2)
+        edges = list(G.edges)
 
         # repeat until a valid rewiring is found
         valid = False
         while not valid:
 
-            if np.random.rand() <= p:
+            # draw a new pair of edges on every attempt, otherwise a pair
+            # without a valid swap would loop forever
+            (i, j), (k, l) = self.rng.sample(edges, 2)
+            if len({i, j, k, l}) < 4:
+                continue
+
+            if self.rng.random() <= p:
 
                 # degree-sorting for edge-swap with probability p
                 sor = sorted([i, j, k, l], key=lambda y: G.degree[y])
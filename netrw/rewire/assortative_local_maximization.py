@@ -1,8 +1,8 @@
 from .base import BaseRewirer
+from .assortative_search import _best_first_rewire
 import networkx as nx
 import numpy as np
 import copy
-from scipy import linalg as la
 import warnings
 
 
@@ -16,6 +16,8 @@ class AssortativityLocalMaximum(BaseRewirer):
     Physics, 9(6):173, 2007.
     """
 
+    capabilities = {"degree_preserving": True}
+
     def assortativity(self, G):
         if isinstance(G, nx.classes.digraph.DiGraph):
             return nx.degree_pearson_correlation_coefficient(G, x="out", y="in")
@@ -33,24 +35,26 @@ class AssortativityLocalMaximum(BaseRewirer):
         ):
             return None
 
-        G.remove_edge(e1[0], e1[1])
-        G.remove_edge(e2[0], e2[1])
-        G.add_edge(e1_new[0], e1_new[1])
-        G.add_edge(e2_new[0], e2_new[1])
-        cur_assort = self.assortativity(G)
+        # evaluate the swap on a view of G and only apply it if it helps
+        move = self.propose(G, [e1, e2], [e1_new, e2_new])
+        cur_assort = move.evaluate(self.assortativity)
 
         if cur_assort > max_assort:
+            move.commit()
             return cur_assort
 
-        # replace the swapped edges if assortativity does not increase
-        else:
-            G.remove_edge(e1_new[0], e1_new[1])
-            G.remove_edge(e2_new[0], e2_new[1])
-            G.add_edge(e1[0], e1[1])
-            G.add_edge(e2[0], e2[1])
-            return None
-
-    def full_rewire(self, G, timesteps=np.inf, copy_graph=True, verbose=False):
+        move.rollback()
+        return None
+
+    def full_rewire(
+        self,
+        G,
+        timesteps=np.inf,
+        copy_graph=True,
+        verbose=False,
+        search="best",
+        max_candidates=32,
+    ):
         """
         Run until a local maximum assortativity is reached. One timestep is one attempt to swap two edges.
 
@@ -60,6 +64,11 @@ class AssortativityLocalMaximum(BaseRewirer):
             copy_graph (bool) - return a copy of the network
             directed (bool) - compute for directed network on undirected copy
             verbose (bool) - indicator to return edges changed at each timestep
+            search (str) - "best" tries the swaps with the largest gain first (see
+                best_first_assortative_swap); "scan" tries all pairs of edges in order
+                and starts over after every swap, which takes O(m^2) attempts per swap
+            max_candidates (int) - random attempts per degree class of edges before
+                all its pairs of edges are tried in order, for search="best"
 
         Return:
             G (networkx)
@@ -75,6 +84,11 @@ class AssortativityLocalMaximum(BaseRewirer):
         if copy_graph:
             G = copy.deepcopy(G)
 
+        if search == "best":
+            return _best_first_rewire(self, G, True, timesteps, verbose, max_candidates)
+        if search != "scan":
+            raise ValueError('search must be "best" or "scan", not %r.' % (search,))
+
         possible_edges = []
         node_list = list(G.nodes)
         original_edges = list(G.edges)
@@ -0,0 +1,422 @@
+from .rng import BlockRNG
+from .edge_array import to_edge_array, edge_keys
+from itertools import chain
+import heapq
+import numpy as np
+
+
+class _DegreeClasses:
+    """
+    Edges grouped by the degrees of their ends, ``(x[u], y[v])``, with the
+    classes held in arrays so that the gains of swapping an edge with one
+    edge of every class are computed at once.
+
+    Undirected edges are stored with their lower-degree end first.
+    """
+
+    def __init__(self, x, y, directed):
+        self.x = x
+        self.y = y
+        self.directed = directed
+        self.ids = {}
+        self.members = []
+        self.position = {}
+        self.low = np.zeros(16, dtype=np.int64)
+        self.high = np.zeros(16, dtype=np.int64)
+        self.count = np.zeros(16, dtype=np.int64)
+
+    def key(self, u, v):
+        if self.directed:
+            return self.x[u], self.y[v]
+        return min(self.x[u], self.x[v]), max(self.x[u], self.x[v])
+
+    def add(self, e, u, v):
+        key = self.key(u, v)
+        c = self.ids.get(key)
+        if c is None:
+            c = self.ids[key] = len(self.members)
+            self.members.append([])
+            if c == len(self.count):
+                for name in ("low", "high", "count"):
+                    array = getattr(self, name)
+                    setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+            self.low[c], self.high[c] = key
+        self.position[e] = len(self.members[c])
+        self.members[c].append(e)
+        self.count[c] += 1
+        return c
+
+    def remove(self, e, c):
+        members = self.members[c]
+        i = self.position.pop(e)
+        last = members.pop()
+        if last != e:
+            members[i] = last
+            self.position[last] = i
+        self.count[c] -= 1
+
+    def gains(self, c, sign):
+        """
+        Changes of ``sign * S`` from swapping an edge (a, b) of class c with
+        an edge (u, v) of every class, for the swap to (a, u), (b, v) and for
+        the swap to (a, v), (u, b); directed edges only have the second.
+        """
+        k = len(self.members)
+        p, q = self.low[c], self.high[c]
+        s, t = self.low[:k], self.high[:k]
+        gain_av = sign * (p - s) * (t - q)
+        if self.directed:
+            gain_au = np.zeros(k, dtype=np.int64)
+        else:
+            gain_au = sign * (p - t) * (s - q)
+        # no gain from empty classes, or from the edge itself
+        for gain in (gain_au, gain_av):
+            gain[self.count[:k] == 0] = 0
+            if self.count[c] == 1:
+                gain[c] = 0
+        return gain_au, gain_av
+
+
+def best_first_assortative_swap(
+    edges,
+    n,
+    directed=False,
+    maximize=True,
+    timesteps=np.inf,
+    max_candidates=32,
+    seed=None,
+):
+    """
+    Degree-preserving swaps towards a local maximum (or minimum) of the
+    degree assortativity, taking the swaps with the largest gain first.
+
+    Degree-preserving swaps change the assortativity only through
+    ``S = sum over edges (u, v) of x[u] * y[v]`` (see
+    ``assortativity_terms``), and the change of S depends only on the
+    degrees at the ends of the two edges. The edges are therefore indexed by
+    their pair of end degrees, and a priority queue of these classes, keyed
+    by the largest gain of a swap of one of their edges, gives the next
+    swap to try: the edges whose end degrees are most mismatched (most
+    alike, when minimizing) go first. After a swap only the four classes it
+    touched are updated; gains that went stale are recomputed when popped,
+    and once the queue is empty all classes are checked again, until no
+    class has a valid swap that increases (decreases) S. The result is a
+    local optimum with respect to single swaps.
+
+    The exhaustive search of a class checks the pairs of its edges and the
+    edges of its partner classes, grouped by the end that gets the new
+    edge, so a run takes O(m^2) pair checks in the worst case, which
+    maximizing on graphs with hubs comes close to.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2)
+        Edges as node indices in ``range(n)``, without multi-edges.
+    n : int
+        Number of nodes.
+    directed : bool, default: False
+        Directed swaps exchange heads and preserve in- and out-degrees.
+    maximize : bool, default: True
+    timesteps : int, default: np.inf
+        Maximum number of swap attempts.
+    max_candidates : int, default: 32
+        Number of best partner classes of a class that a random pair of
+        edges is tried from, before all pairs of edges are tried in order of
+        gain. A swap is rejected if it would create a self-loop or a
+        multi-edge.
+    seed : None, int, Generator or BlockRNG
+
+    Returns
+    -------
+    edges : numpy array of shape (m, 2)
+        The rewired edges.
+    swaps : list of (time, removed, added)
+        The attempt at which every swap was made, and the index pairs of
+        the two edges it removed and added.
+    """
+    from .assortative_tempering import assortativity_terms
+
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    sign = 1 if maximize else -1
+    swaps = []
+    if len(edges) < 2:
+        return edges.copy(), swaps
+
+    x, y, _, _, _ = assortativity_terms(edges, n, directed)
+    classes = _DegreeClasses(x, y, directed)
+    keys = set(edge_keys(edges, n, directed).tolist())
+
+    def key(u, v):
+        return u * n + v if directed or u <= v else v * n + u
+
+    tails, heads, edge_class = [], [], []
+    for e, (u, v) in enumerate(edges.tolist()):
+        if not directed and x[u] > x[v]:
+            u, v = v, u
+        tails.append(u)
+        heads.append(v)
+        # self-loops are left where they are
+        edge_class.append(classes.add(e, u, v) if u != v else -1)
+    tail_array = np.array(tails, dtype=np.int64)
+    head_array = np.array(heads, dtype=np.int64)
+
+    # the largest gain of a class and the partner class it comes from; it
+    # only has to be recomputed when that partner runs out of edges, and is
+    # raised when another class gets its first edge (gains are symmetric)
+    best_gain, best_partner = {}, {}
+    queue, queued = [], {}
+
+    def push(c, g):
+        if g > 0 and queued.get(c) != g:
+            queued[c] = g
+            heapq.heappush(queue, (-g, c))
+
+    def best(c):
+        if c not in best_gain or classes.count[best_partner[c]] <= (
+            best_partner[c] == c
+        ):
+            gain = np.maximum(*classes.gains(c, sign))
+            d = int(gain.argmax())
+            best_gain[c], best_partner[c] = int(gain[d]), d
+        return best_gain[c]
+
+    def available(c):
+        # c is a new partner for every class, and for itself if it has two edges
+        gain = np.maximum(*classes.gains(c, sign))
+        for d in np.flatnonzero(gain > 0).tolist():
+            if d in best_gain and gain[d] > best_gain[d]:
+                best_gain[d], best_partner[d] = int(gain[d]), c
+                push(d, best_gain[d])
+        best_gain.pop(c, None)
+        push(c, best(c))
+
+    def candidates(c):
+        # (partner class, swap) pairs with a positive gain, best first
+        gain_au, gain_av = classes.gains(c, sign)
+        gain = np.concatenate([gain_au, gain_av])
+        order = np.flatnonzero(gain > 0)
+        order = order[np.argsort(-gain[order], kind="stable")]
+        k = len(gain_au)
+        return order % k, order >= k
+
+    def new_edges(e1, e2, option):
+        a, b = tails[e1], heads[e1]
+        u, v = tails[e2], heads[e2]
+        new = ((a, v), (u, b)) if option else ((a, u), (b, v))
+        (p, q), (r, s) = new
+        if e1 == e2 or p == q or r == s:
+            return None
+        k1, k2 = key(p, q), key(r, s)
+        if k1 == k2 or k1 in keys or k2 in keys:
+            return None
+        return new
+
+    def array_key(u, v):
+        if directed:
+            return u * n + v
+        return np.minimum(u, v) * n + np.maximum(u, v)
+
+    # the edge keys as a sorted array, for vectorized lookups, with a mask
+    # of the keys removed since it was sorted and a short sorted array of
+    # those added since; it is sorted again once these pile up
+    index = {"sorted": None}
+
+    def lookup(known, k):
+        i = np.minimum(np.searchsorted(known, k), max(len(known) - 1, 0))
+        return i, known[i] == k if len(known) else np.zeros(len(k), dtype=bool)
+
+    def present(k):
+        if index["sorted"] is None or len(index["added"]) > 1024:
+            index["sorted"] = np.sort(np.fromiter(keys, np.int64, len(keys)))
+            index["alive"] = np.ones(len(keys), dtype=bool)
+            index["added"] = np.zeros(0, dtype=np.int64)
+        i, found = lookup(index["sorted"], k)
+        found &= index["alive"][i]
+        found |= lookup(index["added"], k)[1]
+        return found
+
+    def update(removed, added):
+        if index["sorted"] is None:
+            return
+        removed = np.array(removed, dtype=np.int64)
+        i, found = lookup(index["sorted"], removed)
+        index["alive"][i[found]] = False
+        index["added"] = index["added"][~np.isin(index["added"], removed)]
+        index["added"] = np.sort(np.concatenate([index["added"], added]))
+
+    def partner_edges(partners, size, max_size):
+        # the edges of the partner classes and their swap options, in blocks
+        # that double in size from ``size`` up to ``max_size`` edges
+        ids, options = partners
+        counts = classes.count[ids]
+        ends = np.cumsum(counts)
+        start = 0
+        while len(ends) and start < ends[-1]:
+            stop = min(start + size, int(ends[-1]))
+            p0 = int(np.searchsorted(ends, start, side="right"))
+            p1 = int(np.searchsorted(ends, stop - 1, side="right")) + 1
+            offset = start - int(ends[p0] - counts[p0])
+            edges = np.fromiter(
+                chain.from_iterable(classes.members[d] for d in ids[p0:p1].tolist()),
+                np.int64,
+            )
+            block = slice(offset, offset + stop - start)
+            yield edges[block], np.repeat(options[p0:p1], counts[p0:p1])[block]
+            start = stop
+            size = max(1, min(2 * size, max_size))
+
+    def first_valid(c, partners, budget):
+        # all pairs of an edge (a, b) of c and an edge of a partner class, in
+        # the order of the gain of the partner; returns the number of pairs
+        # tried and the first valid pair. The new edge of b only depends on b,
+        # of which c has few when its edges meet at hubs, so it is checked
+        # for every distinct b first, and the pairs are only formed where it
+        # is valid
+        first = np.array(classes.members[c], dtype=np.int64)
+        tails_first = tail_array[first]
+        hubs, group = np.unique(head_array[first], return_inverse=True)
+        hubs = hubs[:, None]
+        budget = int(min(budget, 2**62))
+        size = max(1, 2**8 // len(hubs))
+        tried = 0
+        for second, options in partner_edges(partners, size, 2**16 // len(hubs)):
+            if tried >= budget:
+                break
+
+            # the swap makes (a, v), (u, b) if option else (a, u), (b, v)
+            u, v = tail_array[second], head_array[second]
+            r = np.where(options, u, hubs)
+            s = np.where(options, hubs, v)
+            valid_b = r != s
+            valid_b[valid_b] = ~present(array_key(r, s)[valid_b])
+
+            step = max(1, 2**16 // len(first))
+            columns = np.flatnonzero(valid_b.any(axis=0))
+            for j in range(0, len(columns), step):
+                j2, i = np.nonzero(valid_b[:, columns[j : j + step]][group].T)
+                j2 = columns[j : j + step][j2]
+                # pairs in order of the partner edge, then of the edge of c
+                order = tried + j2 * len(first) + i
+                keep = order < budget
+                i, j2, order = i[keep], j2[keep], order[keep]
+                e1, e2, option = first[i], second[j2], options[j2]
+                a = tails_first[i]
+                q = np.where(option, v[j2], u[j2])
+                k1 = array_key(a, q)
+                k2 = array_key(r[group[i], j2], s[group[i], j2])
+                valid = (e1 != e2) & (a != q) & (k1 != k2)
+                valid[valid] = ~present(k1[valid])
+                if valid.any():
+                    k = int(valid.argmax())
+                    return int(order[k]) + 1, (int(e1[k]), int(e2[k]), bool(option[k]))
+            tried += len(second) * len(first)
+        return min(tried, budget), None
+
+    time = 0
+    swapped = True
+    while swapped and time < timesteps:
+        # a class that got a new partner edge since it was tried may have a
+        # swap now, so all classes are checked again after every pass
+        swapped = False
+        for c in range(len(classes.members)):
+            if classes.count[c]:
+                push(c, best(c))
+
+        while queue and time < timesteps:
+            g, c = heapq.heappop(queue)
+            if queued.get(c) != -g:
+                continue
+            del queued[c]
+            if classes.count[c] == 0:
+                continue
+            g_now = best(c)
+            if queue and g_now < -queue[0][0]:
+                push(c, g_now)
+                continue
+            if g_now <= 0:
+                continue
+
+            # a random pair of edges from each of the best partner classes, then
+            # all pairs until a valid swap is found
+            partners = candidates(c)
+            done = None
+            best_partners = zip(
+                partners[0][:max_candidates].tolist(),
+                partners[1][:max_candidates].tolist(),
+            )
+            for d, option in best_partners:
+                if time >= timesteps:
+                    break
+                time += 1
+                e1 = rng.choice(classes.members[c])
+                e2 = rng.choice(classes.members[d])
+                new = new_edges(e1, e2, option)
+                if new is not None:
+                    done = e1, e2, d, new
+                    break
+            if done is None and time < timesteps:
+                tried, found = first_valid(c, partners, timesteps - time)
+                time += tried
+                if found is not None:
+                    e1, e2, option = found
+                    done = e1, e2, edge_class[e2], new_edges(e1, e2, option)
+            if done is None:
+                continue
+
+            e1, e2, d, new = done
+            removed = [(tails[e1], heads[e1]), (tails[e2], heads[e2])]
+            classes.remove(e1, c)
+            classes.remove(e2, d)
+            for e, (u, v) in zip((e1, e2), new):
+                if not directed and x[u] > x[v]:
+                    u, v = v, u
+                tails[e], heads[e] = u, v
+                tail_array[e], head_array[e] = u, v
+                keys.add(key(u, v))
+                edge_class[e] = classes.add(e, u, v)
+            keys.difference_update(key(u, v) for u, v in removed)
+            update([key(u, v) for u, v in removed], [key(u, v) for u, v in new])
+            swaps.append((time - 1, removed, list(new)))
+            swapped = True
+
+            # the classes that changed may have a swap now
+            added = {edge_class[e1], edge_class[e2]}
+            for t in {c, d} | added:
+                if t in added and classes.count[t] <= 2:
+                    available(t)
+                elif classes.count[t]:
+                    push(t, best(t))
+
+    return np.array([tails, heads], dtype=np.int64).T, swaps
+
+
+def _best_first_rewire(rewirer, G, maximize, timesteps, verbose, max_candidates):
+    """full_rewire of the local assortativity rewirers by best-first search."""
+    nodes, edges = to_edge_array(G)
+    new_edges, swaps = best_first_assortative_swap(
+        edges,
+        len(nodes),
+        G.is_directed(),
+        maximize,
+        timesteps,
+        max_candidates,
+        seed=rewirer.rng,
+    )
+
+    # untouched edges keep their data
+    old = set(map(tuple, edges.tolist()))
+    new = set(map(tuple, new_edges.tolist()))
+    if not G.is_directed():
+        old = {(min(u, v), max(u, v)) for u, v in old}
+        new = {(min(u, v), max(u, v)) for u, v in new}
+    G.remove_edges_from((nodes[u], nodes[v]) for u, v in old - new)
+    G.add_edges_from((nodes[u], nodes[v]) for u, v in new - old)
+
+    if verbose:
+        removed_edges, added_edges = {}, {}
+        for time, removed, added in swaps:
+            removed_edges[time] = [(nodes[u], nodes[v]) for u, v in removed]
+            added_edges[time] = [(nodes[u], nodes[v]) for u, v in added]
+        return G, removed_edges, added_edges
+    return G
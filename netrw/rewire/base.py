@@ -1,17 +1,217 @@
+from .rng import BlockRNG
+from .edge_array import to_edge_array, from_sparse, to_sparse
+from .moves import Move
+import functools
+import networkx as nx
+import numpy as np
+
+
+def _issparse(G):
+    # scipy is only imported once something other than a graph comes in
+    if isinstance(G, nx.Graph):
+        return False
+    import scipy.sparse as sp
+
+    return sp.issparse(G)
+
+
+class _Backend:
+    """A faster implementation of a rewiring method, and when it applies."""
+
+    def __init__(self, name, function, can_run):
+        self.name = name
+        self.function = function
+        self.can_run = can_run
+
+
+def _dispatch(method):
+    """
+    Route a call of a rewiring method to the first registered backend that
+    can run it, and to the reference implementation otherwise.
+
+    The ``backend`` keyword selects a backend by name; ``"networkx"`` runs
+    the reference implementation. Backends named ``"sparse"`` come from the
+    ``_sparse_<method name>`` methods of subclasses that rewire the index
+    arrays of a matrix directly; for the others a scipy.sparse adjacency
+    matrix goes through a networkx graph on the nodes ``range(n)``, with the
+    entries of the matrix as the ``weight`` attribute, and a matrix of the
+    same format and dtype is returned.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, G, *args, backend=None, **kwargs):
+        if backend != "networkx":
+            for b in self.backends(method.__name__):
+                if backend not in (None, b.name):
+                    continue
+                if b.can_run(self, G, *args, **kwargs):
+                    return b.function(self, G, *args, **kwargs)
+            if backend is not None:
+                raise ValueError(
+                    "The %r backend of %s.%s cannot run on this input."
+                    % (backend, self.__class__.__name__, method.__name__)
+                )
+
+        if not _issparse(G):
+            return method(self, G, *args, **kwargs)
+
+        _, _, directed = from_sparse(G)
+        H = nx.from_scipy_sparse_array(
+            G, create_using=nx.DiGraph if directed else nx.Graph
+        )
+        result = method(self, H, *args, **kwargs)
+        if isinstance(result, tuple):
+            return (_graph_to_sparse(result[0], G),) + result[1:]
+        return _graph_to_sparse(result, G)
+
+    return wrapper
+
+
+def _sparse_backend(name):
+    def can_run(self, G, *args, **kwargs):
+        return _issparse(G)
+
+    def function(self, A, *args, **kwargs):
+        return getattr(self, "_sparse_" + name)(A, *args, **kwargs)
+
+    return _Backend("sparse", function, can_run)
+
+
+def _graph_to_sparse(H, like):
+    """Adjacency matrix of a graph on the nodes ``range(n)``, shaped like ``like``."""
+    nodes, edges, weights = to_edge_array(H, weight="weight")
+    labels = np.array(nodes, dtype=np.int64)[edges] if len(edges) else edges
+    return to_sparse(like.shape[0], labels, weights, H.is_directed(), like=like)
+
+
 class BaseRewirer:
     """
     Base class for rewiring algorithms.
 
     All rewiring algorithms should inherit from this class.
 
+    Parameters
+    ----------
+    seed : None, int, SeedSequence, numpy Generator or BlockRNG
+        Seed for the rewirer's own random stream. All random draws of the
+        algorithm go through ``self.rng`` rather than the global ``random``
+        or ``np.random`` state, so a fixed seed reproduces a run exactly.
+    cache : RewireCache, optional
+        On-disk cache that calls to the rewirer (``rewirer(G, ...)``) are
+        looked up in before running ``full_rewire``.
+
+    ``full_rewire`` and ``step_rewire`` (and ``rewire``, where a subclass
+    defines it) accept a square scipy.sparse adjacency matrix as well as a
+    networkx graph, and then return a new matrix of the same format and
+    dtype, with the edge weights in its data array. A matrix is rewired as
+    an undirected graph if it is symmetric and as a directed graph
+    otherwise.
+
+    Calls of these methods are dispatched to backends, faster
+    implementations registered with ``register_backend`` (array, sparse or
+    parallel ones), when the input and parameters allow it, and run the
+    reference networkx implementation otherwise. The keyword
+    ``backend="<name>"`` requires a backend, and ``backend="networkx"`` the
+    reference implementation.
+
+    Attributes
+    ----------
+    capabilities : dict
+        What the algorithm supports: ``undirected`` and ``directed`` input
+        graphs, ``weighted`` graphs whose edge weights and attributes are
+        kept, ``multigraph`` input or output, and whether it is
+        ``degree_preserving``.
+        Subclasses set the entries that differ from their parent's.
+
     """
 
-    def __init__(self):
-        return
+    capabilities = {
+        "undirected": True,
+        "directed": False,
+        "weighted": False,
+        "multigraph": False,
+        "degree_preserving": False,
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        parent = super(cls, cls).capabilities
+        cls.capabilities = {**parent, **cls.__dict__.get("capabilities", {})}
+        cls._backends = {}
+        for name in ("full_rewire", "step_rewire", "rewire"):
+            if name in cls.__dict__:
+                setattr(cls, name, _dispatch(cls.__dict__[name]))
+            if "_sparse_" + name in cls.__dict__:
+                cls._backends[name] = [_sparse_backend(name)]
+
+    @classmethod
+    def register_backend(cls, method, name, can_run):
+        """
+        Decorator registering a function as the ``name`` backend of
+        ``method`` (``"full_rewire"``, ``"step_rewire"`` or ``"rewire"``).
+
+        Both the function and ``can_run`` are called like the method,
+        ``(rewirer, G, *args, **kwargs)``, and the function runs whenever
+        ``can_run`` returns True. Backends are tried in the order they were
+        registered, those of the class before those of its parents.
+        """
+
+        def register(function):
+            cls._backends.setdefault(method, []).append(
+                _Backend(name, function, can_run)
+            )
+            return function
+
+        return register
+
+    @classmethod
+    def backends(cls, method):
+        """Backends registered for ``method`` on the class and its parents."""
+        return [
+            b
+            for klass in cls.__mro__
+            for b in klass.__dict__.get("_backends", {}).get(method, [])
+        ]
+
+    def propose(self, G, removed=(), added=()):
+        """
+        Propose removing the edges ``removed`` from G and adding ``added``.
+
+        Returns a ``Move``: the candidate can be evaluated on ``move.view``
+        (``move.evaluate(function)``) without changing G, then applied with
+        ``move.commit()`` or dropped with ``move.rollback()``.
+        """
+        return Move(G, removed, added)
+
+    @classmethod
+    def supports(cls, G):
+        """Whether the capabilities of the algorithm cover the graph G."""
+        if _issparse(G):
+            _, _, directed = from_sparse(G)
+            multigraph = False
+        else:
+            directed = G.is_directed()
+            multigraph = G.is_multigraph()
+        if multigraph and not cls.capabilities["multigraph"]:
+            return False
+        return cls.capabilities["directed" if directed else "undirected"]
+
+    def __init__(self, seed=None, cache=None):
+        self.rng = BlockRNG(seed)
+        self.cache = cache
 
     def __call__(self, *args, **kwargs):
+        if self.cache is not None:
+            return self.cache.full_rewire(self, *args, **kwargs)
         return self.full_rewire(*args, **kwargs)
 
+    def spawn(self, n):
+        """
+        Return ``n`` rewirers of the same class with independent random
+        streams, e.g. one per member of an ensemble or per worker process.
+        """
+        return [self.__class__(seed=rng, cache=self.cache) for rng in self.rng.spawn(n)]
+
     # For all rewiring, whether the algorithm is iterative or not. "full" refers to rewiring until an end condition.
     def full_rewire(self, G, **kwargs):
         raise NotImplementedError
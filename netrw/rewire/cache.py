@@ -0,0 +1,266 @@
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import networkx as nx
+import numpy as np
+
+
+def _edge_set_arrays(G):
+    """
+    Canonical (labels, edges, weights) arrays of a graph, independent of the
+    order in which nodes and edges were inserted.
+    """
+    labels = sorted(G.nodes(), key=repr)
+    index = {u: i for i, u in enumerate(labels)}
+
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64)
+    edges = edges.reshape(-1, 2)
+    if not G.is_directed():
+        edges.sort(axis=1)
+
+    weights = None
+    if any("weight" in d for _, _, d in G.edges(data=True)):
+        weights = np.array(
+            [d.get("weight", 1.0) for _, _, d in G.edges(data=True)], dtype=np.float64
+        )
+
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    edges = edges[order]
+    if weights is not None:
+        weights = weights[order]
+    return labels, edges, weights
+
+
+def graph_hash(G):
+    """
+    Stable hash of a graph's type, node labels, node attributes, edge set and
+    edge weights.
+    """
+    labels, edges, weights = _edge_set_arrays(G)
+    h = hashlib.sha256()
+    h.update(type(G).__name__.encode())
+    h.update(repr(labels).encode())
+    # rewirers may read node attributes, e.g. positions
+    if any(G.nodes[u] for u in labels):
+        h.update(repr([sorted(G.nodes[u].items(), key=repr) for u in labels]).encode())
+    h.update(edges.tobytes())
+    if weights is not None:
+        h.update(weights.tobytes())
+    return h.hexdigest()
+
+
+class RewireCache:
+    """
+    Content-addressed on-disk cache of rewired graphs.
+
+    Results of ``full_rewire`` are keyed by a hash of the input graph's edge
+    set and node attributes, the rewirer class, the arguments and the
+    rewirer's seed, and stored as compact edge arrays (one ``.npz`` file per
+    result). Files are evicted least-recently-used first once the cache grows
+    over ``max_bytes``.
+
+    Caching is opt-in: pass a cache to a rewirer (``NetworkXEdgeSwap(seed=1,
+    cache=RewireCache())``) and call the rewirer, or call
+    ``cache.full_rewire(rewirer, G, ...)`` directly.
+
+    Only the first call of a freshly seeded rewirer can be looked up, since
+    later calls depend on how far its random stream has advanced. The state
+    the stream is left in is stored with the result and restored on a hit,
+    so the later calls of the rewirer are those of an uncached run. With
+    ``copy_graph=False``, a hit is applied to G in place. Rewirers without a
+    reproducible seed, verbose runs and scipy.sparse inputs bypass the
+    cache. Edge attributes other than ``weight`` are not stored.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Where to keep the cache. Defaults to ``~/.cache/netrw``.
+    max_bytes : int, default: 1 GiB
+        Size limit of the cache directory.
+    """
+
+    def __init__(self, directory=None, max_bytes=2**30):
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "netrw")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, rewirer, G, kwargs):
+        """
+        Cache key of ``rewirer.full_rewire(G, **kwargs)``, or None if the call
+        is not reproducible. ``kwargs`` holds every argument after G, as bound
+        by ``_bind``.
+        """
+        rng = rewirer.rng
+        if not rng.seeded or not isinstance(G, nx.Graph):
+            return None
+        fresh = np.random.default_rng(rng.seed_seq).bit_generator.state
+        if rng._pos < len(rng._block) or rng.generator.bit_generator.state != fresh:
+            return None
+
+        h = hashlib.sha256()
+        h.update(graph_hash(G).encode())
+        h.update(type(rewirer).__module__.encode())
+        h.update(type(rewirer).__qualname__.encode())
+        # copying the graph or not does not change the result
+        kwargs = {k: v for k, v in kwargs.items() if k != "copy_graph"}
+        h.update(repr(sorted(kwargs.items())).encode())
+        h.update(repr((rng.seed_seq.entropy, rng.seed_seq.spawn_key)).encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def load(self, key, G):
+        """
+        Return the cached result for ``key`` (rebuilt on G's nodes) and the
+        state of the rewirer's random stream after the run, or None.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                graph_type = str(data["graph_type"])
+                nodes = data["nodes"]
+                edges = data["edges"]
+                weights = data["weights"] if "weights" in data.files else None
+                rng_state = (json.loads(str(data["rng_state"])), data["rng_block"])
+            os.utime(path)
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+
+        labels = sorted(G.nodes(), key=repr)
+        H = getattr(nx, graph_type)()
+        H.add_nodes_from((labels[i], G.nodes[labels[i]]) for i in nodes)
+        if weights is None:
+            H.add_edges_from((labels[u], labels[v]) for u, v in edges)
+        else:
+            H.add_weighted_edges_from(
+                (labels[u], labels[v], w) for (u, v), w in zip(edges, weights.tolist())
+            )
+        return H, rng_state
+
+    def save(self, key, G, result, rng):
+        """
+        Store ``result``, a rewired version of ``G``, and the state of the
+        random stream ``rng`` after the run under ``key``.
+        """
+        labels = sorted(G.nodes(), key=repr)
+        index = {u: i for i, u in enumerate(labels)}
+        if not isinstance(result, nx.Graph) or any(u not in index for u in result):
+            return
+
+        n = len(labels)
+        dtype = np.int32 if n < 2**31 else np.int64
+        arrays = {
+            "graph_type": np.array(type(result).__name__),
+            "nodes": np.array([index[u] for u in result], dtype=dtype),
+            "edges": np.array(
+                [(index[u], index[v]) for u, v in result.edges()], dtype=dtype
+            ).reshape(-1, 2),
+        }
+        if any("weight" in d for _, _, d in result.edges(data=True)):
+            arrays["weights"] = np.array(
+                [d.get("weight", 1.0) for _, _, d in result.edges(data=True)]
+            )
+        arrays["rng_state"] = np.array(json.dumps(rng.generator.bit_generator.state))
+        arrays["rng_block"] = np.array(rng._block[rng._pos :], dtype=np.float64)
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def full_rewire(self, rewirer, G, *args, **kwargs):
+        """
+        Return ``rewirer.full_rewire(G, *args, **kwargs)``, from the cache if
+        possible.
+        """
+        bound, arguments = self._bind(rewirer, G, args, kwargs)
+        key = None
+        if not arguments.get("verbose", False):
+            key = self.key(rewirer, G, arguments)
+        if key is None:
+            return rewirer.full_rewire(*bound.args, **bound.kwargs)
+
+        cached = self.load(key, G)
+        if cached is not None:
+            result, (state, block) = cached
+            # leave the stream where the uncached run would have left it
+            rewirer.rng.generator.bit_generator.state = state
+            rewirer.rng._block = block.tolist()
+            rewirer.rng._pos = 0
+            if not arguments.get("copy_graph", True):
+                G.remove_edges_from([e for e in G.edges() if not result.has_edge(*e)])
+                G.add_edges_from(result.edges(data=True))
+                return G
+            return result
+
+        result = rewirer.full_rewire(*bound.args, **bound.kwargs)
+        self.save(key, G, result, rewirer.rng)
+        return result
+
+    @staticmethod
+    def _bind(rewirer, G, args, kwargs):
+        """
+        Bind a call to the signature of ``rewirer.full_rewire``. Return the
+        bound arguments and a dict of every argument after G, defaults
+        included, so that positional and keyword calls share a key.
+        """
+        signature = inspect.signature(rewirer.full_rewire)
+        bound = signature.bind(G, *args, **kwargs)
+        arguments = {}
+        for name, value in list(bound.arguments.items())[1:]:
+            kind = signature.parameters[name].kind
+            if kind is inspect.Parameter.VAR_KEYWORD:
+                arguments.update(value)
+            else:
+                arguments[name] = value
+        for name, parameter in signature.parameters.items():
+            if (
+                name not in bound.arguments
+                and parameter.default is not inspect.Parameter.empty
+            ):
+                arguments.setdefault(name, parameter.default)
+        return bound, arguments
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    @property
+    def size(self):
+        """Total size of the cached results in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least-recently-used results until the cache fits ``max_bytes``."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Delete every cached result."""
+        for _, _, name in self._entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,275 @@
+from .base import BaseRewirer
+from .rng import BlockRNG
+from .edge_array import to_edge_array, edge_keys, from_sparse, to_sparse
+import copy
+import warnings
+import numpy as np
+
+
+def _swap_targets(
+    tails, heads, keys, n, nswap, max_tries, rng, forbid_reciprocal, directed=True
+):
+    """
+    Run double-edge swaps on Python lists in place.
+
+    A swap picks two arcs (a, b), (c, d) and replaces them by (a, d), (c, b),
+    so only the heads move and every in- and out-degree is preserved. Edge
+    index pairs are drawn from the generator in blocks; membership of the
+    new arcs is checked against ``keys``, the set of ``u * n + v`` codes.
+    Undirected edges are encoded with ``u <= v`` and the second edge is
+    flipped at random, so that both swaps of a pair of edges are proposed.
+
+    Returns the list of (i, j) index pairs of the performed swaps.
+    """
+    m = len(tails)
+    swapped = []
+    tries = 0
+    while len(swapped) < nswap and tries < max_tries:
+        size = min(rng.block_size * 16, max_tries - tries)
+        pairs = rng.generator.integers(m, size=(size, 2)).tolist()
+        if directed:
+            flips = [0] * size
+        else:
+            flips = rng.generator.integers(2, size=size).tolist()
+        for (i, j), flip in zip(pairs, flips):
+            tries += 1
+            a, b = tails[i], heads[i]
+            c, d = tails[j], heads[j]
+            if flip:
+                c, d = d, c
+            # also rejects i == j, self-loops and no-op swaps
+            if a == c or b == d or a == d or c == b:
+                continue
+            if directed:
+                k1 = a * n + d
+                k2 = c * n + b
+                if k1 in keys or k2 in keys:
+                    continue
+                if forbid_reciprocal and (d * n + a in keys or b * n + c in keys):
+                    continue
+                keys.remove(a * n + b)
+                keys.remove(c * n + d)
+            else:
+                k1 = a * n + d if a < d else d * n + a
+                k2 = c * n + b if c < b else b * n + c
+                if k1 in keys or k2 in keys:
+                    continue
+                keys.remove(a * n + b if a < b else b * n + a)
+                keys.remove(c * n + d if c < d else d * n + c)
+
+            keys.add(k1)
+            keys.add(k2)
+            heads[i] = d
+            tails[j] = c
+            heads[j] = b
+            swapped.append((i, j))
+            if len(swapped) == nswap:
+                break
+    return swapped
+
+
+def _replay(tails, heads, swapped, nodes):
+    """Edges removed and added by every swap, replayed on the original heads."""
+    removed_edges = {}
+    added_edges = {}
+    current = list(heads)
+    for t, (i, j) in enumerate(swapped):
+        a, b, c, d = tails[i], current[i], tails[j], current[j]
+        removed_edges[t] = [(nodes[a], nodes[b]), (nodes[c], nodes[d])]
+        added_edges[t] = [(nodes[a], nodes[d]), (nodes[c], nodes[b])]
+        current[i], current[j] = d, b
+    return removed_edges, added_edges
+
+
+def directed_double_edge_swap(
+    edges, n, nswap, seed=None, forbid_reciprocal=False, max_tries=None
+):
+    """
+    Degree-preserving rewiring of a directed edge array.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2)
+        Arcs as (source, target) node indices in ``range(n)``, without
+        multi-arcs.
+    n : int
+        Number of nodes.
+    nswap : int
+        Number of swaps to perform.
+    seed : None, int, Generator or BlockRNG
+        Random stream used for the proposals.
+    forbid_reciprocal : bool, default: False
+        Reject swaps that would create an arc whose reverse is present.
+    max_tries : int, optional
+        Maximum number of proposals, default ``10 * nswap + 100``.
+
+    Returns
+    -------
+    edges : numpy array of shape (m, 2)
+        The rewired arcs; arc ``i`` keeps its source.
+    nswaps : int
+        The number of swaps performed.
+    """
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    edges = np.asarray(edges)
+    if max_tries is None:
+        max_tries = 10 * nswap + 100
+
+    tails = edges[:, 0].tolist()
+    heads = edges[:, 1].tolist()
+    keys = set(edge_keys(edges, n, directed=True).tolist())
+    swapped = _swap_targets(
+        tails, heads, keys, n, nswap, max_tries, rng, forbid_reciprocal
+    )
+
+    out = np.empty_like(edges)
+    out[:, 0] = edges[:, 0]
+    out[:, 1] = heads
+    return out, len(swapped)
+
+
+class DirectedEdgeSwap(BaseRewirer):
+    """
+    Degree-preserving rewiring of directed graphs by double-edge swaps.
+
+    Two arcs (a, b) and (c, d) are replaced by (a, d) and (c, b), which keeps
+    both the in- and the out-degree sequence. Swaps that would create
+    self-loops or multi-arcs are rejected, and so, optionally, are swaps that
+    would create reciprocal arcs. The graph is held as integer arrays and a
+    hashed set of arc codes while swapping, and proposals are drawn in bulk,
+    so large graphs rewire without touching networkx until the end. Arc
+    attributes travel with the source of the arc.
+
+    Maslov, Sergei, and Kim Sneppen. "Specificity and stability in topology
+    of protein networks." Science 296.5569 (2002): 910-913.
+    """
+
+    capabilities = {
+        "undirected": False,
+        "directed": True,
+        "weighted": True,
+        "degree_preserving": True,
+    }
+
+    def full_rewire(
+        self,
+        G,
+        timesteps=-1,
+        forbid_reciprocal=False,
+        max_tries=None,
+        copy_graph=True,
+        verbose=False,
+    ):
+        """
+        Run ``timesteps`` directed double-edge swaps.
+
+        Parameters:
+            G (networkx DiGraph)
+            timesteps (int) - number of swaps. if -1, timesteps is 10 times the number of edges
+            forbid_reciprocal (bool) - reject swaps that create reciprocal arcs
+            max_tries (int) - maximum number of proposals, default 10 * timesteps + 100
+            copy_graph (bool) - return a copy of the network
+            verbose (bool) - indicator to return edges changed at each timestep
+
+        Returns:
+            G (networkx DiGraph)
+            removed_edges (dict) - edges deleted at each timestep
+            added_edges (dict) - edges added at each timestep
+        """
+        if not G.is_directed() or G.is_multigraph():
+            raise ValueError("DirectedEdgeSwap is implemented for nx.DiGraphs.")
+
+        if copy_graph:
+            G = copy.deepcopy(G)
+
+        if timesteps == -1:
+            timesteps = 10 * G.number_of_edges()
+        if max_tries is None:
+            max_tries = 10 * timesteps + 100
+
+        nodes, edges = to_edge_array(G)
+        n = len(nodes)
+        if len(edges) < 2:
+            if verbose:
+                return G, {}, {}
+            return G
+
+        data = [d for _, _, d in G.edges(data=True)]
+        tails = edges[:, 0].tolist()
+        heads = edges[:, 1].tolist()
+        keys = set(edge_keys(edges, n, directed=True).tolist())
+
+        # kept to replay the swaps if verbose
+        original_heads = list(heads)
+
+        swapped = _swap_targets(
+            tails, heads, keys, n, timesteps, max_tries, self.rng, forbid_reciprocal
+        )
+        if len(swapped) < timesteps:
+            warnings.warn(
+                "Only %i of %i swaps were performed in %i tries."
+                % (len(swapped), timesteps, max_tries)
+            )
+
+        G.remove_edges_from(list(G.edges()))
+        G.add_edges_from((nodes[u], nodes[v], d) for u, v, d in zip(tails, heads, data))
+
+        if verbose:
+            return (G,) + _replay(tails, original_heads, swapped, nodes)
+        return G
+
+    def _sparse_full_rewire(
+        self,
+        A,
+        timesteps=-1,
+        forbid_reciprocal=False,
+        max_tries=None,
+        copy_graph=True,
+        verbose=False,
+    ):
+        """
+        full_rewire on the index arrays of a sparse adjacency matrix, which
+        is read as a directed graph; entries travel with the row of the arc.
+        """
+        edges, weights, _ = from_sparse(A, directed=True)
+        n = A.shape[0]
+        if timesteps == -1:
+            timesteps = 10 * len(edges)
+        if max_tries is None:
+            max_tries = 10 * timesteps + 100
+
+        tails = edges[:, 0].tolist()
+        heads = edges[:, 1].tolist()
+        original_heads = list(heads)
+        swapped = []
+        if len(edges) >= 2:
+            keys = set(edge_keys(edges, n, directed=True).tolist())
+            swapped = _swap_targets(
+                tails, heads, keys, n, timesteps, max_tries, self.rng, forbid_reciprocal
+            )
+            if len(swapped) < timesteps:
+                warnings.warn(
+                    "Only %i of %i swaps were performed in %i tries."
+                    % (len(swapped), timesteps, max_tries)
+                )
+
+        edges[:, 1] = heads
+        B = to_sparse(n, edges, weights, directed=True, like=A)
+        if verbose:
+            return (B,) + _replay(tails, original_heads, swapped, range(n))
+        return B
+
+    def step_rewire(self, G, forbid_reciprocal=False, copy_graph=True, verbose=False):
+        """
+        Run a single directed double-edge swap.
+        """
+        return self.full_rewire(
+            G,
+            timesteps=1,
+            forbid_reciprocal=forbid_reciprocal,
+            copy_graph=copy_graph,
+            verbose=verbose,
+        )
+
+    # step_rewire defers to full_rewire, which rewires matrices natively
+    _sparse_step_rewire = step_rewire
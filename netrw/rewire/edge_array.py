@@ -0,0 +1,231 @@
+import networkx as nx
+import numpy as np
+
+
+def to_edge_array(G, weight=None):
+    """
+    Convert a networkx graph to a list of nodes and an integer edge array.
+
+    Parameters
+    ----------
+    G : networkx graph
+    weight : str, optional
+        Edge attribute to return as a weight array (missing values are 1).
+
+    Returns
+    -------
+    nodes : list
+        The nodes of G; node ``nodes[i]`` has index ``i`` in the edge array.
+    edges : numpy array of shape (m, 2)
+        The edges of G as pairs of node indices, in ``G.edges()`` order.
+    weights : numpy array of shape (m,)
+        Only returned if ``weight`` is given.
+    """
+    nodes = list(G.nodes())
+    index = {u: i for i, u in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64)
+    edges = edges.reshape(-1, 2)
+
+    if weight is None:
+        return nodes, edges
+    weights = np.array(
+        [d.get(weight, 1.0) for _, _, d in G.edges(data=True)], dtype=np.float64
+    )
+    return nodes, edges, weights
+
+
+def from_edge_array(nodes, edges, create_using=None, weights=None, weight="weight"):
+    """
+    Build a networkx graph from a list of nodes and an integer edge array.
+
+    Parameters
+    ----------
+    nodes : list
+        Node labels, indexed by the entries of ``edges``.
+    edges : array of shape (m, 2)
+    create_using : networkx graph or graph class, optional
+        Graph type to build (default ``nx.Graph``). If a graph instance is
+        given, its nodes (with their attributes) and graph attributes are
+        copied, but not its edges.
+    weights : array of shape (m,), optional
+        Edge weights, stored under the ``weight`` attribute.
+
+    Returns
+    -------
+    networkx graph
+    """
+    if create_using is None:
+        H = nx.Graph()
+        H.add_nodes_from(nodes)
+    elif isinstance(create_using, nx.Graph):
+        H = create_using.__class__()
+        H.graph.update(create_using.graph)
+        H.add_nodes_from(create_using.nodes(data=True))
+        H.add_nodes_from(nodes)
+    else:
+        H = create_using()
+        H.add_nodes_from(nodes)
+
+    edges = np.asarray(edges).tolist()
+    if weights is None:
+        H.add_edges_from((nodes[u], nodes[v]) for u, v in edges)
+    else:
+        H.add_edges_from(
+            (nodes[u], nodes[v], {weight: w})
+            for (u, v), w in zip(edges, np.asarray(weights).tolist())
+        )
+    return H
+
+
+def edge_keys(edges, n, directed=False):
+    """
+    Encode every edge ``(u, v)`` as the integer ``u * n + v``, so edge sets
+    can be hashed and compared as plain integers. Undirected edges are
+    encoded with ``u <= v``.
+    """
+    edges = np.asarray(edges, dtype=np.int64)
+    u, v = edges[:, 0], edges[:, 1]
+    if not directed:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    return u * n + v
+
+
+def from_sparse(A, directed=None):
+    """
+    Convert a square scipy.sparse adjacency matrix to an edge array.
+
+    Parameters
+    ----------
+    A : scipy.sparse matrix or array of shape (n, n)
+    directed : bool, optional
+        Whether A is a directed graph. By default A is directed unless it
+        is symmetric.
+
+    Returns
+    -------
+    edges : numpy array of shape (m, 2)
+        The non-zero entries of A as (row, column) pairs, only those with
+        row <= column for undirected graphs.
+    weights : numpy array of shape (m,)
+        The entries of A for every edge.
+    directed : bool
+    """
+    import scipy.sparse as sp
+
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Adjacency matrices must be square.")
+    A = sp.coo_array(A)
+    A.sum_duplicates()
+    A.eliminate_zeros()
+    if directed is None:
+        directed = (A != A.T).nnz > 0
+
+    row, col, data = A.row, A.col, A.data
+    if not directed:
+        upper = row <= col
+        row, col, data = row[upper], col[upper], data[upper]
+    edges = np.stack([row, col], axis=1).astype(np.int64).reshape(-1, 2)
+    return edges, data, directed
+
+
+def to_sparse(n, edges, weights=None, directed=False, like=None):
+    """
+    Build an n x n scipy.sparse adjacency matrix from an edge array.
+
+    Parameters
+    ----------
+    n : int
+        Number of nodes.
+    edges : array of shape (m, 2)
+    weights : array of shape (m,), optional
+        Entries of the edges, 1 by default.
+    directed : bool, default: False
+        Undirected edges are stored in both triangles of the matrix.
+    like : scipy.sparse matrix or array, optional
+        Return the same class (format, and matrix or array) as ``like``, and
+        its dtype unless the weights need a wider one; by default a CSR array.
+    """
+    import scipy.sparse as sp
+
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    row, col = edges[:, 0], edges[:, 1]
+    if weights is None:
+        weights = np.ones(len(edges), dtype=like.dtype if like is not None else float)
+    weights = np.asarray(weights)
+
+    if not directed:
+        off = row != col
+        row, col, weights = (
+            np.concatenate([row, col[off]]),
+            np.concatenate([col, row[off]]),
+            np.concatenate([weights, weights[off]]),
+        )
+
+    A = sp.coo_array((weights, (row, col)), shape=(n, n))
+    if like is None:
+        return A.tocsr()
+    dtype = np.result_type(like.dtype, weights.dtype)
+    return like.__class__(A.asformat(like.format), dtype=dtype)
+
+
+def stack_edge_arrays(samples, n, directed=False, weights=None, format="csr"):
+    """
+    Stack the edge arrays of K graphs on the same n nodes into one sparse
+    matrix, so that metrics can be computed for all of them at once.
+
+    Parameters
+    ----------
+    samples : array of shape (k, m, 2), or list of k arrays of shape (m_s, 2)
+        Edges of every sample as node indices in ``range(n)``.
+    n : int
+        Number of nodes.
+    directed : bool, default: False
+        Undirected edges are stored in both triangles, as in ``to_sparse``.
+    weights : list of k arrays of shape (m_s,), optional
+        Entries of the edges, 1 by default.
+    format : {"csr", "coo"}, default: "csr"
+        ``"csr"`` returns the (k n, k n) block-diagonal CSR array whose
+        s-th diagonal block is the adjacency matrix of sample s. ``"coo"``
+        returns a 3-D COO array of shape (k, n, n) with the sample axis
+        first, which needs scipy >= 1.15.
+    """
+    import scipy.sparse as sp
+
+    if format not in ("csr", "coo"):
+        raise ValueError('format must be "csr" or "coo", not %r.' % (format,))
+    k = len(samples)
+    if weights is None:
+        weights = [None] * k
+
+    sample_ids, rows, cols, data = [], [], [], []
+    for s, (edges, w) in enumerate(zip(samples, weights)):
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        w = np.ones(len(edges)) if w is None else np.asarray(w)
+        row, col = edges[:, 0], edges[:, 1]
+        if not directed:
+            off = row != col
+            row, col, w = (
+                np.concatenate([row, col[off]]),
+                np.concatenate([col, row[off]]),
+                np.concatenate([w, w[off]]),
+            )
+        sample_ids.append(np.full(len(row), s, dtype=np.int64))
+        rows.append(row)
+        cols.append(col)
+        data.append(w)
+
+    if k:
+        sample, row, col = (np.concatenate(x) for x in (sample_ids, rows, cols))
+        data = np.concatenate(data)
+    else:
+        sample = row = col = np.empty(0, dtype=np.int64)
+        data = np.empty(0)
+
+    if format == "csr":
+        offset = sample * n
+        A = sp.coo_array((data, (offset + row, offset + col)), shape=(k * n, k * n))
+        return A.tocsr()
+    try:
+        return sp.coo_array((data, (sample, row, col)), shape=(k, n, n))
+    except (TypeError, ValueError) as error:
+        raise ValueError("3-D sparse arrays need scipy >= 1.15.") from error
@@ -0,0 +1,211 @@
+import os
+import numpy as np
+
+# header of a binary edge file: magic, format version, flags, bytes per node
+# index, number of nodes, number of edges, zero padding to HEADER_SIZE bytes
+_MAGIC = b"NETRWEDG"
+_VERSION = 1
+_HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("flags", "<u4"),
+        ("itemsize", "<u8"),
+        ("n", "<u8"),
+        ("m", "<u8"),
+    ]
+)
+HEADER_SIZE = 64
+_DIRECTED = 1
+_WEIGHTED = 2
+
+
+def write_edge_file(
+    path, edges, n=None, weights=None, directed=False, dtype=None, block_size=2**22
+):
+    """
+    Write an edge array to a binary edge file.
+
+    The file is a 64-byte header followed by the (m, 2) node indices as
+    little-endian int32 or int64, and, if there are weights, the m weights as
+    little-endian float32. It is read back, memory-mapped, by
+    ``read_edge_file``.
+
+    Parameters
+    ----------
+    path : str
+    edges : array of shape (m, 2), e.g. a numpy.memmap
+        Edges as node indices in ``range(n)``, written in blocks of
+        ``block_size``. An index out of range raises a ValueError, and no
+        file is left behind.
+    n : int, optional
+        Number of nodes, by default the largest node index + 1.
+    weights : array of shape (m,), optional
+    directed : bool, default: False
+    dtype : numpy dtype, optional
+        int32 or int64, by default int32 if the node indices fit.
+    block_size : int, default: 2**22
+    """
+    m = len(edges)
+    if n is None:
+        n = 0
+        for start in range(0, m, block_size):
+            block = np.asarray(edges[start : start + block_size])
+            n = max(n, int(block.max()) + 1 if len(block) else 0)
+    if dtype is None:
+        dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+    dtype = np.dtype(dtype).newbyteorder("<")
+    if dtype.kind != "i" or dtype.itemsize not in (4, 8):
+        raise ValueError("Edge files hold int32 or int64 node indices, not %s." % dtype)
+    if n > np.iinfo(dtype).max + 1:
+        raise ValueError("%i nodes do not fit in %s." % (n, dtype))
+    if weights is not None and len(weights) != m:
+        raise ValueError("There must be one weight per edge.")
+
+    header = np.zeros(1, dtype=_HEADER)
+    header["magic"] = _MAGIC
+    header["version"] = _VERSION
+    header["flags"] = (_DIRECTED if directed else 0) | (
+        _WEIGHTED if weights is not None else 0
+    )
+    header["itemsize"] = dtype.itemsize
+    header["n"] = n
+    header["m"] = m
+
+    with open(path, "wb") as f:
+        f.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+        for start in range(0, m, block_size):
+            block = np.asarray(edges[start : start + block_size]).reshape(-1, 2)
+            if block.size and (block.min() < 0 or block.max() >= n):
+                f.close()
+                os.remove(path)
+                raise ValueError("Node indices must be in range(%i)." % n)
+            f.write(block.astype(dtype).tobytes())
+        if weights is not None:
+            for start in range(0, m, block_size):
+                block = np.asarray(weights[start : start + block_size])
+                f.write(block.astype("<f4").tobytes())
+
+
+def read_edge_file(path, mode="r"):
+    """
+    Read a binary edge file written by ``write_edge_file``.
+
+    The edges and weights are memory-mapped, so no edge is read until it is
+    used. They can be passed on as they are to the functions that take edge
+    arrays (e.g. ``sample_null_models``, ``parallel_double_edge_swap``), or
+    turned into an adjacency matrix for the rewirers by ``to_sparse``.
+
+    Parameters
+    ----------
+    path : str
+    mode : {"r", "r+", "c"} or None, default: "r"
+        Mode of the memory map (read-only, read-write or copy-on-write), or
+        None to read the arrays into memory.
+
+    Returns
+    -------
+    edges : numpy array or memmap of shape (m, 2)
+    weights : numpy array or memmap of shape (m,), or None
+    n : int
+        Number of nodes.
+    directed : bool
+    """
+    header = np.fromfile(path, dtype=_HEADER, count=1)
+    if len(header) == 0 or header["magic"][0] != _MAGIC:
+        raise ValueError("%s is not a netrw edge file." % path)
+    if header["version"][0] != _VERSION:
+        raise ValueError(
+            "%s has version %i of the edge file format." % (path, header["version"][0])
+        )
+    flags = int(header["flags"][0])
+    n, m = int(header["n"][0]), int(header["m"][0])
+    dtype = np.dtype("<i%i" % header["itemsize"][0])
+    weighted = bool(flags & _WEIGHTED)
+
+    size = HEADER_SIZE + m * 2 * dtype.itemsize + (m * 4 if weighted else 0)
+    if os.path.getsize(path) != size:
+        raise ValueError("%s is truncated or has trailing data." % path)
+
+    def section(offset, dtype, shape):
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        if mode is None:
+            count = int(np.prod(shape))
+            data = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+            return data.reshape(shape)
+        return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+    edges = section(HEADER_SIZE, dtype, (m, 2))
+    weights = None
+    if weighted:
+        weights = section(HEADER_SIZE + m * 2 * dtype.itemsize, "<f4", (m,))
+    return edges, weights, n, bool(flags & _DIRECTED)
+
+
+def load_edge_list(
+    path, weighted=False, comments="#", delimiter=None, relabel=True, dtype=np.int64
+):
+    """
+    Parse a text edge list with one ``source target [weight]`` line per edge.
+
+    The whole file is parsed by ``numpy.loadtxt`` into arrays, without a
+    Python object per edge or node.
+
+    Parameters
+    ----------
+    path : str or file
+    weighted : bool, default: False
+        Read a weight from the third column.
+    comments : str, default: "#"
+    delimiter : str, optional
+        By default any whitespace.
+    relabel : bool, default: True
+        Map the node labels, which must be integers, to ``range(n)`` in
+        increasing order. Otherwise the labels are the node indices.
+    dtype : numpy dtype, default: int64
+        Integer type of the edge array.
+
+    Returns
+    -------
+    nodes : numpy array of shape (n,)
+        The label of every node index.
+    edges : numpy array of shape (m, 2)
+    weights : numpy array of shape (m,)
+        Only returned if ``weighted`` is set.
+    """
+    columns = (0, 1, 2) if weighted else (0, 1)
+    if weighted:
+        table = np.loadtxt(
+            path,
+            dtype=[("u", np.int64), ("v", np.int64), ("w", np.float64)],
+            comments=comments,
+            delimiter=delimiter,
+            usecols=columns,
+            ndmin=1,
+        )
+        labels = np.stack([table["u"], table["v"]], axis=1)
+        weights = table["w"]
+    else:
+        labels = np.loadtxt(
+            path,
+            dtype=np.int64,
+            comments=comments,
+            delimiter=delimiter,
+            usecols=columns,
+            ndmin=2,
+        )
+    labels = labels.reshape(-1, 2)
+
+    if relabel:
+        nodes, edges = np.unique(labels, return_inverse=True)
+        edges = edges.reshape(-1, 2).astype(dtype)
+    else:
+        if labels.size and labels.min() < 0:
+            raise ValueError("Node indices must not be negative.")
+        nodes = np.arange(labels.max() + 1 if labels.size else 0)
+        edges = labels.astype(dtype)
+
+    if weighted:
+        return nodes, edges, weights
+    return nodes, edges
@@ -1,7 +1,8 @@
 from .base import BaseRewirer
+from .edge_array import edge_keys, from_sparse, to_sparse
 import copy
-import random
 import warnings
+import numpy as np
 
 
 class GlobalRewiring(BaseRewirer):
@@ -57,21 +58,21 @@ class GlobalRewiring(BaseRewirer):
         # Rewire at each timestep
         for t in range(timesteps):
             # Decide whether to rewire
-            if p > random.random():
+            if p > self.rng.random():
                 # Attempt to rewire
                 valid = False
                 for _ in range(tries):
                     # Choose edge to rewire
-                    edge = random.choice(list(G.edges()))
+                    edge = self.rng.choice(list(G.edges()))
 
                     # Choose end to rewire
-                    end_to_rewire = random.choice([0, 1])
+                    end_to_rewire = self.rng.integers(2)
                     end_to_stay = abs(end_to_rewire - 1)
 
                     # Choose random node to rewire to
                     nodes_to_choose = list(G.nodes())
                     nodes_to_choose.pop(edge[end_to_stay])
-                    node = random.choice(nodes_to_choose)
+                    node = self.rng.choice(nodes_to_choose)
 
                     # Rewire edge
                     if end_to_rewire == 0:
@@ -105,3 +106,71 @@ class GlobalRewiring(BaseRewirer):
 
         else:
             return G
+
+    # full_rewire defers to step_rewire, which rewires matrices natively
+    _sparse_full_rewire = full_rewire
+
+    def _sparse_step_rewire(
+        self, A, p, timesteps=1, tries=100, copy_graph=True, verbose=False
+    ):
+        """
+        step_rewire on the index arrays of a sparse adjacency matrix; the
+        entry of a rewired edge moves with it.
+        """
+        edges, weights, directed = from_sparse(A)
+        n = A.shape[0]
+        m = len(edges)
+        removed_edges = {}
+        added_edges = {}
+
+        if m == 0:
+            warnings.warn(
+                "Resulting graph is empty as input was an empty graph and no edges can be rewired."
+            )
+        if timesteps == -1:
+            timesteps = m * 10
+
+        us = edges[:, 0].tolist()
+        vs = edges[:, 1].tolist()
+        keys = set(edge_keys(edges, n, directed).tolist())
+
+        def key(u, v):
+            if not directed and u > v:
+                u, v = v, u
+            return u * n + v
+
+        for t in range(timesteps if m > 0 else 0):
+            if p > self.rng.random():
+                valid = False
+                for _ in range(tries):
+                    i = self.rng.integers(m)
+                    end_to_rewire = self.rng.integers(2)
+                    stay = vs[i] if end_to_rewire == 0 else us[i]
+
+                    # random node other than the one that stays
+                    node = self.rng.integers(n - 1)
+                    if node >= stay:
+                        node += 1
+
+                    new_edge = (node, stay) if end_to_rewire == 0 else (stay, node)
+                    if key(*new_edge) not in keys:
+                        valid = True
+                        break
+
+                if valid is False:
+                    warnings.warn(
+                        "No rewiring occured as no new edge was found in tries allotted."
+                    )
+                else:
+                    if verbose:
+                        removed_edges[t] = [(us[i], vs[i])]
+                        added_edges[t] = [new_edge]
+                    keys.remove(key(us[i], vs[i]))
+                    keys.add(key(*new_edge))
+                    us[i], vs[i] = new_edge
+
+        edges = np.array([us, vs], dtype=np.int64).T
+        B = to_sparse(n, edges, weights, directed, like=A)
+        if verbose:
+            return B, removed_edges, added_edges
+        return B
@@ -1,4 +1,5 @@
 from . import BaseRewirer
+from .edge_array import from_sparse, to_edge_array, to_sparse
 import copy
 import networkx as nx
 import numpy as np
@@ -19,6 +20,8 @@ class KarrerRewirer(BaseRewirer):
 
     """
 
+    capabilities = {"multigraph": True}
+
     def rewire(self, G, alpha=1, copy_graph=True):
         if copy_graph:
             G = copy.deepcopy(G)
@@ -33,7 +36,7 @@ class KarrerRewirer(BaseRewirer):
 
         # Random selection of edges to preserve
         current_edges = list(G.edges())
-        random_numbers = np.random.uniform(0, 1, len(current_edges))
+        random_numbers = self.rng.uniform(len(current_edges))
         selected_edges = [
             current_edges[i]
             for i in range(len(current_edges))
@@ -42,7 +45,7 @@ class KarrerRewirer(BaseRewirer):
 
         # Creation of new edges
         n_new_edges = len(current_edges) - len(selected_edges)
-        np.random.shuffle(nodes_repeated)
+        self.rng.shuffle(nodes_repeated)
         left_nodes, right_nodes = (
             nodes_repeated[n_new_edges:],
             nodes_repeated[:n_new_edges],
@@ -54,3 +57,97 @@ class KarrerRewirer(BaseRewirer):
         new_graph.add_nodes_from(G.nodes())
         new_graph.add_edges_from(selected_edges + new_edges)
         return new_graph
+
+    def _sparse_rewire(self, A, alpha=1, copy_graph=True):
+        """
+        rewire on the index arrays of a sparse adjacency matrix. The result
+        is symmetric, with multi-edges summed; preserved edges keep their
+        entry and new edges count 1.
+        """
+        edges, weights, directed = from_sparse(A)
+        if alpha == 0:
+            return to_sparse(A.shape[0], edges, weights, directed, like=A)
+
+        degrees = np.bincount(edges.ravel(), minlength=A.shape[0])
+        nodes_repeated = np.repeat(np.arange(A.shape[0]), degrees)
+
+        keep = self.rng.uniform(len(edges)) < (1 - alpha)
+        n_new_edges = len(edges) - int(np.sum(keep))
+        nodes_repeated = self.rng.permutation(nodes_repeated)
+        new_edges = np.stack(
+            [
+                nodes_repeated[n_new_edges:][:n_new_edges],
+                nodes_repeated[:n_new_edges],
+            ],
+            axis=1,
+        )
+
+        edges = np.concatenate([edges[keep], new_edges])
+        weights = np.concatenate([weights[keep], np.ones(n_new_edges, weights.dtype)])
+        return to_sparse(A.shape[0], edges, weights, directed=False, like=A)
+
+    def sweep(self, G, alphas, deltas=False):
+        """
+        rewire for a grid of alphas at once, with coupled randomness: one
+        uniform per edge and one permutation of the stubs are drawn for the
+        whole grid. An edge is replaced for every alpha of at least one minus
+        its uniform, so a larger alpha replaces a superset of the edges, and
+        the new edges pair consecutive stubs of the permutation, so a larger
+        alpha also adds a superset of the new edges. Every single alpha
+        gives a graph with the distribution of ``rewire``.
+
+        Parameters
+        ----------
+        G : networkx graph
+        alphas : sequence of float
+            Must be non-decreasing if ``deltas`` is set.
+        deltas : bool, default: False
+            Return the edges for the first alpha and the changes between
+            consecutive alphas, instead of the edges for every alpha.
+
+        Returns
+        -------
+        nodes : list
+            Node labels of the node indices in the edge arrays.
+        samples : numpy array of shape (len(alphas), m, 2)
+            Edge arrays of the perturbed multigraphs (see
+            ``from_edge_array(..., create_using=nx.MultiGraph)``); row i is
+            edge i of ``G.edges()`` if it was kept. Only if ``deltas`` is
+            False.
+        edges, changes : numpy array of shape (m, 2), list of (removed, added)
+            Only if ``deltas`` is set: the edge array for ``alphas[0]``, and
+            for every following alpha the edge arrays removed from and added
+            to the previous one.
+        """
+        alphas = np.asarray(alphas, dtype=np.float64)
+        if deltas and np.any(np.diff(alphas) < 0):
+            raise ValueError("alphas must be non-decreasing to return deltas.")
+        nodes, edges = to_edge_array(G)
+        m = len(edges)
+
+        # an edge is replaced if its uniform is at least 1 - alpha, so the
+        # edges are replaced in the order of decreasing uniforms
+        random_numbers = self.rng.uniform(m)
+        order = np.argsort(-random_numbers, kind="stable")
+        replaced = m - np.searchsorted(np.sort(random_numbers), 1 - alphas)
+
+        degrees = np.bincount(edges.ravel(), minlength=len(nodes))
+        stubs = self.rng.permutation(np.repeat(np.arange(len(nodes)), degrees))
+        new_edges = stubs.reshape(-1, 2)
+
+        def perturbed(k):
+            sample = edges.copy()
+            sample[order[:k]] = new_edges[:k]
+            return sample
+
+        if not deltas:
+            samples = np.empty((len(alphas), m, 2), dtype=np.int64)
+            for i, k in enumerate(replaced):
+                samples[i] = perturbed(k)
+            return nodes, samples
+
+        changes = [
+            (edges[order[k0:k1]], new_edges[k0:k1])
+            for k0, k1 in zip(replaced[:-1], replaced[1:])
+        ]
+        return nodes, perturbed(replaced[0] if len(replaced) else 0), changes
@@ -1,8 +1,7 @@
 from . import BaseRewirer
 import copy
-import random
+import warnings
 import networkx as nx
-import numpy as np
 
 
 class LocalEdgeRewiring(BaseRewirer):
@@ -55,12 +54,12 @@ class LocalEdgeRewiring(BaseRewirer):
             G = nx.to_undirected(G)
 
         # randomly select a node, i
-        i = random.choice(list(G.nodes))
+        i = self.rng.choice(list(G.nodes))
 
         # randomly select one of its neighbors, j. if none available, return G
         if len(list(G[i])) == 0:
             return G
-        j = random.choice(list(G[i]))
+        j = self.rng.choice(list(G[i]))
         e_ij = (i, j)
 
         # store edge attributes of e_ij to add to e_ik if needed
@@ -82,7 +81,7 @@ class LocalEdgeRewiring(BaseRewirer):
         # edge to be the new e_ik added to the network.
         e_ik = e_ij
         if len(candidate_edges) > 0:
-            e_ik = candidate_edges[np.random.choice(len(candidate_edges))]
+            e_ik = self.rng.choice(candidate_edges)
 
         # remove old edge, add new edge (and give it the old edge's attribs)
         G.remove_edge(*e_ij)
@@ -0,0 +1,160 @@
+from collections.abc import Mapping
+import networkx as nx
+
+
+class _Neighbors(Mapping):
+    """Neighbors of one node with the edges of a move removed and added."""
+
+    def __init__(self, neighbors, removed, added):
+        self._neighbors = neighbors
+        self._removed = removed
+        self._added = added
+
+    def __getitem__(self, v):
+        if v in self._added:
+            return self._added[v]
+        if v in self._removed:
+            raise KeyError(v)
+        return self._neighbors[v]
+
+    def __iter__(self):
+        for v in self._neighbors:
+            if v not in self._removed and v not in self._added:
+                yield v
+        yield from self._added
+
+    def __len__(self):
+        kept = sum(
+            1
+            for v in self._neighbors
+            if v not in self._removed and v not in self._added
+        )
+        return kept + len(self._added)
+
+
+class _Adjacency(Mapping):
+    """
+    Adjacency of a graph after a move; the neighbor dicts of the nodes the
+    move does not touch are those of the graph itself.
+    """
+
+    def __init__(self, adjacency, removed, added):
+        self._adjacency = adjacency
+        self._removed = removed
+        self._added = added
+
+    def __getitem__(self, u):
+        neighbors = self._adjacency[u]
+        if u in self._removed or u in self._added:
+            return _Neighbors(
+                neighbors, self._removed.get(u, ()), self._added.get(u, {})
+            )
+        return neighbors
+
+    def __iter__(self):
+        return iter(self._adjacency)
+
+    def __len__(self):
+        return len(self._adjacency)
+
+
+class Move:
+    """
+    A proposed change of a graph: edges to remove and edges to add, applied
+    to the graph only on ``commit``.
+
+    Until then the graph is untouched, and ``view`` is a read-only networkx
+    graph of the same class that shows the graph as the move would leave it,
+    sharing the node and edge data of the graph; any networkx function can
+    be evaluated on it (``evaluate``). A rejected move is simply dropped, or
+    marked with ``rollback``. A move is only valid as long as the graph is
+    not changed by other means.
+
+    Parameters
+    ----------
+    G : nx.Graph or nx.DiGraph
+    removed : list of (u, v) edges of G
+    added : list of (u, v) or (u, v, data) edges between nodes of G
+        An edge that is both removed and added is replaced, with the data
+        given in ``added``.
+
+    Attributes
+    ----------
+    status : {"proposed", "committed", "rolled back"}
+    """
+
+    def __init__(self, G, removed=(), added=()):
+        if G.is_multigraph():
+            raise ValueError("Moves are implemented for nx.Graphs and nx.DiGraphs.")
+        self.graph = G
+        self.removed = [tuple(e[:2]) for e in removed]
+        self.added = [(e[0], e[1], dict(e[2]) if len(e) > 2 else {}) for e in added]
+        for u, v in self.removed:
+            if not G.has_edge(u, v):
+                raise ValueError("The edge %r is not in the graph." % ((u, v),))
+        for u, v, _ in self.added:
+            if u not in G or v not in G:
+                raise ValueError(
+                    "The edge %r joins nodes not in the graph." % ((u, v),)
+                )
+        self.status = "proposed"
+        self._view = None
+
+    @property
+    def view(self):
+        """Read-only graph as the move would leave it."""
+        if self._view is None:
+            self._view = self._make_view()
+        return self._view
+
+    def _make_view(self):
+        G = self.graph
+        directed = G.is_directed()
+        removed_out, removed_in, added_out, added_in = {}, {}, {}, {}
+        for u, v in self.removed:
+            removed_out.setdefault(u, set()).add(v)
+            removed_in.setdefault(v, set()).add(u)
+        removed = set(self.removed)
+        if not directed:
+            removed.update((v, u) for u, v in self.removed)
+        for u, v, data in self.added:
+            # an added edge that stays in the graph keeps its data
+            if G.has_edge(u, v) and (u, v) not in removed:
+                data = {**G.edges[u, v], **data}
+            added_out.setdefault(u, {})[v] = data
+            added_in.setdefault(v, {})[u] = data
+
+        H = G.__class__()
+        H.graph = G.graph
+        H._node = G._node
+        if directed:
+            H._succ = H._adj = _Adjacency(G._succ, removed_out, added_out)
+            H._pred = _Adjacency(G._pred, removed_in, added_in)
+        else:
+            for v, us in removed_in.items():
+                removed_out.setdefault(v, set()).update(us)
+            for v, us in added_in.items():
+                added_out.setdefault(v, {}).update(us)
+            H._adj = _Adjacency(G._adj, removed_out, added_out)
+        return nx.freeze(H)
+
+    def evaluate(self, function):
+        """Return ``function(view)``, e.g. a network property after the move."""
+        return function(self.view)
+
+    def commit(self):
+        """Apply the move to the graph, and return the graph."""
+        if self.status != "proposed":
+            raise ValueError("The move was already %s." % self.status)
+        self.graph.remove_edges_from(self.removed)
+        self.graph.add_edges_from(self.added)
+        self.status = "committed"
+        self._view = None
+        return self.graph
+
+    def rollback(self):
+        """Drop the move; the graph was never changed."""
+        if self.status != "proposed":
+            raise ValueError("The move was already %s." % self.status)
+        self.status = "rolled back"
+        self._view = None
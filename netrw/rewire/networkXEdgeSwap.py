@@ -1,8 +1,11 @@
 from . import BaseRewirer
+from .directed_swap import _swap_targets
+from .edge_array import to_edge_array, edge_keys, from_sparse, to_sparse
+from .parallel_swap import parallel_double_edge_swap
 import copy
-import itertools as it
-import random
+import warnings
 import networkx as nx
+import numpy as np
 
 
 class NetworkXEdgeSwap(BaseRewirer):
@@ -16,15 +19,30 @@ class NetworkXEdgeSwap(BaseRewirer):
     Networks.” Physical Review E 77
     (4). https://doi.org/10.1103/PhysRevE.77.046119.
 
+    Simple graphs and sparse adjacency matrices are swapped on their edge
+    arrays (the ``"array"`` and ``"sparse"`` backends) rather than by
+    ``nx.double_edge_swap``, which runs for multigraphs or with
+    ``backend="networkx"``; edge attributes and matrix entries stay with
+    the edge they were swapped onto.
+
+    With ``n_jobs``, swaps are proposed by that many worker processes (see
+    ``parallel_double_edge_swap``, the ``"parallel"`` backend); the chain is
+    the same, but the random stream differs from the serial one.
     """
 
-    def full_rewire(self, G, timesteps=1000, copy_graph=True):
+    capabilities = {"degree_preserving": True}
+
+    def full_rewire(self, G, timesteps=1000, copy_graph=True, n_jobs=None):
 
         if copy_graph:
             G = copy.deepcopy(G)
 
-        nx.double_edge_swap(G, nswap=timesteps)
-
+        nx.double_edge_swap(
+            G,
+            nswap=timesteps,
+            max_tries=10 * timesteps + 100,
+            seed=self.rng.python_random(),
+        )
         return G
 
     def step_rewire(self, G, copy_graph=True):
@@ -32,6 +50,72 @@ class NetworkXEdgeSwap(BaseRewirer):
         if copy_graph:
             G = copy.deepcopy(G)
 
-        nx.double_edge_swap(G, nswap=1)
+        nx.double_edge_swap(G, nswap=1, seed=self.rng.python_random())
 
         return G
+
+    def _sparse_full_rewire(self, A, timesteps=1000, copy_graph=True, n_jobs=None):
+        edges, weights, directed = from_sparse(A)
+        if directed:
+            raise ValueError(
+                "NetworkXEdgeSwap is implemented for undirected graphs (symmetric "
+                "matrices); use DirectedEdgeSwap for directed graphs."
+            )
+        n = A.shape[0]
+        edges = self._swap(edges, n, timesteps, n_jobs)
+        return to_sparse(n, edges, weights, like=A)
+
+    def _sparse_step_rewire(self, A, copy_graph=True):
+        return self._sparse_full_rewire(A, timesteps=1)
+
+    def _swap(self, edges, n, timesteps, n_jobs=None):
+        """Swap an undirected edge array, serially or with n_jobs workers."""
+        max_tries = 10 * timesteps + 100
+        if len(edges) < 2:
+            return edges
+        if n_jobs is not None:
+            edges, nswaps = parallel_double_edge_swap(
+                edges, n, timesteps, n_jobs=n_jobs, seed=self.rng, max_tries=max_tries
+            )
+        else:
+            tails = edges[:, 0].tolist()
+            heads = edges[:, 1].tolist()
+            keys = set(edge_keys(edges, n).tolist())
+            nswaps = len(
+                _swap_targets(
+                    tails, heads, keys, n, timesteps, max_tries, self.rng, False, False
+                )
+            )
+            edges = np.array([tails, heads], dtype=np.int64).T
+        if nswaps < timesteps:
+            warnings.warn(
+                "Only %i of %i swaps were performed in %i tries."
+                % (nswaps, timesteps, max_tries)
+            )
+        return edges
+
+
+def _simple_graph(G):
+    return isinstance(G, nx.Graph) and not (G.is_directed() or G.is_multigraph())
+
+
+def _can_swap_parallel(self, G, timesteps=1000, copy_graph=True, n_jobs=None):
+    return n_jobs is not None and _simple_graph(G)
+
+
+def _can_swap_array(self, G, timesteps=1000, copy_graph=True, n_jobs=None):
+    return n_jobs is None and _simple_graph(G)
+
+
+@NetworkXEdgeSwap.register_backend("full_rewire", "parallel", _can_swap_parallel)
+@NetworkXEdgeSwap.register_backend("full_rewire", "array", _can_swap_array)
+def _swap_graph(self, G, timesteps=1000, copy_graph=True, n_jobs=None):
+    """full_rewire on the edge array of a simple graph."""
+    if copy_graph:
+        G = copy.deepcopy(G)
+    nodes, edges = to_edge_array(G)
+    data = [d for _, _, d in G.edges(data=True)]
+    edges = self._swap(edges, len(nodes), timesteps, n_jobs)
+    G.remove_edges_from(list(G.edges()))
+    G.add_edges_from((nodes[u], nodes[v], d) for (u, v), d in zip(edges.tolist(), data))
+    return G
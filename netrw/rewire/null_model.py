@@ -0,0 +1,267 @@
+from .rng import BlockRNG
+from .directed_swap import _swap_targets
+from .edge_array import edge_keys, stack_edge_arrays
+import warnings
+import numpy as np
+
+
+def _equilibrium_overlap(edges, n, directed):
+    """
+    Expected fraction of the edges of ``edges`` present in a random graph
+    with the same degrees, with edge probabilities ``k_u k_v / 2m`` (or
+    ``k_out_u k_in_v / m`` for directed graphs), capped at 1.
+    """
+    m = len(edges)
+    u, v = edges[:, 0], edges[:, 1]
+    if directed:
+        k_out = np.bincount(u, minlength=n)
+        k_in = np.bincount(v, minlength=n)
+        p = k_out[u] * k_in[v] / m
+    else:
+        k = np.bincount(edges.ravel(), minlength=n)
+        p = k[u] * k[v] / (2 * m)
+    return float(np.mean(np.minimum(p, 1)))
+
+
+class _Chain:
+    """Degree-preserving swap chain on Python lists of edge ends."""
+
+    def __init__(self, edges, n, directed, rng):
+        self.n = n
+        self.directed = directed
+        self.rng = rng
+        self.tails = edges[:, 0].tolist()
+        self.heads = edges[:, 1].tolist()
+        self.keys = set(edge_keys(edges, n, directed).tolist())
+
+    def run(self, nswap, max_tries):
+        swapped = _swap_targets(
+            self.tails,
+            self.heads,
+            self.keys,
+            self.n,
+            nswap,
+            max_tries,
+            self.rng,
+            False,
+            self.directed,
+        )
+        return len(swapped)
+
+    def edges(self):
+        return np.array([self.tails, self.heads], dtype=np.int64).T
+
+    def codes(self):
+        return np.fromiter(self.keys, dtype=np.int64, count=len(self.keys))
+
+
+def mixing_diagnostics(
+    edges,
+    n,
+    directed=False,
+    tol=0.05,
+    check_every=None,
+    max_swaps=None,
+    seed=None,
+):
+    """
+    Estimate how many double-edge swaps a graph needs to forget its edges.
+
+    A swap chain is run from ``edges``, and every ``check_every`` swaps the
+    fraction of the original edges still present is recorded. Under the
+    null model this overlap decays to the fraction expected by chance,
+    ``h_eq`` (estimated from the degrees, see below), so the Hamming
+    autocorrelation with the start,
+
+        rho(t) = (overlap(t) - h_eq) / (1 - h_eq),
+
+    decays from 1 to 0. The number of swaps returned is the first checkpoint
+    at which rho is below ``tol``, or at which the mean overlap over the
+    last 20 checkpoints is no lower than over the 20 before, up to its
+    noise: samples that many swaps apart are approximately independent.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2)
+        Edges as node indices in ``range(n)``, without multi-edges.
+    n : int
+        Number of nodes.
+    directed : bool, default: False
+    tol : float, default: 0.05
+        Autocorrelation below which the chain counts as mixed.
+    check_every : int, optional
+        Swaps between checkpoints, by default m / 20.
+    max_swaps : int, optional
+        Give up after this many swaps, by default 50 m.
+    seed : None, int, Generator or BlockRNG
+
+    Returns
+    -------
+    nswap : int
+        Estimated number of swaps between independent samples.
+    diagnostics : dict
+        ``swaps``, ``overlap`` and ``autocorrelation`` at every checkpoint,
+        the ``equilibrium`` overlap h_eq, and the final ``edges`` of the
+        chain.
+    """
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    m = len(edges)
+    if check_every is None:
+        check_every = max(1, m // 20)
+    if max_swaps is None:
+        max_swaps = 50 * m
+
+    h_eq = _equilibrium_overlap(edges, n, directed) if m else 0.0
+    original = np.sort(edge_keys(edges, n, directed))
+    chain = _Chain(edges, n, directed, rng)
+
+    # the overlap is averaged over windows of about m swaps to detect a plateau
+    window = 20
+    swaps = [0]
+    overlap = [1.0]
+    autocorrelation = [1.0]
+    nswap = None
+    tries = 100 * check_every + 100
+    while m >= 2 and swaps[-1] < max_swaps:
+        done = chain.run(check_every, tries)
+        if done == 0:
+            warnings.warn("No swap was accepted in %i tries." % tries)
+            break
+        swaps.append(swaps[-1] + done)
+        overlap.append(float(np.isin(chain.codes(), original).mean()))
+        autocorrelation.append((overlap[-1] - h_eq) / (1 - h_eq) if h_eq < 1 else 0)
+        if autocorrelation[-1] < tol:
+            nswap = swaps[-1]
+            break
+        # h_eq is only approximate for small dense graphs: the chain has
+        # also mixed once the overlap stops decaying beyond its noise
+        if len(overlap) > 2 * window:
+            last = np.mean(overlap[-window:])
+            before = np.mean(overlap[-2 * window : -window])
+            if before - last <= np.sqrt(last * (1 - last) / m):
+                nswap = swaps[-1]
+                break
+
+    if nswap is None:
+        nswap = swaps[-1]
+        if m >= 2 and swaps[-1] >= max_swaps:
+            warnings.warn(
+                "The autocorrelation was still %.3f after %i swaps."
+                % (autocorrelation[-1], swaps[-1])
+            )
+
+    diagnostics = {
+        "swaps": np.array(swaps),
+        "overlap": np.array(overlap),
+        "autocorrelation": np.array(autocorrelation),
+        "equilibrium": h_eq,
+        "edges": chain.edges(),
+    }
+    return nswap, diagnostics
+
+
+def sample_null_models(
+    edges,
+    n,
+    k,
+    directed=False,
+    spacing=None,
+    burn_in=None,
+    tol=0.05,
+    seed=None,
+    stacked=None,
+):
+    """
+    Draw ``k`` degree-preserving null models of a graph from one swap chain.
+
+    Unless they are given, the burn-in and the spacing between samples are
+    both the number of swaps estimated by ``mixing_diagnostics``, whose run
+    doubles as the burn-in. The samples are taken every ``spacing`` swaps
+    of the same chain, so no swap is spent on restarting from the original
+    graph, and the overlap of consecutive samples is checked against the
+    one expected by chance.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2)
+        Edges as node indices in ``range(n)`` (see ``to_edge_array``),
+        without multi-edges.
+    n : int
+        Number of nodes.
+    k : int
+        Number of samples.
+    directed : bool, default: False
+        Directed swaps preserve in- and out-degrees.
+    spacing : int, optional
+        Swaps between samples.
+    burn_in : int, optional
+        Swaps before the first sample.
+    tol : float, default: 0.05
+        Autocorrelation used to estimate the number of swaps.
+    seed : None, int, Generator or BlockRNG
+    stacked : {None, "csr", "coo"}, optional
+        Return the samples as one sparse matrix, block-diagonal CSR or 3-D
+        COO (see ``stack_edge_arrays``), instead of edge arrays.
+
+    Returns
+    -------
+    samples : numpy array of shape (k, m, 2), or sparse array
+        The edge arrays of the samples, or their stacked adjacency matrices.
+    info : dict
+        ``burn_in`` and ``spacing`` in swaps, the ``diagnostics`` of the
+        mixing estimate (None if both were given), and the
+        ``autocorrelation`` between consecutive samples.
+    """
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    m = len(edges)
+
+    diagnostics = None
+    start = edges
+    if spacing is None or burn_in is None:
+        nswap, diagnostics = mixing_diagnostics(edges, n, directed, tol=tol, seed=rng)
+        if spacing is None:
+            spacing = nswap
+        if burn_in is None:
+            burn_in = nswap
+        start = diagnostics["edges"]
+        burn_in_left = burn_in - diagnostics["swaps"][-1]
+    else:
+        burn_in_left = burn_in
+
+    chain = _Chain(start, n, directed, rng)
+    if burn_in_left > 0 and m >= 2:
+        chain.run(burn_in_left, 10 * burn_in_left + 100)
+
+    samples = np.empty((k, m, 2), dtype=np.int64)
+    overlaps = []
+    previous = None
+    for s in range(k):
+        if s > 0 and m >= 2:
+            done = chain.run(spacing, 10 * spacing + 100)
+            if done < spacing:
+                warnings.warn(
+                    "Only %i of %i swaps were performed between samples."
+                    % (done, spacing)
+                )
+        samples[s] = chain.edges()
+        codes = np.sort(chain.codes())
+        if previous is not None:
+            overlaps.append(np.isin(codes, previous).mean())
+        previous = codes
+
+    h_eq = _equilibrium_overlap(edges, n, directed) if m else 0.0
+    autocorrelation = np.nan
+    if overlaps and h_eq < 1:
+        autocorrelation = (np.mean(overlaps) - h_eq) / (1 - h_eq)
+
+    info = {
+        "burn_in": burn_in,
+        "spacing": spacing,
+        "diagnostics": diagnostics,
+        "autocorrelation": autocorrelation,
+    }
+    if stacked is not None:
+        samples = stack_edge_arrays(samples, n, directed, format=stacked)
+    return samples, info
@@ -0,0 +1,225 @@
+from collections import Counter
+import networkx as nx
+
+
+class Objective:
+    """
+    Base class for objectives optimized by ``SimulatedAnnealing``.
+
+    An objective is bound to a graph once (``bind``), after which the
+    annealer asks for the change a proposed move would cause (``delta``)
+    and, if the move is accepted, tells the objective to apply it
+    (``commit``) before it edits the graph. Subclasses implement
+    ``evaluate`` (full computation) and ``delta`` (change caused by removing
+    the edges ``removed`` and adding the edges ``added``, evaluated on the
+    graph before the move).
+
+    Edges in moves are ``(u, v)`` tuples, or ``(u, v, weight)`` tuples for
+    weight moves. An edge that appears in both lists is only reweighted.
+    """
+
+    def bind(self, G):
+        """Attach the objective to G and return its current value."""
+        self.G = G
+        self.value = self.evaluate(G)
+        self._delta = 0
+        return self.value
+
+    def evaluate(self, G):
+        raise NotImplementedError
+
+    def delta(self, removed, added):
+        raise NotImplementedError
+
+    def commit(self):
+        """Apply the last move passed to ``delta``."""
+        self.value += self._delta
+
+    def _net_change(self, removed, added):
+        """Topological change of a move: edges only removed, edges only added."""
+        removed = [tuple(e[:2]) for e in removed]
+        added = [tuple(e[:2]) for e in added]
+        if self.G.is_directed():
+            key = tuple
+        else:
+            key = frozenset
+        removed_keys = {key(e) for e in removed}
+        added_keys = {key(e) for e in added}
+        return (
+            [e for e in removed if key(e) not in added_keys],
+            [e for e in added if key(e) not in removed_keys],
+        )
+
+
+class AssortativityObjective(Objective):
+    """
+    Degree assortativity of an undirected graph.
+
+    The objective keeps the degrees and the sums that assortativity is made
+    of, so ``delta`` costs O(1) for moves that preserve degrees (double-edge
+    swaps) and O(d) for moves that change them (single-edge rewiring), where
+    d is the degree of the nodes involved.
+    """
+
+    def evaluate(self, G):
+        if G.is_directed():
+            raise ValueError(
+                "AssortativityObjective is implemented for undirected graphs."
+            )
+        self.k = dict(G.degree())
+        self.M = G.number_of_edges()
+        self.S = sum(self.k[u] * self.k[v] for u, v in G.edges())
+        self.Q2 = sum(k**2 for k in self.k.values())
+        self.Q3 = sum(k**3 for k in self.k.values())
+        return self._assortativity(self.S, self.Q2, self.Q3, self.M)
+
+    @staticmethod
+    def _assortativity(S, Q2, Q3, M):
+        if M == 0:
+            return 0.0
+        mean = Q2 / (2 * M)
+        var = Q3 / (2 * M) - mean**2
+        if var <= 0:
+            return 0.0
+        return (S / M - mean**2) / var
+
+    def delta(self, removed, added):
+        removed, added = self._net_change(removed, added)
+        k = self.k
+
+        dk = Counter()
+        for u, v in removed:
+            dk[u] -= 1
+            dk[v] -= 1
+        for u, v in added:
+            dk[u] += 1
+            dk[v] += 1
+        changed = {u for u, d in dk.items() if d != 0}
+
+        if not changed:
+            dS = sum(k[u] * k[v] for u, v in added) - sum(
+                k[u] * k[v] for u, v in removed
+            )
+            dQ2 = dQ3 = 0
+        else:
+            # only edges incident to nodes whose degree changes see new products
+            new_k = {u: k.get(u, 0) + dk[u] for u in changed}
+            removed_keys = {frozenset(e) for e in removed}
+
+            old_local = {}
+            for u in changed:
+                if u in self.G:
+                    for v in self.G[u]:
+                        old_local[frozenset((u, v))] = (u, v)
+            new_local = {f: e for f, e in old_local.items() if f not in removed_keys}
+            for u, v in added:
+                if u in changed or v in changed:
+                    new_local[frozenset((u, v))] = (u, v)
+
+            def kk(u, v, degrees):
+                return degrees.get(u, k.get(u, 0)) * degrees.get(v, k.get(v, 0))
+
+            dS = sum(kk(u, v, new_k) for u, v in new_local.values()) - sum(
+                kk(u, v, {}) for u, v in old_local.values()
+            )
+            dS += sum(
+                k[u] * k[v] for u, v in added if u not in changed and v not in changed
+            )
+            dS -= sum(
+                k[u] * k[v] for u, v in removed if u not in changed and v not in changed
+            )
+            dQ2 = sum(new_k[u] ** 2 - k.get(u, 0) ** 2 for u in changed)
+            dQ3 = sum(new_k[u] ** 3 - k.get(u, 0) ** 3 for u in changed)
+
+        dM = len(added) - len(removed)
+        self._pending = (dS, dQ2, dQ3, dM, dk)
+        new = self._assortativity(
+            self.S + dS, self.Q2 + dQ2, self.Q3 + dQ3, self.M + dM
+        )
+        self._delta = new - self.value
+        return self._delta
+
+    def commit(self):
+        dS, dQ2, dQ3, dM, dk = self._pending
+        self.S += dS
+        self.Q2 += dQ2
+        self.Q3 += dQ3
+        self.M += dM
+        for u, d in dk.items():
+            self.k[u] = self.k.get(u, 0) + d
+        self.value = self._assortativity(self.S, self.Q2, self.Q3, self.M)
+
+
+class TriangleObjective(Objective):
+    """
+    Number of triangles of an undirected graph.
+
+    Removing or adding the edge (u, v) changes the count by the number of
+    common neighbours of u and v, so ``delta`` costs O(d).
+    """
+
+    def evaluate(self, G):
+        if G.is_directed():
+            raise ValueError("TriangleObjective is implemented for undirected graphs.")
+        return sum(nx.triangles(G).values()) // 3
+
+    def delta(self, removed, added):
+        removed, added = self._net_change(removed, added)
+        gone = set()
+        new = set()
+
+        def neighbors(x):
+            nbrs = {y for y in self.G[x] if frozenset((x, y)) not in gone}
+            nbrs.update(y for f in new if x in f for y in f if y != x)
+            return nbrs
+
+        delta = 0
+        for u, v in removed:
+            gone.add(frozenset((u, v)))
+            delta -= len(neighbors(u) & neighbors(v))
+        for u, v in added:
+            delta += len(neighbors(u) & neighbors(v))
+            new.add(frozenset((u, v)))
+
+        self._delta = delta
+        return delta
+
+
+class FunctionObjective(Objective):
+    """
+    Any graph function, e.g. ``nx.average_clustering`` or
+    ``nx.algebraic_connectivity``, used as an objective.
+
+    ``delta`` applies the move to the graph, evaluates the function and
+    undoes the move, so every proposal costs a full evaluation. Use it for
+    objectives that have no cheaper incremental form.
+    """
+
+    def __init__(self, func, weight="weight"):
+        self.func = func
+        self.weight = weight
+
+    def evaluate(self, G):
+        return self.func(G)
+
+    def delta(self, removed, added):
+        G = self.G
+        saved = []
+        for e in removed:
+            saved.append((e[0], e[1], dict(G.edges[e[0], e[1]])))
+            G.remove_edge(e[0], e[1])
+        for e in added:
+            if len(e) > 2:
+                G.add_edge(e[0], e[1], **{self.weight: e[2]})
+            else:
+                G.add_edge(e[0], e[1])
+
+        new = self.func(G)
+
+        for e in added:
+            G.remove_edge(e[0], e[1])
+        for u, v, data in saved:
+            G.add_edge(u, v, **data)
+
+        self._delta = new - self.value
+        return self._delta
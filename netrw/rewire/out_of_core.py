@@ -0,0 +1,373 @@
+from .rng import BlockRNG
+from .directed_swap import _swap_targets
+import os
+import warnings
+import numpy as np
+
+
+def _edge_codes(edges, n, directed):
+    """``u * n + v`` codes of an edge block, with ``u <= v`` if undirected."""
+    u = edges[:, 0].astype(np.int64)
+    v = edges[:, 1].astype(np.int64)
+    if not directed:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    return u * n + v
+
+
+class DiskEdgeIndex:
+    """
+    Membership index of the edges of a graph too large for a hashed set.
+
+    The codes ``u * n + v`` of the edges are kept sorted in a memory-mapped
+    int64 file (8 bytes per edge), looked up by binary search. Edges added
+    and removed since the file was written are kept in two small in-memory
+    sets, and merged into the file in one sequential pass once they hold
+    more than ``max_delta`` codes. Supports ``in``, ``add`` and ``remove``
+    on edge codes, like the sets used by the in-memory swap kernels.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2), e.g. a numpy.memmap
+        The edges, read in blocks of ``block_size``.
+    n : int
+        Number of nodes.
+    path : str
+        File the sorted codes are written to.
+    directed : bool, default: False
+    block_size : int, default: 2**22
+    max_delta : int, default: 2**24
+    """
+
+    def __init__(
+        self, edges, n, path, directed=False, block_size=2**22, max_delta=2**24
+    ):
+        self.n = n
+        self.path = path
+        self.directed = directed
+        self.block_size = block_size
+        self.max_delta = max_delta
+        self.added = set()
+        self.removed = set()
+
+        m = len(edges)
+        codes = np.lib.format.open_memmap(path, mode="w+", dtype=np.int64, shape=(m,))
+        for start in range(0, m, block_size):
+            block = np.asarray(edges[start : start + block_size])
+            codes[start : start + len(block)] = _edge_codes(block, n, directed)
+        # sorts the mapped pages in place; the OS keeps what fits in memory
+        codes.sort()
+        codes.flush()
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.codes) + len(self.added) - len(self.removed)
+
+    def __contains__(self, code):
+        if code in self.added:
+            return True
+        if code in self.removed:
+            return False
+        codes = self.codes
+        i = int(np.searchsorted(codes, code))
+        return i < len(codes) and codes[i] == code
+
+    def add(self, code):
+        if code in self.removed:
+            self.removed.remove(code)
+        else:
+            self.added.add(code)
+
+    def remove(self, code):
+        if code in self.added:
+            self.added.remove(code)
+        else:
+            self.removed.add(code)
+
+    def maybe_compact(self):
+        """Merge the pending changes into the file if there are too many."""
+        if len(self.added) + len(self.removed) > self.max_delta:
+            self.compact()
+
+    def compact(self):
+        """Merge the added and removed codes into the sorted file."""
+        added = np.sort(np.fromiter(self.added, dtype=np.int64, count=len(self.added)))
+        removed = np.fromiter(self.removed, dtype=np.int64, count=len(self.removed))
+        removed.sort()
+
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.lib.format.write_array_header_1_0(
+                f,
+                {
+                    "descr": np.lib.format.dtype_to_descr(np.dtype(np.int64)),
+                    "fortran_order": False,
+                    "shape": (len(self),),
+                },
+            )
+            pos = 0
+            for start in range(0, len(self.codes), self.block_size):
+                block = np.asarray(self.codes[start : start + self.block_size])
+                i = np.searchsorted(removed, block)
+                i = np.minimum(i, len(removed) - 1) if len(removed) else i
+                if len(removed):
+                    block = block[removed[i] != block]
+                if start + self.block_size >= len(self.codes):
+                    end = len(added)
+                else:
+                    end = int(np.searchsorted(added, block[-1])) if len(block) else pos
+                merged = np.concatenate([block, added[pos:end]])
+                merged.sort()
+                merged.tofile(f)
+                pos = end
+            added[pos:].tofile(f)
+
+        del self.codes
+        os.replace(tmp, self.path)
+        self.codes = np.load(self.path, mmap_mode="r+")
+        self.added = set()
+        self.removed = set()
+
+
+def _move_ends(tails, heads, keys, n, nrewire, max_tries, rng, directed):
+    """
+    Move one end of random edges to random nodes, on Python lists in place.
+
+    An edge (a, b) becomes (a, c) or (c, b) for a random node c, unless the
+    new edge is a self-loop or is present already (checked against
+    ``keys``, a container of edge codes). Returns the number of edges moved.
+    """
+    m = len(tails)
+    moved = 0
+    tries = 0
+    while moved < nrewire and tries < max_tries:
+        size = min(rng.block_size * 16, max_tries - tries)
+        index = rng.generator.integers(m, size=size).tolist()
+        ends = rng.generator.integers(2, size=size).tolist()
+        # random node other than the end that stays
+        others = rng.generator.integers(n - 1, size=size).tolist()
+        for i, end, c in zip(index, ends, others):
+            tries += 1
+            a, b = tails[i], heads[i]
+            if end:
+                if c >= a:
+                    c += 1
+                u, v = a, c
+            else:
+                if c >= b:
+                    c += 1
+                u, v = c, b
+            if directed or u < v:
+                code = u * n + v
+            else:
+                code = v * n + u
+            if code in keys:
+                continue
+            if directed or a < b:
+                keys.remove(a * n + b)
+            else:
+                keys.remove(b * n + a)
+            keys.add(code)
+            tails[i], heads[i] = u, v
+            moved += 1
+            if moved == nrewire:
+                break
+    return moved
+
+
+def _rewire_file(
+    path,
+    out_path,
+    n,
+    nsteps,
+    move,
+    directed,
+    dtype,
+    block_size,
+    seed,
+    index_path,
+    max_tries,
+):
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu":
+        raise ValueError("Edge files hold integer node indices, not %s." % dtype)
+    if os.path.getsize(path) == 0:
+        open(out_path, "wb").close()
+        return 0
+    source = np.memmap(path, dtype=dtype, mode="r")
+    if len(source) % 2:
+        raise ValueError("%s is not a flat list of (source, target) pairs." % path)
+    source = source.reshape(-1, 2)
+    m = len(source)
+    if m < 2 or nsteps == 0:
+        source.tofile(out_path)
+        return 0
+
+    # the output starts as a copy of the input and is rewired in place
+    out = np.memmap(out_path, dtype=dtype, mode="w+", shape=(m, 2))
+    for start in range(0, m, block_size):
+        out[start : start + block_size] = source[start : start + block_size]
+    del source
+
+    if n is None:
+        n = 0
+        for start in range(0, m, block_size):
+            n = max(n, int(out[start : start + block_size].max()) + 1)
+    if max_tries is None:
+        max_tries = 10 * nsteps + 100
+    if index_path is None:
+        index_path = out_path + ".index.npy"
+
+    keys = DiskEdgeIndex(out, n, index_path, directed, block_size)
+    n_blocks = -(-m // block_size)
+    done = 0
+    tries = 0
+    try:
+        while done < nsteps and tries < max_tries:
+            # two random blocks are read, rewired against each other and
+            # the global index, and written back
+            blocks = rng.generator.choice(
+                n_blocks, size=min(2, n_blocks), replace=False
+            )
+            slices = [
+                slice(b * block_size, min((b + 1) * block_size, m)) for b in blocks
+            ]
+            batch = np.concatenate([np.asarray(out[s]) for s in slices])
+            tails = batch[:, 0].tolist()
+            heads = batch[:, 1].tolist()
+
+            steps = min(nsteps - done, len(batch))
+            budget = min(max_tries - tries, 10 * steps + 100)
+            done += move(tails, heads, keys, n, steps, budget, rng, directed)
+            tries += budget
+
+            batch[:, 0] = tails
+            batch[:, 1] = heads
+            pos = 0
+            for s in slices:
+                length = s.stop - s.start
+                out[s] = batch[pos : pos + length]
+                pos += length
+            keys.maybe_compact()
+    finally:
+        out.flush()
+        del keys
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    if done < nsteps:
+        warnings.warn(
+            "Only %i of %i rewiring steps were performed in %i tries."
+            % (done, nsteps, max_tries)
+        )
+    return done
+
+
+def _swap(tails, heads, keys, n, nswap, max_tries, rng, directed):
+    return len(
+        _swap_targets(tails, heads, keys, n, nswap, max_tries, rng, False, directed)
+    )
+
+
+def out_of_core_edge_swap(
+    path,
+    out_path,
+    nswap,
+    n=None,
+    directed=False,
+    dtype=np.int64,
+    block_size=2**22,
+    seed=None,
+    index_path=None,
+    max_tries=None,
+):
+    """
+    Degree-preserving double-edge swaps on an edge list stored on disk.
+
+    The input is a flat binary file of (source, target) node index pairs
+    (``dtype`` integers, as written by ``edges.astype(dtype).tofile``),
+    without self-loops or multi-edges. The rewired edges are written to
+    ``out_path`` in the same format. The edge list is memory-mapped and
+    rewired two random blocks of ``block_size`` edges at a time, so the
+    file is read and written in large sequential chunks; the swaps of a
+    batch draw both edges from the batch, and new edges are checked
+    against a sorted on-disk index of all edges (see ``DiskEdgeIndex``).
+
+    Parameters
+    ----------
+    path : str
+        Input edge file.
+    out_path : str
+        Output edge file.
+    nswap : int
+        Number of swaps to perform.
+    n : int, optional
+        Number of nodes, by default the largest node index + 1.
+    directed : bool, default: False
+        Directed swaps (a, b), (c, d) -> (a, d), (c, b) preserve in- and
+        out-degrees.
+    dtype : numpy dtype, default: int64
+        Integer type of the file, int32 or int64.
+    block_size : int, default: 2**22
+        Number of edges per block.
+    seed : None, int, Generator or BlockRNG
+        Random stream used for the proposals.
+    index_path : str, optional
+        Where to keep the edge index while rewiring, by default next to
+        ``out_path``. Removed at the end.
+    max_tries : int, optional
+        Maximum number of proposals, default ``10 * nswap + 100``.
+
+    Returns
+    -------
+    nswaps : int
+        The number of swaps performed.
+    """
+    return _rewire_file(
+        path,
+        out_path,
+        n,
+        nswap,
+        _swap,
+        directed,
+        dtype,
+        block_size,
+        seed,
+        index_path,
+        max_tries,
+    )
+
+
+def out_of_core_global_rewire(
+    path,
+    out_path,
+    nrewire,
+    n=None,
+    directed=False,
+    dtype=np.int64,
+    block_size=2**22,
+    seed=None,
+    index_path=None,
+    max_tries=None,
+):
+    """
+    Global rewiring, as in ``GlobalRewiring``, of an edge list stored on
+    disk: ``nrewire`` times, one end of a random edge is moved to a random
+    node, unless that creates a self-loop or an existing edge.
+
+    Takes the same file format and parameters as ``out_of_core_edge_swap``
+    and returns the number of edges moved.
+    """
+    return _rewire_file(
+        path,
+        out_path,
+        n,
+        nrewire,
+        _move_ends,
+        directed,
+        dtype,
+        block_size,
+        seed,
+        index_path,
+        max_tries,
+    )
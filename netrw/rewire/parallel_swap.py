@@ -0,0 +1,397 @@
+from .rng import BlockRNG
+from .edge_array import edge_keys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+# shared arrays of the worker processes, attached once by _attach
+_shared = {}
+
+
+def _attach(specs):
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _shared[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _codes(u, v, n, directed):
+    if not directed:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    return u * n + v
+
+
+def _contains(sorted_codes, codes):
+    # sorted keys make the binary searches walk the array in order
+    order = np.argsort(codes)
+    i = np.empty(len(codes), dtype=np.int64)
+    i[order] = sorted_codes.searchsorted(codes[order])
+    i = np.minimum(i, len(sorted_codes) - 1)
+    return sorted_codes[i] == codes
+
+
+def _propose(tails, heads, sorted_codes, n, directed, size, seed_seq):
+    """
+    Draw ``size`` swap proposals and check them against the edges at the
+    start of the round. Returns the edge indices, flips and validity.
+    """
+    generator = np.random.default_rng(seed_seq)
+    m = len(tails)
+    i = generator.integers(m, size=size)
+    j = generator.integers(m, size=size)
+    if directed:
+        flip = np.zeros(size, dtype=bool)
+    else:
+        flip = generator.integers(2, size=size).astype(bool)
+
+    a, b = tails[i], heads[i]
+    c = np.where(flip, heads[j], tails[j])
+    d = np.where(flip, tails[j], heads[j])
+    new1 = _codes(a, d, n, directed)
+    new2 = _codes(c, b, n, directed)
+    # also rejects i == j, self-loops and no-op swaps
+    valid = (a != c) & (b != d) & (a != d) & (c != b) & (new1 != new2)
+    valid &= ~_contains(sorted_codes, new1) & ~_contains(sorted_codes, new2)
+    return i, j, flip, valid
+
+
+def _propose_shared(n, directed, size, seed_seq):
+    return _propose(
+        _shared["tails"][1],
+        _shared["heads"][1],
+        _shared["codes"][1],
+        n,
+        directed,
+        size,
+        seed_seq,
+    )
+
+
+def _first_use(values):
+    """
+    For every proposal (row of ``values``), whether any of its values was
+    used by an earlier proposal.
+    """
+    width = values.shape[1]
+    _, first, inverse = np.unique(
+        values.ravel(), return_index=True, return_inverse=True
+    )
+    owner = np.arange(values.size) // width
+    earlier = (first[inverse] // width) < owner
+    return earlier.reshape(values.shape).any(axis=1)
+
+
+def _meets(values, others):
+    """Rows of ``values`` that share a value with ``others``."""
+    return np.isin(values, others).any(axis=1)
+
+
+class _Round:
+    """Serial resolution of the proposals of one round, see ``_resolve``."""
+
+    def __init__(self, tails, heads, sorted_codes, n, directed):
+        self.tails = tails
+        self.heads = heads
+        self.sorted_codes = sorted_codes
+        self.n = n
+        self.directed = directed
+        self.edges = {}
+        self.added = set()
+        self.removed = set()
+
+    def edge(self, i):
+        if i in self.edges:
+            return self.edges[i]
+        return int(self.tails[i]), int(self.heads[i])
+
+    def code(self, u, v):
+        if not self.directed and u > v:
+            u, v = v, u
+        return u * self.n + v
+
+    def present(self, code):
+        if code in self.added:
+            return True
+        if code in self.removed:
+            return False
+        i = int(self.sorted_codes.searchsorted(code))
+        return i < len(self.sorted_codes) and self.sorted_codes[i] == code
+
+    def apply(self, i, j, ei, ej):
+        for old in (self.edge(i), self.edge(j)):
+            code = self.code(*old)
+            if code in self.added:
+                self.added.remove(code)
+            else:
+                self.removed.add(code)
+        for new in (ei, ej):
+            code = self.code(*new)
+            if code in self.removed:
+                self.removed.remove(code)
+            else:
+                self.added.add(code)
+        self.edges[i] = ei
+        self.edges[j] = ej
+
+    def swap(self, i, j, flip):
+        """Serial check and application of one proposal."""
+        a, b = self.edge(i)
+        c, d = self.edge(j)
+        if flip:
+            c, d = d, c
+        if a == c or b == d or a == d or c == b:
+            return False
+        k1, k2 = self.code(a, d), self.code(c, b)
+        if k1 == k2 or self.present(k1) or self.present(k2):
+            return False
+        self.apply(i, j, (a, d), (c, b))
+        return True
+
+
+def _resolve(tails, heads, sorted_codes, n, directed, i, j, flip, valid, limit):
+    """
+    Apply the proposals of a round as a serial chain would, in order, and
+    stop after ``limit`` accepted swaps.
+
+    A proposal is settled if nothing it reads or writes (its two edge
+    indices and the codes of its old and new edges) is touched by an
+    earlier proposal of the round: it sees the state at the start of the
+    round, so its validity, computed in parallel, is final, and it is
+    applied in bulk. The other proposals are re-checked one by one. Since a
+    re-checked swap can create edges that no proposal had at the start of
+    the round, settled proposals meeting those edges are re-checked as
+    well, and settled proposals that come before the re-checked ones they
+    meet are applied first, until nothing changes. Returns the number of
+    swaps applied.
+    """
+    a, b = tails[i], heads[i]
+    c = np.where(flip, heads[j], tails[j])
+    d = np.where(flip, tails[j], heads[j])
+    codes = np.stack(
+        [
+            _codes(a, b, n, directed),
+            _codes(c, d, n, directed),
+            _codes(a, d, n, directed),
+            _codes(c, b, n, directed),
+        ],
+        axis=1,
+    )
+    # edge indices are kept apart from codes by their sign
+    values = np.concatenate([codes, -1 - np.stack([i, j], axis=1)], axis=1)
+    settled = ~_first_use(values)
+
+    # settled swaps sharing a value with a later proposal come before it
+    first_applied = np.flatnonzero(
+        settled & valid & _meets(values, values[~settled].ravel())
+    ).tolist()
+    for attempt in range(10):
+        if attempt == 9:
+            # give up on the split and run the round serially
+            settled[:] = False
+            first_applied = []
+        state = _Round(tails, heads, sorted_codes, n, directed)
+        for p in first_applied:
+            state.apply(
+                int(i[p]), int(j[p]), (int(a[p]), int(d[p])), (int(c[p]), int(b[p]))
+            )
+
+        # earliest re-checked proposal reading or writing every value
+        first = {}
+        moves = {}
+        for p in np.flatnonzero(~settled).tolist():
+            ip, jp = int(i[p]), int(j[p])
+            (ap, bp), (cp, dp) = state.edge(ip), state.edge(jp)
+            if flip[p]:
+                cp, dp = dp, cp
+            for v in (
+                -1 - ip,
+                -1 - jp,
+                state.code(ap, bp),
+                state.code(cp, dp),
+                state.code(ap, dp),
+                state.code(cp, bp),
+            ):
+                first.setdefault(v, p)
+            if state.swap(ip, jp, bool(flip[p])):
+                moves[p] = (((ap, bp), (cp, dp)), ((ap, dp), (cp, bp)))
+
+        touched = np.fromiter(first, dtype=np.int64, count=len(first))
+        hits = np.flatnonzero(settled & _meets(values, touched))
+        unsettled = []
+        before = []
+        for p in hits.tolist():
+            if any(first.get(v, p) < p for v in values[p].tolist()):
+                unsettled.append(p)
+            elif valid[p]:
+                before.append(p)
+        if not unsettled and set(before) <= set(first_applied):
+            break
+        settled[unsettled] = False
+        first_applied = sorted(set(first_applied) | set(before))
+        first_applied = [p for p in first_applied if settled[p]]
+
+    accepted = settled & valid
+    accepted[list(moves)] = True
+    order = np.flatnonzero(accepted)
+    if len(order) > limit:
+        # later swaps never affect earlier ones, so the serial chain stopped
+        # after ``limit`` swaps is a prefix of the round
+        accepted[order[limit] :] = False
+    bulk = settled & accepted
+
+    # settled swaps first, then the re-checked ones in order
+    tails[i[bulk]] = a[bulk]
+    heads[i[bulk]] = d[bulk]
+    tails[j[bulk]] = c[bulk]
+    heads[j[bulk]] = b[bulk]
+    removed = [codes[bulk, 0], codes[bulk, 1]]
+    added = [codes[bulk, 2], codes[bulk, 3]]
+    for p in sorted(moves):
+        if not accepted[p]:
+            break
+        old, new = moves[p]
+        for index, (u, v) in zip((i[p], j[p]), new):
+            tails[index] = u
+            heads[index] = v
+        removed.append(np.array([state.code(*e) for e in old], dtype=np.int64))
+        added.append(np.array([state.code(*e) for e in new], dtype=np.int64))
+
+    # net change of the edge set
+    change, inverse = np.unique(np.concatenate(removed + added), return_inverse=True)
+    sign = np.repeat([-1, 1], [sum(map(len, removed)), sum(map(len, added))])
+    net = np.bincount(inverse, weights=sign, minlength=len(change))
+    gone, new = change[net < 0], change[net > 0]
+    kept = sorted_codes[~_isin_sorted(sorted_codes, gone)]
+    sorted_codes[:] = np.insert(kept, np.searchsorted(kept, new), new)
+    return int(np.sum(accepted))
+
+
+def _isin_sorted(sorted_codes, codes):
+    """Mask of the entries of sorted_codes that are in codes."""
+    mask = np.zeros(len(sorted_codes), dtype=bool)
+    if len(codes):
+        mask[np.searchsorted(sorted_codes, codes)] = True
+    return mask
+
+
+def parallel_double_edge_swap(
+    edges,
+    n,
+    nswap,
+    n_jobs=1,
+    directed=False,
+    round_size=None,
+    seed=None,
+    max_tries=None,
+):
+    """
+    Degree-preserving double-edge swaps, proposed by several processes.
+
+    Swaps run in rounds. In every round each of ``n_jobs`` worker processes
+    draws a chunk of proposals (two random edges, and for undirected graphs
+    a random orientation) and checks them against the edge arrays and a
+    sorted array of edge codes, all in shared memory. The proposals of a
+    round are then resolved in a fixed order, worker by worker: proposals
+    that share an edge, or an old or new edge code, with an earlier one are
+    re-checked serially on the updated state. The result is the one a
+    serial chain gives for the same sequence of proposals, so the Markov
+    chain is that of ``nx.double_edge_swap`` (or of directed swaps), and a
+    run is reproducible for a fixed seed and ``n_jobs``.
+
+    Parameters
+    ----------
+    edges : array of shape (m, 2)
+        Edges as node indices in ``range(n)``, without multi-edges.
+    n : int
+        Number of nodes.
+    nswap : int
+        Number of swaps to perform.
+    n_jobs : int, default: 1
+        Number of worker processes (and proposal chunks per round).
+    directed : bool, default: False
+        Directed swaps (a, b), (c, d) -> (a, d), (c, b) preserve in- and
+        out-degrees.
+    round_size : int, optional
+        Proposals per round, by default 1% of the number of edges (at least
+        1024). Larger rounds have more conflicts to resolve serially.
+    seed : None, int, Generator or BlockRNG
+    max_tries : int, optional
+        Maximum number of proposals, default ``10 * nswap + 100``.
+
+    Returns
+    -------
+    edges : numpy array of shape (m, 2)
+        The rewired edges; edge ``i`` of the output replaces edge ``i`` of
+        the input.
+    nswaps : int
+        The number of swaps performed.
+    """
+    rng = seed if isinstance(seed, BlockRNG) else BlockRNG(seed)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    m = len(edges)
+    if max_tries is None:
+        max_tries = 10 * nswap + 100
+    if round_size is None:
+        round_size = max(1024, m // 100)
+    if m < 2:
+        return edges.copy(), 0
+
+    arrays = {
+        "tails": edges[:, 0],
+        "heads": edges[:, 1],
+        "codes": np.sort(edge_keys(edges, n, directed)),
+    }
+    executor = None
+    blocks = []
+    try:
+        if n_jobs > 1:
+            specs = {}
+            for name, array in arrays.items():
+                shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+                blocks.append(shm)
+                shared = np.ndarray(array.shape, dtype=np.int64, buffer=shm.buf)
+                shared[:] = array
+                arrays[name] = shared
+                specs[name] = (shm.name, array.shape, np.int64)
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_attach, initargs=(specs,)
+            )
+        else:
+            arrays = {name: array.copy() for name, array in arrays.items()}
+        tails, heads, codes = arrays["tails"], arrays["heads"], arrays["codes"]
+
+        done = 0
+        tries = 0
+        while done < nswap and tries < max_tries:
+            size = min(round_size, max_tries - tries)
+            tries += size
+            chunks = np.diff(np.linspace(0, size, n_jobs + 1).astype(int)).tolist()
+            seeds = [child.seed_seq for child in rng.spawn(n_jobs)]
+            if executor is None:
+                results = [
+                    _propose(tails, heads, codes, n, directed, k, s)
+                    for k, s in zip(chunks, seeds)
+                ]
+            else:
+                results = list(
+                    executor.map(
+                        _propose_shared,
+                        [n] * n_jobs,
+                        [directed] * n_jobs,
+                        chunks,
+                        seeds,
+                    )
+                )
+            i, j, flip, valid = (np.concatenate(x) for x in zip(*results))
+            done += _resolve(
+                tails, heads, codes, n, directed, i, j, flip, valid, nswap - done
+            )
+
+        out = np.stack([tails, heads], axis=1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        arrays = tails = heads = codes = None
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+    return out, done
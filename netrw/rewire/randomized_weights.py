@@ -1,11 +1,33 @@
 from .base import BaseRewirer
+from .edge_array import to_edge_array, from_sparse, to_sparse
 import copy
-import itertools as it
-import random
 import networkx as nx
 import numpy as np
 
 
+def _weight_arrays(G, weight):
+    """Edges of G (in G.edges() order) and their weights as a float array."""
+    e_list = []
+    w = []
+    for u, v, d in G.edges(data=True):
+        e_list.append((u, v))
+        w.append(d[weight])
+    return e_list, np.array(w, dtype=float)
+
+
+def _write_weights(G, e_list, w, weight):
+    """Write the weight array back to the graph in a single pass."""
+    nx.set_edge_attributes(G, dict(zip(e_list, w.tolist())), weight)
+
+
+def _edge_pairs(rng, m, size):
+    """Draw ``size`` pairs of distinct edge indices in [0, m)."""
+    i = rng.generator.integers(m, size=size)
+    j = rng.generator.integers(m - 1, size=size)
+    j += j >= i
+    return i.tolist(), j.tolist()
+
+
 class RandomizedWeightCM_swap(BaseRewirer):
     """
     Swap weights of a weighted network without rewiring edges.
@@ -13,44 +35,49 @@ class RandomizedWeightCM_swap(BaseRewirer):
     - rewire_step: Swap weights bewteen two randomly chosen edges
     - rewire: Over the list of edges, permutate the list of associated weigths
 
+    The weights are held in an array aligned with the edge list while
+    rewiring and written back to the graph once at the end.
+
     4th method is from Ghavasieh, A.; De Domenico, M.
     "Multiscale Information Propagation in Emergent Functional Networks".
     Entropy 2021, 23, 1369. https://doi.org/10.3390/e23101369
     """
 
-    def edge_pair_random_choice(self, G):
-        e_list = list(G.edges(data=True))
-        e_1 = random.choice(e_list)
-        e_list.remove(e_1)
-        e_2 = random.choice(e_list)
+    capabilities = {"directed": True, "weighted": True, "degree_preserving": True}
 
-        return e_1, e_2
+    def step_rewire(self, G, copy_graph=True, weight="weight"):
+        return self.full_rewire(G, timesteps=1, copy_graph=copy_graph, weight=weight)
 
-    def step_rewire(self, G, copy_graph=True):
+    def full_rewire(self, G, timesteps=-1, copy_graph=True, weight="weight"):
+        """
+        Swap the weights of ``timesteps`` random pairs of edges. If
+        timesteps=-1, the weights are randomly permuted over all the edges.
+        """
         if copy_graph:
             G = copy.deepcopy(G)
 
-        e_1, e_2 = self.edge_pair_random_choice(G)
-
-        w_1 = e_1[2]["weight"]
-        w_2 = e_2[2]["weight"]
-
-        G.edges[e_1[0], e_1[1]]["weight"] = w_2
-        G.edges[e_2[0], e_2[1]]["weight"] = w_1
-
+        e_list, w = _weight_arrays(G, weight)
+        _write_weights(G, e_list, self._swap(w, timesteps), weight)
         return G
 
-    def full_rewire(self, G, copy_graph=True):
-        if copy_graph:
-            G = copy.deepcopy(G)
+    def _sparse_full_rewire(self, A, timesteps=-1, copy_graph=True, weight="weight"):
+        edges, w, directed = from_sparse(A)
+        return to_sparse(A.shape[0], edges, self._swap(w, timesteps), directed, like=A)
 
-        e_list = list(G.edges())
-        w_list = [x[2]["weight"] for x in list(G.edges(data=True))]
+    # step_rewire defers to full_rewire, which rewires matrices natively
+    _sparse_step_rewire = step_rewire
 
-        w_list = np.random.permutation(w_list)
-        nx.set_edge_attributes(G, dict(zip(e_list, w_list)), "weight")
-
-        return G
+    def _swap(self, w, timesteps):
+        m = len(w)
+        if m < 2:
+            return w
+        if timesteps == -1:
+            return self.rng.permutation(w)
+        # compose the transpositions on an index list, move weights once
+        perm = list(range(m))
+        for i, j in zip(*_edge_pairs(self.rng, m, timesteps)):
+            perm[i], perm[j] = perm[j], perm[i]
+        return w[perm]
 
 
 class RandomizedWeightCM_redistribution(BaseRewirer):
@@ -59,35 +86,134 @@ class RandomizedWeightCM_redistribution(BaseRewirer):
 
     - rewire_step: the total sum of weight of a randomly chosen pair of links is randomly re-distributed over this two links
     - rewire: The total sum of weights of all links in the netwrok is randomly distributed over the links
+      (uniformly over the simplex, i.e. with a flat Dirichlet distribution)
+    - preserve_strength: weights are redistributed around random alternating
+      cycles a-b, c-b, c-d, a-d (adding to a-b and c-d what is taken from
+      c-b and a-d), which keeps the total weight (strength) of every node,
+      and every in- and out-strength of directed graphs, fixed
+
+    The weights are held in an array aligned with the edge list while
+    rewiring and written back to the graph once at the end.
     """
 
-    def step_rewire(self, G, copy_graph=True):
+    capabilities = {"directed": True, "weighted": True, "degree_preserving": True}
+
+    def step_rewire(self, G, copy_graph=True, preserve_strength=False, weight="weight"):
+        return self.full_rewire(
+            G,
+            timesteps=1,
+            copy_graph=copy_graph,
+            preserve_strength=preserve_strength,
+            weight=weight,
+        )
+
+    def full_rewire(
+        self, G, timesteps=-1, copy_graph=True, preserve_strength=False, weight="weight"
+    ):
+        """
+        Redistribute the weights over ``timesteps`` random pairs of edges
+        (or alternating cycles, with ``preserve_strength``). If
+        timesteps=-1, the total weight is redistributed over all the edges
+        at once (or 10 * number of edges cycle moves are made, with
+        ``preserve_strength``).
+        """
         if copy_graph:
             G = copy.deepcopy(G)
 
-        e_1, e_2 = self.edge_pair_random_choice(G)
-
-        a_1 = random.random()
-
-        w_sum = e_1[2]["weight"] + e_2[2]["weight"]
-
-        G.edges[e_1[0], e_1[1]]["weight"] = a_1 * w_sum
-        G.edges[e_2[0], e_2[1]]["weight"] = (1 - a_1) * w_sum
-
+        e_list, w = _weight_arrays(G, weight)
+        if preserve_strength and len(w) >= 2:
+            nodes, edges = to_edge_array(G)
+            w = self._cycle_redistribution(
+                edges, len(nodes), G.is_directed(), w, timesteps
+            )
+        else:
+            w = self._redistribute(w, timesteps)
+        _write_weights(G, e_list, w, weight)
         return G
 
-    def full_rewire(self, G, copy_graph=True):
-        if copy_graph:
-            G = copy.deepcopy(G)
-
-        alphas = np.random.rand(len(G.edges()))
-        alphas = alphas / np.sum(alphas)
-
-        w = [x[2]["weight"] for x in list(G.edges(data=True))]
-        w_sum = np.sum(w)
-        aw = alphas * w_sum
-
-        e_list = list(G.edges())
-        nx.set_edge_attributes(G, dict(zip(e_list, aw)), "weight")
-
-        return G
+    def _sparse_full_rewire(
+        self, A, timesteps=-1, copy_graph=True, preserve_strength=False, weight="weight"
+    ):
+        edges, w, directed = from_sparse(A)
+        w = w.astype(float)
+        if preserve_strength and len(w) >= 2:
+            w = self._cycle_redistribution(edges, A.shape[0], directed, w, timesteps)
+        else:
+            w = self._redistribute(w, timesteps)
+        return to_sparse(A.shape[0], edges, w, directed, like=A)
+
+    # step_rewire defers to full_rewire, which rewires matrices natively
+    _sparse_step_rewire = step_rewire
+
+    def _redistribute(self, w, timesteps):
+        m = len(w)
+        if m < 2:
+            return w
+        if timesteps == -1:
+            return self.rng.generator.dirichlet(np.ones(m)) * np.sum(w)
+        w_list = w.tolist()
+        alphas = self.rng.uniform(timesteps).tolist()
+        for a, i, j in zip(alphas, *_edge_pairs(self.rng, m, timesteps)):
+            w_sum = w_list[i] + w_list[j]
+            w_list[i] = a * w_sum
+            w_list[j] = (1 - a) * w_sum
+        return np.array(w_list)
+
+    def _cycle_redistribution(self, edges, n, directed, w, timesteps):
+        """
+        Strength-preserving moves: pick an edge a-b, a neighbour c of b and a
+        neighbour d of a; if c-d is an edge, shift a uniform amount of weight
+        from c-b and a-d to a-b and c-d, within the range that keeps all four
+        weights non-negative. Makes 10 * number of edges moves if
+        timesteps=-1.
+        """
+        if timesteps == -1:
+            timesteps = 10 * len(edges)
+
+        # edge index by ``u * n + v`` code, and in-/out-neighbour lists
+        index = {}
+        out_nbrs = [[] for _ in range(n)]
+        in_nbrs = [[] for _ in range(n)]
+        for e, (u, v) in enumerate(edges.tolist()):
+            index[u * n + v] = e
+            out_nbrs[u].append(v)
+            in_nbrs[v].append(u)
+            if not directed:
+                index[v * n + u] = e
+                out_nbrs[v].append(u)
+                in_nbrs[u].append(v)
+
+        us = edges[:, 0].tolist()
+        vs = edges[:, 1].tolist()
+        w_list = w.tolist()
+        rng = self.rng
+        m = len(us)
+
+        for _ in range(timesteps):
+            e_ab = rng.integers(m)
+            a, b = us[e_ab], vs[e_ab]
+            if not directed and rng.random() < 0.5:
+                a, b = b, a
+            if len(in_nbrs[b]) < 2 or len(out_nbrs[a]) < 2:
+                continue
+            c = rng.choice(in_nbrs[b])
+            d = rng.choice(out_nbrs[a])
+            if c == a or d == b or c == d:
+                continue
+            e_cd = index.get(c * n + d)
+            if e_cd is None:
+                continue
+            e_cb = index[c * n + b]
+            e_ad = index[a * n + d]
+            if len({e_ab, e_cd, e_cb, e_ad}) < 4:
+                continue
+
+            low = -min(w_list[e_ab], w_list[e_cd])
+            high = min(w_list[e_cb], w_list[e_ad])
+            shift = low + rng.random() * (high - low)
+            w_list[e_ab] += shift
+            w_list[e_cd] += shift
+            w_list[e_cb] -= shift
+            w_list[e_ad] -= shift
+
+        return np.maximum(np.array(w_list), 0)
@@ -0,0 +1,127 @@
+import random
+import numpy as np
+
+
+class BlockRNG:
+    """
+    Per-instance random number stream used by the rewirers.
+
+    Wraps a ``numpy.random.Generator`` and serves scalar draws from blocks of
+    pre-drawn uniforms, so hot loops don't pay the cost of one generator call
+    per random number. Every rewirer owns its own stream, which keeps runs
+    reproducible without touching the global ``random`` / ``np.random`` state
+    and makes it safe to run several rewirers in parallel.
+
+    Independent child streams for ensembles are obtained with ``spawn``.
+
+    Parameters
+    ----------
+    seed : None, int, array_like, SeedSequence, Generator or BlockRNG
+        Seed for the stream. ``None`` draws fresh entropy from the OS. A
+        ``Generator`` is used as is, and a ``BlockRNG`` shares its generator.
+        Whether the stream was seeded explicitly is kept in ``seeded``, and
+        is inherited by spawned children.
+    block_size : int, default: 1024
+        Number of uniforms drawn at once when the block runs out.
+    """
+
+    def __init__(self, seed=None, block_size=1024):
+        if isinstance(seed, BlockRNG):
+            self.seed_seq = seed.seed_seq
+            self.generator = seed.generator
+            self.seeded = seed.seeded
+        elif isinstance(seed, np.random.Generator):
+            self.seed_seq = None
+            self.generator = seed
+            self.seeded = False
+        else:
+            self.seeded = seed is not None
+            if not isinstance(seed, np.random.SeedSequence):
+                seed = np.random.SeedSequence(seed)
+            self.seed_seq = seed
+            self.generator = np.random.default_rng(seed)
+
+        self.block_size = block_size
+        self._block = []
+        self._pos = 0
+
+    def _refill(self):
+        self._block = self.generator.random(self.block_size).tolist()
+        self._pos = 0
+
+    def random(self):
+        """Return the next uniform float in [0, 1)."""
+        if self._pos >= len(self._block):
+            self._refill()
+        u = self._block[self._pos]
+        self._pos += 1
+        return u
+
+    def integers(self, high):
+        """Return a uniform integer in [0, high)."""
+        return min(int(self.random() * high), high - 1)
+
+    def choice(self, seq):
+        """Return a uniformly chosen element of the sequence ``seq``."""
+        if len(seq) == 0:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.integers(len(seq))]
+
+    def choices(self, population, weights=None, k=1):
+        """Drop-in replacement for ``random.choices``."""
+        if weights is None:
+            return [self.choice(population) for _ in range(k)]
+        cum_weights = np.cumsum(weights)
+        total = cum_weights[-1]
+        hi = len(population) - 1
+        return [
+            population[
+                min(
+                    int(np.searchsorted(cum_weights, self.random() * total, "right")),
+                    hi,
+                )
+            ]
+            for _ in range(k)
+        ]
+
+    def sample(self, seq, k):
+        """Return ``k`` distinct elements of ``seq``, like ``random.sample``."""
+        idx = self.generator.choice(len(seq), size=k, replace=False)
+        return [seq[i] for i in idx]
+
+    def uniform(self, size):
+        """Return an array of ``size`` uniforms in [0, 1)."""
+        return self.generator.random(size)
+
+    def shuffle(self, x):
+        """Shuffle the mutable sequence ``x`` in place."""
+        self.generator.shuffle(x)
+
+    def permutation(self, x):
+        """Return a permuted copy of ``x`` (or of ``range(x)`` for an int)."""
+        return self.generator.permutation(x)
+
+    def python_random(self):
+        """
+        Return a ``random.Random`` seeded from this stream, for third-party
+        functions (e.g. networkx) that expect a Python RNG as ``seed``.
+        """
+        return random.Random(int(self.generator.integers(2**63)))
+
+    def spawn(self, n):
+        """
+        Return ``n`` independent child streams.
+
+        Children of a seeded stream are fully determined by the parent seed
+        and their position, so ensembles built from them are reproducible
+        regardless of how they are scheduled.
+        """
+        if self.seed_seq is None:
+            # generator-backed streams derive a seed sequence from their state
+            self.seed_seq = np.random.SeedSequence(
+                self.generator.integers(2**63, size=4)
+            )
+        children = [BlockRNG(s, self.block_size) for s in self.seed_seq.spawn(n)]
+        for child in children:
+            child.seeded = self.seeded
+        return children
@@ -1,7 +1,6 @@
 import networkx as nx
 import numpy as np
 from operator import itemgetter
-import random
 import copy
 from .base import BaseRewirer
 import warnings
@@ -32,21 +31,18 @@ class RobustRewirer(BaseRewirer):
             added_edges = {}
 
         for t in range(timesteps):
-            A = nx.adjacency_matrix(G)
+            # neighbours are read from the adjacency view, without building
+            # an adjacency matrix at every step
             degree_list = G.degree
 
             neighbors = []
-            for i in range(len(degree_list)):
-                sorted_degrees = sorted(
-                    list(degree_list(np.nonzero(A[i, :])[1])), key=itemgetter(1)
-                )
+            for i in G:
+                sorted_degrees = sorted(list(degree_list(G[i])), key=itemgetter(1))
                 if len(sorted_degrees) > 1:
                     if sorted_degrees[-2][1] > 1 and sorted_degrees[-1][1] > 1:
                         neighbors.append(i)
-            index_i = neighbors[random.randint(0, len(neighbors) - 1)]
-            sorted_degrees_i = sorted(
-                list(degree_list(np.nonzero(A[index_i, :])[1])), key=itemgetter(1)
-            )
+            index_i = self.rng.choice(neighbors)
+            sorted_degrees_i = sorted(list(degree_list(G[index_i])), key=itemgetter(1))
 
             min_degree = sorted_degrees_i[0][1]
             max_degree = sorted_degrees_i[-1][1]
@@ -60,24 +56,23 @@ class RobustRewirer(BaseRewirer):
                 if item[1] == max_degree:
                     k.append(item[0])
 
-            index_j = j[random.randint(0, len(j) - 1)]
-            index_k = k[random.randint(0, len(k) - 1)]
+            index_j = self.rng.choice(j)
+            index_k = self.rng.choice(k)
 
-            m = sorted(
-                list(degree_list(np.nonzero(A[index_j, :])[1])), key=itemgetter(1)
-            )
-            n = sorted(
-                list(degree_list(np.nonzero(A[index_k, :])[1])), key=itemgetter(1)
-            )
+            m = sorted(list(degree_list(G[index_j])), key=itemgetter(1))
+            n = sorted(list(degree_list(G[index_k])), key=itemgetter(1))
 
-            index_m = m[random.randint(0, len(m) - 1)][0]
-            index_n = n[random.randint(0, len(n) - 1)][0]
+            index_m = self.rng.choice(m)[0]
+            index_n = self.rng.choice(n)[0]
 
             if len(np.unique([index_i, index_j, index_k, index_m, index_n])) == 5:
                 G.remove_edge(index_j, index_m)
                 G.remove_edge(index_k, index_n)
                 G.add_edge(index_k, index_j)
                 G.add_edge(index_m, index_n)
+                if verbose:
+                    removed_edges[t] = [(index_j, index_m), (index_k, index_n)]
+                    added_edges[t] = [(index_k, index_j), (index_m, index_n)]
 
         if verbose:
             return G, removed_edges, added_edges
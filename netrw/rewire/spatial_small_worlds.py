@@ -1,6 +1,6 @@
 import networkx as nx
 import numpy as np
-import random
+import warnings
 import copy
 from .base import BaseRewirer
 
@@ -54,13 +54,13 @@ class SpatialSmallWorld(BaseRewirer):
                     else:
                         edge_p = [(dists[0]**2 + dists[1]**2 + dists[2]**2)**(1/2) for dists in edge_p]
                     unique_lengths = np.unique(edge_p)
-                randomVal = random.choices(
+                randomVal = self.rng.choices(
                   unique_lengths, weights=(1 / np.power(unique_lengths,(alpha))), k=1)
                 indices = list(np.where(np.array(edge_p) == randomVal)[0])
-                randomList = random.choices(
+                randomList = self.rng.choices(
                   [non_edge_list[i] for i in indices], k=1)
                 edge_list = list(G.edges())
-                rand_edge = edge_list[random.randint(0,len(edge_list)-1)]
+                rand_edge = self.rng.choice(edge_list)
                 if does_remove:
                     G.remove_edge(rand_edge[0],rand_edge[1])
                 G.add_edge(randomList[0][0],randomList[0][1])
@@ -77,13 +77,13 @@ class SpatialSmallWorld(BaseRewirer):
                     else:
                         edge_p = [(dists[0]**2 + dists[1]**2)**(1/2) for dists in edge_p]
                     unique_lengths = np.unique(edge_p)
-                randomVal = random.choices(
+                randomVal = self.rng.choices(
                   unique_lengths, weights=(1 / np.power(unique_lengths,(alpha))), k=1)
                 indices = list(np.where(np.array(edge_p) == randomVal)[0])
-                randomList = random.choices(
+                randomList = self.rng.choices(
                   [non_edge_list[i] for i in indices], k=1)
                 edge_list = list(G.edges())
-                rand_edge = edge_list[random.randint(0,len(edge_list)-1)]
+                rand_edge = self.rng.choice(edge_list)
                 if does_remove:
                     G.remove_edge(rand_edge[0],rand_edge[1])
                 G.add_edge(randomList[0][0],randomList[0][1])
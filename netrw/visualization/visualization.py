@@ -1,16 +1,234 @@
+import weakref
 import networkx as nx
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
+from matplotlib.path import Path
+from ..rewire.edge_array import edge_keys
 
+# layouts already computed, per graph and layout method
+_layouts = weakref.WeakKeyDictionary()
 
-def visualize_rewiring(G1, G2, pos):
-    A1 = nx.adjacency_matrix(G1)
-    A2 = nx.adjacency_matrix(G2)
-    A_dif = abs(A2 - A1)
-    G3 = nx.Graph(A_dif)
-    nx.draw(G3, pos, edge_color="r", node_color="b", node_size=0, width=8)
-    nx.draw(G2, pos, edge_color="b", node_color="b", node_size=80, width=5)
+
+def layout(G, method=nx.kamada_kawai_layout, **kwargs):
+    """
+    Node positions of G, computed once per graph and layout method.
+
+    Rewiring keeps the nodes of a graph, so one layout serves every step of
+    a trajectory. The layout is only recomputed if the nodes of G change
+    or for other keyword arguments, which are passed to ``method``.
+    """
+    cached = _layouts.setdefault(G, {})
+    key = (method, repr(sorted(kwargs.items())))
+    pos = cached.get(key)
+    if pos is None or len(pos) != len(G) or any(u not in pos for u in G):
+        pos = cached[key] = method(G, **kwargs)
+    return pos
+
+
+def _indexed_edges(G, index):
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64)
+    return edges.reshape(-1, 2)
+
+
+def edge_diff(G1, G2):
+    """
+    Edges removed and added by rewiring G1 into G2.
+
+    The edge sets are compared as sorted integer codes, without building
+    adjacency matrices or a difference graph.
+
+    Returns
+    -------
+    removed : list of edges of G1 that are not in G2
+    added : list of edges of G2 that are not in G1
+    """
+    nodes = list(G1) + [u for u in G2 if u not in G1]
+    index = {u: i for i, u in enumerate(nodes)}
+    n = len(nodes)
+    directed = G1.is_directed()
+
+    edges1 = _indexed_edges(G1, index)
+    edges2 = _indexed_edges(G2, index)
+    codes1 = edge_keys(edges1, n, directed)
+    codes2 = edge_keys(edges2, n, directed)
+    removed = edges1[~np.isin(codes1, codes2)].tolist()
+    added = edges2[~np.isin(codes2, codes1)].tolist()
+    return (
+        [(nodes[u], nodes[v]) for u, v in removed],
+        [(nodes[u], nodes[v]) for u, v in added],
+    )
+
+
+def visualize_rewiring(G1, G2, pos=None, ax=None):
+    """
+    Draw G2 with the edges that differ from G1 (removed and added)
+    highlighted in red. By default the nodes are placed with the cached
+    layout of G1.
+    """
+    if pos is None:
+        pos = layout(G1)
+    removed, added = edge_diff(G1, G2)
+    nx.draw_networkx_edges(
+        G2, pos, edgelist=removed + added, ax=ax, edge_color="r", width=8
+    )
+    nx.draw(G2, pos, ax=ax, edge_color="b", node_color="b", node_size=80, width=5)
 
 
 def visualize_graph(G, pos):
     nx.draw(G, pos, edge_color="b", node_color="b", node_size=80, width=5)
+
+
+def rewiring_frames(G, rewirer, frames=100, steps_per_frame=1, **rewire_kwargs):
+    """
+    Run a rewiring trajectory and yield it frame by frame.
+
+    Parameters
+    ----------
+    G : networkx graph
+        The initial graph, which is copied once and not modified.
+    rewirer : netrw rewire object
+        A rewiring method instance with a ``step_rewire`` method.
+    frames : int, default: 100
+        Number of frames after the initial graph.
+    steps_per_frame : int, default: 1
+        Rewiring steps between two frames.
+    **rewire_kwargs
+        Passed to ``step_rewire``.
+
+    Yields
+    ------
+    edges : numpy array of shape (m, 2)
+        The edges of the current graph, as indices into ``list(G)``.
+    added : numpy array of shape (k, 2)
+        The edges added since the previous frame (none for the first).
+    removed : numpy array of shape (l, 2)
+        The edges removed since the previous frame.
+    """
+    index = {u: i for i, u in enumerate(G)}
+    n = len(index)
+    directed = G.is_directed()
+    H = G.copy()
+
+    edges = _indexed_edges(H, index)
+    codes = edge_keys(edges, n, directed)
+    yield edges, edges[:0], edges[:0]
+    for _ in range(frames):
+        for _ in range(steps_per_frame):
+            H = rewirer.step_rewire(H, copy_graph=False, **rewire_kwargs)
+        previous, previous_codes = edges, codes
+        edges = _indexed_edges(H, index)
+        codes = edge_keys(edges, n, directed)
+        yield (
+            edges,
+            edges[~np.isin(codes, previous_codes)],
+            previous[~np.isin(previous_codes, codes)],
+        )
+
+
+def animate_rewiring(
+    G,
+    rewirer,
+    frames=100,
+    steps_per_frame=1,
+    pos=None,
+    ax=None,
+    interval=50,
+    node_size=10,
+    node_color="b",
+    edge_color=".5",
+    highlight_color="r",
+    width=1,
+    **rewire_kwargs
+):
+    """
+    Animate a rewiring trajectory of G.
+
+    The nodes are drawn once, and the edges are two LineCollections, one
+    for all edges and one for the edges added since the previous frame.
+    Every frame only replaces the segments of the edges that changed, in
+    the slots of the edges they replace. The frames come from
+    ``rewiring_frames``, so the trajectory is rewired while the animation
+    is shown or saved, one frame at a time, and no frame is kept in memory.
+
+    Parameters
+    ----------
+    G : networkx graph
+    rewirer : netrw rewire object
+        A rewiring method instance with a ``step_rewire`` method.
+    frames : int, default: 100
+        Number of frames after the initial graph.
+    steps_per_frame : int, default: 1
+        Rewiring steps between two frames.
+    pos : dict, optional
+        Node positions, by default the cached Kamada-Kawai layout of G.
+    ax : matplotlib axes, optional
+    interval : int, default: 50
+        Delay between frames in milliseconds.
+    **rewire_kwargs
+        Passed to ``step_rewire``.
+
+    Returns
+    -------
+    anim : matplotlib.animation.FuncAnimation
+        Show it, or write it with ``anim.save(filename)``.
+    """
+    if pos is None:
+        pos = layout(G)
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        fig = ax.figure
+
+    xy = np.array([pos[u] for u in G], dtype=float).reshape(-1, 2)
+    ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=node_color, zorder=3)
+    ax.set_axis_off()
+    all_edges = LineCollection([], colors=edge_color, linewidths=width, zorder=1)
+    new_edges = LineCollection(
+        [], colors=highlight_color, linewidths=2 * width, zorder=2
+    )
+    ax.add_collection(all_edges)
+    ax.add_collection(new_edges)
+
+    n = len(xy)
+    directed = G.is_directed()
+    # segment slot of every edge code drawn in all_edges
+    slots = {}
+
+    def init():
+        slots.clear()
+        all_edges.set_segments([])
+        new_edges.set_segments([])
+        return all_edges, new_edges
+
+    def update(frame):
+        edges, added, removed = frame
+        if slots and len(added) == len(removed):
+            paths = all_edges.get_paths()
+            old = edge_keys(removed, n, directed).tolist()
+            new = edge_keys(added, n, directed).tolist()
+            for code, new_code, edge in zip(old, new, added):
+                k = slots.pop(code)
+                slots[new_code] = k
+                paths[k] = Path(xy[edge])
+            all_edges.stale = True
+        else:
+            all_edges.set_segments(xy[edges])
+            slots.clear()
+            slots.update(zip(edge_keys(edges, n, directed).tolist(), range(len(edges))))
+        new_edges.set_segments(xy[added])
+        return all_edges, new_edges
+
+    return FuncAnimation(
+        fig,
+        update,
+        frames=lambda: rewiring_frames(
+            G, rewirer, frames, steps_per_frame, **rewire_kwargs
+        ),
+        init_func=init,
+        interval=interval,
+        blit=True,
+        save_count=frames + 1,
+        cache_frame_data=False,
+    )
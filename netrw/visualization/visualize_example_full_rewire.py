@@ -1,4 +1,7 @@
+import networkx as nx
 import matplotlib.pyplot as plt
+from ..rewire import LocalEdgeRewiring
+from .visualization import layout
 
 plt.rcParams["figure.facecolor"] = "white"
 plt.rcParams["axes.facecolor"] = "white"
@@ -14,6 +17,7 @@ def visualize_example_full_rewire(
     save_fig=False,
     save_fig_folder="",
     save_fig_filename="",
+    seed=None,
 ):
     """
     This is a useful function for visualizing outputs from repeated runs of
@@ -41,6 +45,8 @@ def visualize_example_full_rewire(
         If the user wants to name the saved figure something different than
         just the name of the rewiring technique. Additionally, if the filetype
         is not specified, it defaults to .png
+    seed (int)
+        Seed for the rewiring technique.
 
     Returns
     -------
@@ -85,13 +91,15 @@ def visualize_example_full_rewire(
         fontsize="xx-large",
     )
 
+    rw = RewiringTechnique(seed=seed)
+
     for ix, G0 in enumerate(list_of_graphs):
 
-        pos = nx.kamada_kawai_layout(G0)
+        pos = layout(G0)
         G = G0.copy()
 
         for _ in range(timesteps):
-            G = RewiringTechnique().step_rewire(G)
+            G = rw.step_rewire(G, copy_graph=False)
 
         # draw original network
         nx.draw_networkx_nodes(
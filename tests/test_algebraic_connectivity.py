@@ -0,0 +1,43 @@
+import networkx as nx
+import pytest
+from netrw.rewire import AlgebraicConnectivity
+
+
+@pytest.mark.parametrize("batch", [1, 4])
+def test_batch(batch):
+    G = nx.connected_watts_strogatz_graph(40, 4, 0.1, seed=1)
+    H, removed, added = AlgebraicConnectivity(seed=1).full_rewire(
+        G, timesteps=12, verbose=True, batch=batch
+    )
+    assert nx.is_connected(H)
+    assert H.number_of_edges() == G.number_of_edges()
+    assert sorted(removed) == sorted(added) == list(range(12))
+    assert nx.algebraic_connectivity(
+        H, method="tracemin_lu"
+    ) > nx.algebraic_connectivity(G, method="tracemin_lu")
+
+    if batch > 1:
+        # edges rewired together share no nodes
+        first = [e for t in range(batch) for e in added[t]]
+        assert len({u for e in first for u in e}) == 2 * len(first)
+
+    with pytest.raises(ValueError):
+        AlgebraicConnectivity().full_rewire(G, batch=0)
+
+
+def test_batch_saves_eigensolves():
+    """A batch that shrinks grows back, so fewer Fiedler vectors are needed."""
+
+    class Counting(AlgebraicConnectivity):
+        calls = 0
+
+        def fiedler(self, G, nodes):
+            Counting.calls += 1
+            return super().fiedler(G, nodes)
+
+    G = nx.connected_watts_strogatz_graph(100, 6, 0.1, seed=1)
+    H = Counting(seed=1).full_rewire(G, timesteps=90, batch=16)
+    assert Counting.calls < 90 / 4
+    assert nx.algebraic_connectivity(
+        H, method="tracemin_lu"
+    ) > nx.algebraic_connectivity(G, method="tracemin_lu")
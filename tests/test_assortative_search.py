@@ -0,0 +1,78 @@
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.rewire import (
+    AssortativityLocalMaximum,
+    AssortativityLocalMinimum,
+    best_first_assortative_swap,
+    to_edge_array,
+)
+from netrw.rewire.assortative_tempering import assortativity_terms
+
+
+def _improving_swap(edges, n, directed, sign):
+    """Any valid swap of two edges that increases sign * S, by brute force."""
+    x, y, _, _, _ = assortativity_terms(edges, n, directed)
+    present = set(map(tuple, edges.tolist()))
+    if not directed:
+        present |= {(v, u) for u, v in present}
+    edges = edges.tolist()
+    for i, (a, b) in enumerate(edges):
+        for u, v in edges[i + 1 :]:
+            options = [((a, v), (u, b))]
+            if not directed:
+                options.append(((a, u), (b, v)))
+            for new in options:
+                (p, q), (r, s) = new
+                if p == q or r == s or (p, q) == (r, s) or (p, q) == (s, r):
+                    continue
+                if (p, q) in present or (r, s) in present:
+                    continue
+                gain = x[p] * y[q] + x[r] * y[s] - x[a] * y[b] - x[u] * y[v]
+                if sign * gain > 0:
+                    return new
+    return None
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("maximize", [False, True])
+def test_local_optimum(directed, maximize):
+    """The search stops where no valid swap improves the assortativity."""
+    G = nx.gnm_random_graph(40, 100, seed=4, directed=directed)
+    nodes, edges = to_edge_array(G)
+    new, swaps = best_first_assortative_swap(
+        edges, len(nodes), directed, maximize, seed=1
+    )
+    assert len(swaps) > 0
+    assert _improving_swap(new, len(nodes), directed, 1 if maximize else -1) is None
+
+    x0, y0, _, _, _ = assortativity_terms(edges, len(nodes), directed)
+    x1, y1, _, _, _ = assortativity_terms(new, len(nodes), directed)
+    assert np.array_equal(x0, x1) and np.array_equal(y0, y1)
+    assert len(set(map(tuple, new.tolist()))) == len(new)
+
+
+def test_full_rewire():
+    G = nx.barabasi_albert_graph(60, 2, seed=3)
+    r = nx.degree_assortativity_coefficient
+    H, removed, added = AssortativityLocalMaximum(seed=1).full_rewire(G, verbose=True)
+    assert dict(H.degree()) == dict(G.degree())
+    assert r(H) > r(G)
+    assert len(removed) == len(added) > 0
+
+    L = AssortativityLocalMinimum(seed=1).full_rewire(G, timesteps=50)
+    assert dict(L.degree()) == dict(G.degree())
+    assert r(L) < r(G)
+
+    with pytest.raises(ValueError):
+        AssortativityLocalMaximum().full_rewire(G, search="random")
+
+
+@pytest.mark.parametrize("maximize, bound", [(False, 2000), (True, 2 * 10**6)])
+def test_attempts(maximize, bound):
+    """The search of a mid-sized BA graph ends within a bounded cost."""
+    G = nx.barabasi_albert_graph(500, 3, seed=1)
+    nodes, edges = to_edge_array(G)
+    _, swaps = best_first_assortative_swap(edges, len(nodes), False, maximize, seed=1)
+    assert len(swaps) < len(edges)
+    assert swaps[-1][0] < bound
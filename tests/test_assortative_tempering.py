@@ -0,0 +1,47 @@
+import networkx as nx
+import pytest
+from netrw.rewire import AssortativityParallelTempering
+
+
+def test_target_is_approached():
+    G = nx.barabasi_albert_graph(100, 3, seed=1)
+    r = nx.degree_assortativity_coefficient
+    H = AssortativityParallelTempering(seed=1).full_rewire(G, target=0.1, tol=1e-2)
+    assert abs(r(H) - 0.1) < 1e-2
+    assert abs(r(G) - 0.1) > 0.1
+
+    low = AssortativityParallelTempering(seed=1).full_rewire(
+        G, maximize=False, timesteps=3000
+    )
+    assert r(low) < r(G) - 0.1
+
+
+def test_directed_degrees_and_edge_data():
+    """In- and out-degrees are preserved and edge data follows the edges."""
+    G = nx.gnm_random_graph(60, 240, seed=2, directed=True)
+    for i, (u, v) in enumerate(G.edges()):
+        G.edges[u, v]["weight"] = i
+    H = AssortativityParallelTempering(seed=1).full_rewire(G, timesteps=2000)
+
+    assert H.is_directed()
+    assert dict(H.in_degree()) == dict(G.in_degree())
+    assert dict(H.out_degree()) == dict(G.out_degree())
+    assert set(H.edges()) != set(G.edges())
+    assert not any(u == v for u, v in H.edges())
+    weights = sorted(w for _, _, w in H.edges(data="weight"))
+    assert weights == list(range(240))
+    r = nx.degree_pearson_correlation_coefficient
+    assert r(H, x="out", y="in") > r(G, x="out", y="in")
+
+
+@pytest.mark.parametrize("target", [None, 0.2])
+def test_n_jobs_does_not_change_the_result(target):
+    G = nx.barabasi_albert_graph(80, 2, seed=3)
+    runs = [
+        AssortativityParallelTempering(seed=5).full_rewire(
+            G, target=target, timesteps=2000, exchange_every=200, n_jobs=n_jobs
+        )
+        for n_jobs in (None, 2)
+    ]
+    assert dict(runs[0].degree()) == dict(G.degree())
+    assert sorted(runs[0].edges()) == sorted(runs[1].edges())
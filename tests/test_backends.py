@@ -0,0 +1,62 @@
+import networkx as nx
+import pytest
+import scipy.sparse as sp
+from netrw.rewire import BaseRewirer, DirectedEdgeSwap, KarrerRewirer, NetworkXEdgeSwap
+
+
+def test_capabilities():
+    """Subclasses override only the capabilities that differ."""
+    assert NetworkXEdgeSwap.capabilities["degree_preserving"]
+    assert not NetworkXEdgeSwap.capabilities["directed"]
+    assert KarrerRewirer.capabilities["multigraph"]
+    assert not KarrerRewirer.capabilities["degree_preserving"]
+    assert set(DirectedEdgeSwap.capabilities) == set(BaseRewirer.capabilities)
+
+    assert NetworkXEdgeSwap.supports(nx.path_graph(4))
+    assert not NetworkXEdgeSwap.supports(nx.path_graph(4, create_using=nx.DiGraph))
+    assert not NetworkXEdgeSwap.supports(nx.MultiGraph(nx.path_graph(4)))
+    assert DirectedEdgeSwap.supports(sp.csr_array([[0, 1], [0, 0]]))
+
+
+def test_dispatch():
+    """Simple graphs go to the array backend, others to networkx."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    names = [b.name for b in NetworkXEdgeSwap.backends("full_rewire")]
+    assert names == ["sparse", "array", "parallel"]
+
+    H = NetworkXEdgeSwap(seed=2).full_rewire(G, timesteps=100)
+    again = NetworkXEdgeSwap(seed=2).full_rewire(G, timesteps=100, backend="array")
+    assert set(H.edges()) == set(again.edges())
+    assert dict(H.degree()) == dict(G.degree())
+
+    reference = NetworkXEdgeSwap(seed=2).full_rewire(
+        G, timesteps=100, backend="networkx"
+    )
+    assert dict(reference.degree()) == dict(G.degree())
+    M = NetworkXEdgeSwap(seed=2).full_rewire(nx.MultiGraph(G), timesteps=100)
+    assert M.is_multigraph()
+
+    with pytest.raises(ValueError):
+        NetworkXEdgeSwap(seed=2).full_rewire(G, timesteps=100, backend="parallel")
+
+
+def test_register_backend():
+    """Backends of a subclass come before those of its parents."""
+
+    class Rewirer(NetworkXEdgeSwap):
+        pass
+
+    calls = []
+
+    @Rewirer.register_backend(
+        "full_rewire", "tiny", lambda self, G, **kwargs: len(G) < 10
+    )
+    def tiny(self, G, **kwargs):
+        calls.append(len(G))
+        return G
+
+    G = nx.path_graph(5)
+    assert Rewirer(seed=1).full_rewire(G) is G
+    Rewirer(seed=1).full_rewire(nx.path_graph(20), timesteps=5)
+    assert calls == [5]
+    assert [b.name for b in NetworkXEdgeSwap.backends("full_rewire")][0] == "sparse"
@@ -0,0 +1,89 @@
+import networkx as nx
+from netrw.rewire import GlobalRewiring, RewireCache
+
+
+def test_cache_hit_matches_rewire(tmp_path):
+    """A cached result equals the uncached result for the same seed."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    cache = RewireCache(str(tmp_path))
+
+    expected = GlobalRewiring(seed=5).full_rewire(G, p=1, timesteps=50)
+    first = GlobalRewiring(seed=5, cache=cache)(G, p=1, timesteps=50)
+    second = GlobalRewiring(seed=5, cache=cache)(G, p=1, timesteps=50)
+
+    assert sorted(first.edges()) == sorted(expected.edges())
+    assert sorted(second.edges()) == sorted(expected.edges())
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_cache_eviction(tmp_path):
+    """The cache evicts results once it grows over its size limit."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    cache = RewireCache(str(tmp_path))
+
+    for seed in range(3):
+        GlobalRewiring(seed=seed, cache=cache)(G, p=1, timesteps=10)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    cache.max_bytes = cache.size // 2
+    cache.evict()
+    assert 0 < len(list(tmp_path.iterdir())) < 3
+
+
+def test_warm_cache_matches_cold_cache(tmp_path):
+    """Successive calls of a rewirer give the same graphs with a warm cache."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    cache = RewireCache(str(tmp_path))
+
+    def run(cache):
+        rewirer = GlobalRewiring(seed=5, cache=cache)
+        H = G.copy()
+        graphs = [rewirer(G, p=1, timesteps=20) for _ in range(3)]
+        # copy_graph=False rewires H in place, from the cache or not
+        assert rewirer(H, p=1, timesteps=20, copy_graph=False) is H
+        return [sorted(g.edges()) for g in graphs + [H]]
+
+    uncached = run(None)
+    cold = run(cache)
+    warm = run(cache)
+    assert cold == uncached
+    assert warm == uncached
+    assert uncached[0] != uncached[1]
+
+
+def test_cache_hit_in_place(tmp_path):
+    """A hit with copy_graph=False rewires G itself, as an uncached call."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    cache = RewireCache(str(tmp_path))
+    expected = GlobalRewiring(seed=5).full_rewire(G, p=1, timesteps=50)
+
+    GlobalRewiring(seed=5, cache=cache)(G, p=1, timesteps=50)
+    H = G.copy()
+    result = GlobalRewiring(seed=5, cache=cache)(H, p=1, timesteps=50, copy_graph=False)
+    assert result is H
+    assert sorted(H.edges()) == sorted(expected.edges())
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_cache_positional_call(tmp_path):
+    """Positional arguments after G are bound to the rewirer's signature."""
+    G = nx.gnm_random_graph(50, 150, seed=1)
+    cache = RewireCache(str(tmp_path))
+    expected = GlobalRewiring(seed=5).full_rewire(G, 1, 20)
+
+    first = GlobalRewiring(seed=5, cache=cache)(G, 1, 20)
+    second = GlobalRewiring(seed=5, cache=cache)(G, p=1, timesteps=20)
+    assert sorted(first.edges()) == sorted(expected.edges())
+    assert sorted(second.edges()) == sorted(expected.edges())
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_cache_node_attributes(tmp_path):
+    """Graphs that differ only in node attributes do not share a result."""
+    from netrw.rewire.cache import graph_hash
+
+    G = nx.gnm_random_graph(20, 40, seed=1)
+    H = G.copy()
+    nx.set_node_attributes(H, {u: (u, 0.5) for u in H}, "pos")
+    assert graph_hash(G) != graph_hash(H)
+    assert graph_hash(H) == graph_hash(H.copy())
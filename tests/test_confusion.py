@@ -0,0 +1,55 @@
+import copy
+import networkx as nx
+import numpy as np
+from netrw.analysis.confusion import rewiring_distance_confusion_matrix
+from netrw.rewire import BaseRewirer
+
+
+class Identity(BaseRewirer):
+    def full_rewire(self, G, timesteps=-1):
+        return copy.deepcopy(G)
+
+
+class DropEdges(BaseRewirer):
+    """Remove ``timesteps`` random edges."""
+
+    def full_rewire(self, G, timesteps=-1):
+        G = copy.deepcopy(G)
+        G.remove_edges_from(self.rng.sample(list(G.edges()), timesteps))
+        return G
+
+
+class EdgeCountDistance:
+    def __call__(self, G1, G2):
+        return abs(G1.number_of_edges() - G2.number_of_edges())
+
+
+class JaccardDistance:
+    def __call__(self, G1, G2):
+        E1, E2 = set(G1.edges()), set(G2.edges())
+        return 1 - len(E1 & E2) / len(E1 | E2)
+
+
+class DegreeDistance:
+    def __call__(self, G1, G2):
+        return sum((G1.degree(u) - G2.degree(u)) ** 2 for u in G1)
+
+
+def test_confusion_matrix():
+    G = nx.gnm_random_graph(30, 60, seed=1)
+    methods = [Identity, DropEdges]
+    distances = [EdgeCountDistance, JaccardDistance, DegreeDistance]
+    C = rewiring_distance_confusion_matrix(
+        G, methods, distances, timesteps=6, ensemble_size=4, seed=1
+    )
+
+    assert C.shape == (2, 3)
+    assert np.array_equal(C[0], [0, 0, 0])
+    assert np.allclose(C[1, :2], [6, 6 / 60])
+    # squared degree changes of 6 removed edges, between 6 and 24 per sample
+    assert 12 <= C[1, 2] <= 24
+
+    parallel = rewiring_distance_confusion_matrix(
+        G, methods, distances, timesteps=6, ensemble_size=4, seed=1, n_jobs=2
+    )
+    assert np.array_equal(parallel, C)
@@ -0,0 +1,56 @@
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.analysis.distributions import (
+    integrated_autocorrelation_time,
+    sample_property_distribution,
+    split_rhat,
+)
+from netrw.rewire import GlobalRewiring
+
+
+def test_autocorrelation_time_of_ar1():
+    """tau of an AR(1) chain with coefficient phi is (1 + phi) / (1 - phi)."""
+    rng = np.random.default_rng(1)
+    phi = 0.8
+    noise = rng.normal(size=200000)
+    x = np.zeros_like(noise)
+    for t in range(1, len(x)):
+        x[t] = phi * x[t - 1] + noise[t]
+    tau = integrated_autocorrelation_time(x)
+    assert tau == pytest.approx((1 + phi) / (1 - phi), rel=0.1)
+
+    assert integrated_autocorrelation_time(rng.normal(size=10000)) == pytest.approx(
+        1, abs=0.1
+    )
+
+
+def test_split_rhat():
+    rng = np.random.default_rng(1)
+    chains = rng.normal(size=(4, 1000))
+    assert split_rhat(chains) == pytest.approx(1, abs=0.01)
+    shifted = chains + np.arange(4)[:, None]
+    assert split_rhat(shifted) > 1.5
+
+
+def test_samples_do_not_depend_on_n_jobs():
+    G = nx.watts_strogatz_graph(30, 4, 0.1, seed=1)
+    runs = []
+    for n_jobs in (1, 2):
+        with pytest.warns(UserWarning):
+            samples, diagnostics = sample_property_distribution(
+                G,
+                GlobalRewiring,
+                nx.average_clustering,
+                n_chains=2,
+                check_every=20,
+                max_steps=40,
+                n_jobs=n_jobs,
+                seed=1,
+                p=1,
+            )
+        assert not diagnostics["converged"]
+        assert diagnostics["burn_in"] < diagnostics["steps"]
+        runs.append(samples)
+    assert len(runs[0]) > 0
+    assert np.array_equal(runs[0], runs[1])
@@ -0,0 +1,64 @@
+import os
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.rewire import (
+    NetworkXEdgeSwap,
+    load_edge_list,
+    read_edge_file,
+    to_edge_array,
+    to_sparse,
+    write_edge_file,
+)
+
+
+def test_edge_file(tmp_path):
+    G = nx.gnm_random_graph(100, 300, seed=1, directed=True)
+    _, edges = to_edge_array(G)
+    weights = np.linspace(0, 1, len(edges))
+    path = str(tmp_path / "edges.bin")
+
+    write_edge_file(path, edges, weights=weights, directed=True, block_size=64)
+    loaded, loaded_weights, n, directed = read_edge_file(path)
+    assert isinstance(loaded, np.memmap) and loaded.dtype == np.int32
+    assert np.array_equal(loaded, edges)
+    assert np.allclose(loaded_weights, weights)
+    assert n == 100 and directed
+
+    write_edge_file(path, edges, n=200, dtype=np.int64)
+    loaded, loaded_weights, n, directed = read_edge_file(path, mode=None)
+    assert loaded.dtype == np.int64 and not isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, edges)
+    assert loaded_weights is None and n == 200 and not directed
+
+    with open(path, "r+b") as f:
+        f.write(b"NOTNETRW")
+    with pytest.raises(ValueError):
+        read_edge_file(path)
+    with pytest.raises(ValueError):
+        write_edge_file(path, edges, dtype=np.float32)
+    # node indices out of range(n) are rejected before the file is complete
+    for bad in ([[0, 1], [2, -1]], [[0, 1], [2, 5]]):
+        with pytest.raises(ValueError):
+            write_edge_file(path, np.array(bad), n=5, block_size=1)
+        assert not os.path.exists(path)
+
+
+def test_load_edge_list(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# source target weight\n10 30 0.5\n30 20 2\n\n20 10 1.5\n")
+    nodes, edges, weights = load_edge_list(str(path), weighted=True)
+    assert nodes.tolist() == [10, 20, 30]
+    assert edges.tolist() == [[0, 2], [2, 1], [1, 0]]
+    assert weights.tolist() == [0.5, 2, 1.5]
+
+    nodes, edges = load_edge_list(str(path), relabel=False)
+    assert len(nodes) == 31 and edges.tolist()[0] == [10, 30]
+
+    # the arrays go straight into the sparse backend of the rewirers
+    G = nx.gnm_random_graph(50, 150, seed=2)
+    np.savetxt(path, np.array(G.edges()) + 1, fmt="%d")
+    nodes, edges = load_edge_list(str(path))
+    A = to_sparse(len(nodes), edges)
+    B = NetworkXEdgeSwap(seed=1).full_rewire(A, timesteps=20)
+    assert np.array_equal(A.sum(axis=0), B.sum(axis=0))
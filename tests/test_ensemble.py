@@ -0,0 +1,75 @@
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.analysis.ensemble import (
+    ensemble_assortativity,
+    ensemble_degrees,
+    ensemble_edge_overlap,
+    ensemble_spectral_moments,
+    rewire_ensemble,
+)
+from netrw.rewire import NetworkXEdgeSwap, sample_null_models, to_edge_array
+
+
+def test_ensemble_metrics():
+    """Vectorized metrics match the per-sample networkx values."""
+    G = nx.barabasi_albert_graph(60, 3, seed=1)
+    n = G.number_of_nodes()
+    S = rewire_ensemble(G, NetworkXEdgeSwap, 4, seed=2, timesteps=50)
+    graphs = rewire_ensemble(G, NetworkXEdgeSwap, 4, seed=2, stacked=None, timesteps=50)
+
+    assert S.shape == (4 * n, 4 * n)
+    degrees = ensemble_degrees(S, n)
+    assert np.array_equal(degrees, np.tile([d for _, d in G.degree()], (4, 1)))
+
+    expected = [nx.degree_assortativity_coefficient(H) for H in graphs]
+    assert np.allclose(ensemble_assortativity(S, n), expected)
+
+    original = {frozenset(e) for e in G.edges()}
+    expected = [
+        len(original & {frozenset(e) for e in H.edges()}) / len(original)
+        for H in graphs
+    ]
+    assert np.allclose(ensemble_edge_overlap(S, G, n), expected)
+
+    moments = ensemble_spectral_moments(S, (2, 3, 4), n)
+    for H, row in zip(graphs, moments):
+        eigenvalues = np.linalg.eigvalsh(nx.to_numpy_array(H, nodelist=list(G)))
+        assert np.allclose(row, [np.mean(eigenvalues**p) for p in (2, 3, 4)])
+
+
+def test_ensemble_coo():
+    """The 3-D COO output gives the same metrics as the block matrix."""
+    G = nx.gnm_random_graph(40, 100, seed=3)
+    nodes, edges = to_edge_array(G)
+    n = len(nodes)
+    S, _ = sample_null_models(
+        edges, n, 3, spacing=50, burn_in=50, seed=4, stacked="csr"
+    )
+    try:
+        T = sample_null_models(
+            edges, n, 3, spacing=50, burn_in=50, seed=4, stacked="coo"
+        )[0]
+    except ValueError:
+        pytest.skip("3-D sparse arrays need a newer scipy")
+
+    assert T.shape == (3, n, n)
+    assert np.allclose(ensemble_assortativity(T), ensemble_assortativity(S, n))
+    assert np.allclose(ensemble_spectral_moments(T), ensemble_spectral_moments(S, n=n))
+    assert np.allclose(ensemble_edge_overlap(T, G), ensemble_edge_overlap(S, G, n))
+    with pytest.raises(ValueError):
+        ensemble_degrees(S)
+
+
+def test_rewire_ensemble_cache(tmp_path):
+    """A cached ensemble equals the uncached one, and is loaded when rerun."""
+    from netrw.rewire import RewireCache
+
+    G = nx.gnm_random_graph(40, 100, seed=3)
+    cache = RewireCache(str(tmp_path))
+    S = rewire_ensemble(G, NetworkXEdgeSwap, 3, seed=2, timesteps=30)
+    cold = rewire_ensemble(G, NetworkXEdgeSwap, 3, seed=2, cache=cache, timesteps=30)
+    warm = rewire_ensemble(G, NetworkXEdgeSwap, 3, seed=2, cache=cache, timesteps=30)
+    assert len(list(tmp_path.iterdir())) == 3
+    assert (S != cold).nnz == 0
+    assert (S != warm).nnz == 0
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+
+def test_rewire_import_is_light():
+    """Importing netrw and its rewirers loads neither scipy nor plotting."""
+    code = (
+        "import sys, netrw\n"
+        "from netrw.rewire import NetworkXEdgeSwap\n"
+        "loaded = {'scipy', 'matplotlib', 'netrd', 'netrw.analysis'}\n"
+        "print(sorted(loaded & set(sys.modules)))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_lazy_attributes():
+    """Submodules and re-exported functions load on first access."""
+    import netrw
+    from netrw.analysis import distributions
+
+    assert netrw.analysis.distributions is distributions
+    assert netrw.get_property_distribution is distributions.get_property_distribution
+    assert "rewire" in dir(netrw)
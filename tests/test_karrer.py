@@ -1,5 +1,6 @@
 import networkx as nx
 import numpy as np
+import pytest
 from netrw.rewire import KarrerRewirer
 
 
@@ -20,3 +21,32 @@ def test_same_return_type():
     avg_degree /= iterations
 
     assert np.linalg.norm(original_degree - avg_degree) < 1
+
+
+def test_sweep():
+    """Larger alphas replace a superset of the edges with a superset of new ones."""
+    G = nx.gnm_random_graph(50, 200, seed=1)
+    alphas = [0, 0.2, 0.5, 1]
+    nodes, samples = KarrerRewirer(seed=2).sweep(G, alphas)
+    assert samples.shape == (4, 200, 2)
+    assert [(nodes[u], nodes[v]) for u, v in samples[0]] == list(G.edges())
+
+    changed = [set(np.flatnonzero((s != samples[0]).any(axis=1))) for s in samples]
+    for i in range(1, len(samples)):
+        assert changed[i - 1] <= changed[i]
+        rows = sorted(changed[i - 1])
+        assert np.array_equal(samples[i][rows], samples[i - 1][rows])
+    assert 0 < len(changed[1]) < len(changed[2]) < 200
+
+    _, edges, changes = KarrerRewirer(seed=2).sweep(G, alphas, deltas=True)
+    assert np.array_equal(edges, samples[0])
+    for (removed, added), before, after in zip(changes, samples, samples[1:]):
+        assert len(removed) == len(added)
+        remaining = sorted(map(tuple, before.tolist()))
+        for e in removed.tolist():
+            remaining.remove(tuple(e))
+        remaining += map(tuple, added.tolist())
+        assert sorted(remaining) == sorted(map(tuple, after.tolist()))
+
+    with pytest.raises(ValueError):
+        KarrerRewirer().sweep(G, [0.5, 0.2], deltas=True)
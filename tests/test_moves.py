@@ -0,0 +1,56 @@
+import networkx as nx
+import pytest
+from netrw.rewire import AssortativityLocalMinimum, BaseRewirer, Move
+
+
+def _applied(G, move):
+    H = G.copy()
+    H.remove_edges_from(move.removed)
+    H.add_edges_from(move.added)
+    return H
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_move_view(directed):
+    """The view shows the graph after the move, which is applied on commit."""
+    G = nx.gnm_random_graph(30, 80, seed=1, directed=directed)
+    nx.set_edge_attributes(G, 1.5, "weight")
+    (a, b), (c, d) = list(G.edges())[:2]
+    move = BaseRewirer().propose(G, [(a, b), (c, d)], [(a, d, {"weight": 2})])
+    before = set(G.edges())
+
+    H = _applied(G, move)
+    assert set(move.view.edges()) == set(H.edges())
+    assert dict(move.view.degree()) == dict(H.degree())
+    assert move.evaluate(nx.number_of_edges) == 79
+    assert move.view.edges[a, d]["weight"] == 2
+    assert nx.is_frozen(move.view)
+    assert set(G.edges()) == before
+
+    assert move.commit() is G
+    assert set(G.edges()) == set(H.edges())
+    with pytest.raises(ValueError):
+        move.rollback()
+
+
+def test_move_rollback():
+    G = nx.path_graph(5)
+    move = Move(G, [(1, 2)], [(2, 4)])
+    assert nx.number_connected_components(move.view) == 2
+    move.rollback()
+    assert move.status == "rolled back"
+    assert set(G.edges()) == set(nx.path_graph(5).edges())
+    with pytest.raises(ValueError):
+        move.commit()
+    with pytest.raises(ValueError):
+        Move(G, [(0, 2)])
+    with pytest.raises(ValueError):
+        Move(G, [], [(0, 7)])
+
+
+def test_local_minimum_keeps_degrees():
+    G = nx.gnm_random_graph(30, 60, seed=2)
+    H = AssortativityLocalMinimum().full_rewire(G, timesteps=200)
+    assert dict(H.degree()) == dict(G.degree())
+    r = nx.degree_assortativity_coefficient
+    assert r(H) < r(G)
@@ -0,0 +1,38 @@
+import networkx as nx
+import numpy as np
+from netrw.rewire import mixing_diagnostics, sample_null_models, to_edge_array
+
+
+def test_mixing_diagnostics_decay():
+    """The overlap with the start decays to the chance level."""
+    G = nx.barabasi_albert_graph(300, 3, seed=1)
+    nodes, edges = to_edge_array(G)
+    nswap, diagnostics = mixing_diagnostics(edges, len(nodes), seed=1)
+
+    assert 0 < nswap < 5 * len(edges)
+    assert diagnostics["swaps"][-1] == nswap
+    assert diagnostics["autocorrelation"][0] == 1
+    assert diagnostics["autocorrelation"][-1] < 0.05
+    assert diagnostics["overlap"][-1] < 0.2
+
+
+def test_sample_null_models():
+    """Samples keep the degrees and are spaced by the estimated swaps."""
+    G = nx.gnm_random_graph(200, 800, seed=2, directed=True)
+    nodes, edges = to_edge_array(G)
+    samples, info = sample_null_models(edges, len(nodes), 4, directed=True, seed=3)
+
+    assert samples.shape == (4, 800, 2)
+    assert info["spacing"] == info["burn_in"] > 0
+    assert info["autocorrelation"] < 0.1
+    for sample in samples:
+        H = nx.DiGraph(sample.tolist())
+        assert H.number_of_edges() == 800
+        assert all(H.out_degree(u) == G.out_degree(u) for u in H)
+        assert all(H.in_degree(u) == G.in_degree(u) for u in H)
+    assert not np.array_equal(samples[0], samples[1])
+
+    again, _ = sample_null_models(
+        edges, len(nodes), 2, directed=True, spacing=100, burn_in=0, seed=3
+    )
+    assert np.array_equal(again[0], edges)
@@ -0,0 +1,49 @@
+import networkx as nx
+import numpy as np
+from netrw.rewire import out_of_core_edge_swap, out_of_core_global_rewire
+
+
+def test_out_of_core_swap_preserves_degrees(tmp_path):
+    """Swapping a file in small blocks keeps the degrees and a simple graph."""
+    G = nx.gnm_random_graph(500, 2000, seed=1)
+    np.array(G.edges(), dtype=np.int32).tofile(tmp_path / "edges.bin")
+
+    nswaps = out_of_core_edge_swap(
+        str(tmp_path / "edges.bin"),
+        str(tmp_path / "out.bin"),
+        4000,
+        dtype=np.int32,
+        block_size=300,
+        seed=1,
+    )
+    edges = np.fromfile(tmp_path / "out.bin", dtype=np.int32).reshape(-1, 2)
+    H = nx.Graph()
+    H.add_nodes_from(G)
+    H.add_edges_from(edges.tolist())
+
+    assert nswaps == 4000
+    assert H.number_of_edges() == len(edges)
+    assert nx.number_of_selfloops(H) == 0
+    assert dict(H.degree()) == dict(G.degree())
+    assert not (tmp_path / "out.bin.index.npy").exists()
+
+
+def test_out_of_core_global_rewire(tmp_path):
+    G = nx.gnm_random_graph(500, 2000, seed=2, directed=True)
+    np.array(G.edges(), dtype=np.int64).tofile(tmp_path / "edges.bin")
+
+    moved = out_of_core_global_rewire(
+        str(tmp_path / "edges.bin"),
+        str(tmp_path / "out.bin"),
+        1000,
+        directed=True,
+        block_size=300,
+        seed=2,
+    )
+    edges = np.fromfile(tmp_path / "out.bin", dtype=np.int64).reshape(-1, 2)
+    H = nx.DiGraph(edges.tolist())
+
+    assert moved == 1000
+    assert H.number_of_edges() == G.number_of_edges()
+    assert nx.number_of_selfloops(H) == 0
+    assert set(H.edges()) != set(G.edges())
@@ -0,0 +1,63 @@
+import networkx as nx
+import numpy as np
+from netrw.rewire import NetworkXEdgeSwap, parallel_double_edge_swap
+from netrw.rewire.rng import BlockRNG
+from netrw.rewire.parallel_swap import _propose, _Round
+from netrw.rewire.edge_array import edge_keys
+
+
+def _serial(edges, n, nswap, directed, round_size, seed):
+    """Replay the proposals of parallel_double_edge_swap one at a time."""
+    rng = BlockRNG(seed)
+    tails, heads = edges[:, 0].copy(), edges[:, 1].copy()
+    codes = np.sort(edge_keys(edges, n, directed))
+    state = _Round(tails, heads, codes, n, directed)
+    done = 0
+    tries = 0
+    while done < nswap and tries < 10 * nswap + 100:
+        tries += round_size
+        (seed_seq,) = [child.seed_seq for child in rng.spawn(1)]
+        i, j, flip, _ = _propose(tails, heads, codes, n, directed, round_size, seed_seq)
+        for p in range(round_size):
+            if done == nswap:
+                break
+            done += state.swap(int(i[p]), int(j[p]), bool(flip[p]))
+    out = edges.copy()
+    for index, (u, v) in state.edges.items():
+        out[index] = u, v
+    return out, done
+
+
+def test_parallel_swap_matches_serial_chain():
+    """Resolving a round of proposals at once equals applying them in order."""
+    for directed in (False, True):
+        G = nx.gnm_random_graph(200, 1500, seed=2, directed=directed)
+        edges = np.array(G.edges(), dtype=np.int64)
+        result = parallel_double_edge_swap(
+            edges, 200, 3000, directed=directed, round_size=1024, seed=5
+        )
+        expected = _serial(edges, 200, 3000, directed, 1024, 5)
+        assert result[1] == expected[1] == 3000
+        assert np.array_equal(result[0], expected[0])
+
+
+def test_parallel_swap_processes():
+    """Several processes keep the degrees and give reproducible results."""
+    G = nx.gnm_random_graph(300, 2000, seed=3)
+    edges = np.array(G.edges(), dtype=np.int64)
+    out, nswaps = parallel_double_edge_swap(edges, 300, 4000, n_jobs=2, seed=7)
+    again, _ = parallel_double_edge_swap(edges, 300, 4000, n_jobs=2, seed=7)
+    H = nx.Graph()
+    H.add_nodes_from(G)
+    H.add_edges_from(out.tolist())
+
+    assert nswaps == 4000
+    assert np.array_equal(out, again)
+    assert H.number_of_edges() == len(edges)
+    assert nx.number_of_selfloops(H) == 0
+    assert dict(H.degree()) == dict(G.degree())
+
+    G = nx.karate_club_graph()
+    H = NetworkXEdgeSwap(seed=1).full_rewire(G, timesteps=200, n_jobs=2)
+    assert dict(H.degree()) == dict(G.degree())
+    assert all("weight" in d for _, _, d in H.edges(data=True))
@@ -0,0 +1,76 @@
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.analysis import properties
+from netrw.analysis.properties import Property, PropertyEvaluator
+from netrw.analysis.rewiring_analysis import (
+    average_local_clustering,
+    average_shortest_path_length,
+)
+
+
+def test_properties_match_networkx():
+    """Shared-intermediate properties agree with their networkx versions."""
+    G = nx.disjoint_union(nx.karate_club_graph(), nx.gnm_random_graph(20, 40, seed=1))
+    G.add_node("isolated")
+    k = np.array([d for _, d in G.degree()])
+    checks = {
+        properties.number_of_nodes: G.number_of_nodes(),
+        properties.number_of_edges: G.number_of_edges(),
+        properties.min_degree: k.min(),
+        properties.max_degree: k.max(),
+        properties.degree_second_moment: np.mean(k**2),
+        properties.assortativity: nx.degree_assortativity_coefficient(G),
+        properties.number_connected_components: nx.number_connected_components(G),
+        properties.transitivity: nx.transitivity(G),
+        properties.average_clustering: nx.average_clustering(G),
+        properties.average_local_clustering: average_local_clustering(G),
+        properties.average_shortest_path_length: average_shortest_path_length(G),
+    }
+    evaluate = PropertyEvaluator(list(checks))
+    assert np.allclose(evaluate(G), list(checks.values()))
+    assert evaluate.names[0] == "number_of_nodes"
+
+
+def test_custom_property():
+    """User properties can request the graph or any shared quantity."""
+    density = Property("density", nx.density)
+    leaves = Property("leaves", lambda k: np.sum(k == 1), ("degrees",))
+    G = nx.star_graph(5)
+    assert np.allclose(PropertyEvaluator([density, leaves])(G), [nx.density(G), 5])
+    assert leaves(G) == 5
+    with pytest.raises(ValueError):
+        Property("bad", len, ("spectrum",))
+
+
+def test_various_properties_overtime_names():
+    """The property names default to those of the evaluator or functions."""
+    from netrw.analysis.rewiring_analysis import various_properties_overtime
+    from netrw.rewire import NetworkXEdgeSwap
+
+    G = nx.gnm_random_graph(30, 60, seed=1)
+    evaluator = PropertyEvaluator([properties.number_of_edges, properties.max_degree])
+    values = various_properties_overtime(
+        G, NetworkXEdgeSwap, evaluator, tmax=3, numit=2, seed=1
+    )
+    assert set(values) == set(evaluator.names)
+    assert values[evaluator.names[0]].shape == (2, 3)
+    assert np.all(values[evaluator.names[0]] == 60)
+
+    values = various_properties_overtime(
+        G, NetworkXEdgeSwap, [nx.density, nx.number_of_edges], tmax=3, numit=2, seed=1
+    )
+    assert set(values) == {"density", "number_of_edges"}
+
+
+def test_various_properties_overtime_positional():
+    """The names, tmax and numit keep their original positions."""
+    from netrw.analysis.rewiring_analysis import various_properties_overtime
+    from netrw.rewire import NetworkXEdgeSwap
+
+    G = nx.gnm_random_graph(30, 60, seed=1)
+    values = various_properties_overtime(
+        G, NetworkXEdgeSwap, [nx.average_clustering], ["clu"], 3, 2
+    )
+    assert set(values) == {"clu"}
+    assert values["clu"].shape == (2, 3)
@@ -0,0 +1,77 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.analysis import parameter_sweep, plot_properties_heatmap
+from netrw.analysis.properties import transitivity
+from netrw.rewire import GlobalRewiring
+
+
+def test_parameter_sweep():
+    G = nx.watts_strogatz_graph(40, 4, 0, seed=1)
+    grid = {"p": [0.2, 0.9], "timesteps": [50, 0, 10]}
+    values = parameter_sweep(
+        G,
+        GlobalRewiring,
+        [nx.average_clustering, transitivity],
+        grid,
+        3,
+        checkpoint="timesteps",
+        seed=1,
+    )
+    assert set(values) == {"average_clustering", "transitivity"}
+    clustering = values["average_clustering"]
+    assert clustering.shape == (2, 3, 3)
+    assert np.allclose(clustering[:, 1], nx.average_clustering(G))
+    assert np.all(clustering[:, 0].mean(axis=1) < nx.average_clustering(G))
+
+    # the same rewirings, whatever the number of processes
+    again = parameter_sweep(
+        G,
+        GlobalRewiring,
+        [nx.average_clustering, transitivity],
+        grid,
+        3,
+        checkpoint="timesteps",
+        n_jobs=2,
+        seed=1,
+    )
+    assert np.array_equal(again["transitivity"], values["transitivity"])
+
+    restarted = parameter_sweep(
+        G, GlobalRewiring, nx.average_clustering, grid, 2, seed=1
+    )
+    assert restarted["average_clustering"].shape == (2, 3, 2)
+
+    fig = plot_properties_heatmap(clustering, grid, label="clustering")
+    assert fig.axes[0].get_xlabel() == "timesteps"
+
+    with pytest.raises(ValueError):
+        parameter_sweep(G, GlobalRewiring, nx.average_clustering, {"p": [0.1]})
+
+    # -1 (rewire every edge) is not a number of steps to continue from
+    grid = {"p": [0.9], "timesteps": [-1, 10]}
+    with pytest.raises(ValueError):
+        parameter_sweep(
+            G, GlobalRewiring, nx.average_clustering, grid, checkpoint="timesteps"
+        )
+    values = parameter_sweep(G, GlobalRewiring, nx.average_clustering, grid, 2, seed=1)
+    assert np.all(values["average_clustering"][0, 0] < nx.average_clustering(G))
+
+
+def test_parameter_sweep_cache(tmp_path):
+    """A cached sweep equals the uncached one."""
+    from netrw.rewire import RewireCache
+
+    G = nx.watts_strogatz_graph(40, 4, 0, seed=1)
+    grid = {"p": [0.2, 0.9], "timesteps": [10, 20]}
+    cache = RewireCache(str(tmp_path))
+    values = parameter_sweep(G, GlobalRewiring, transitivity, grid, 2, seed=1)
+    for _ in range(2):
+        cached = parameter_sweep(
+            G, GlobalRewiring, transitivity, grid, 2, seed=1, cache=cache
+        )
+        assert np.array_equal(cached["transitivity"], values["transitivity"])
+    assert len(list(tmp_path.iterdir())) == 8
@@ -0,0 +1,53 @@
+import networkx as nx
+import numpy as np
+from netrw.rewire import RandomizedWeightCM_swap, RandomizedWeightCM_redistribution
+
+
+def _weighted_graph(directed=False):
+    G = nx.gnm_random_graph(100, 600, seed=1, directed=directed)
+    rng = np.random.default_rng(1)
+    for u, v in G.edges():
+        G.edges[u, v]["weight"] = rng.random()
+    return G
+
+
+def _weights(G):
+    return [d["weight"] for _, _, d in G.edges(data=True)]
+
+
+def test_weight_swap_permutes_weights():
+    """Swapping keeps the edges and the multiset of weights."""
+    G = _weighted_graph()
+    for timesteps in (-1, 1, 100):
+        H = RandomizedWeightCM_swap(seed=2).full_rewire(G, timesteps=timesteps)
+        assert set(H.edges()) == set(G.edges())
+        assert sorted(_weights(H)) == sorted(_weights(G))
+        assert _weights(H) != _weights(G)
+
+
+def test_weight_redistribution_preserves_total():
+    """Redistribution keeps the total weight of the network."""
+    G = _weighted_graph()
+    for timesteps in (-1, 1, 100):
+        H = RandomizedWeightCM_redistribution(seed=2).full_rewire(
+            G, timesteps=timesteps
+        )
+        assert np.isclose(sum(_weights(H)), sum(_weights(G)))
+        assert min(_weights(H)) >= 0
+
+
+def test_weight_redistribution_preserves_strength():
+    """The strength-preserving mode keeps every (in- and out-) strength."""
+    for directed in (False, True):
+        G = _weighted_graph(directed)
+        H = RandomizedWeightCM_redistribution(seed=3).full_rewire(
+            G, preserve_strength=True
+        )
+        views = ["in_degree", "out_degree"] if directed else ["degree"]
+        for view in views:
+            assert np.allclose(
+                [s for _, s in getattr(H, view)(weight="weight")],
+                [s for _, s in getattr(G, view)(weight="weight")],
+            )
+        assert min(_weights(H)) >= 0
+        assert not np.allclose(_weights(H), _weights(G))
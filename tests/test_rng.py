@@ -0,0 +1,60 @@
+import networkx as nx
+from netrw.rewire import (
+    BlockRNG,
+    GlobalRewiring,
+    KarrerRewirer,
+    LocalEdgeRewiring,
+    NetworkXEdgeSwap,
+)
+
+
+def test_block_rng_reproducible():
+    """Two streams with the same seed produce the same draws, across block refills."""
+    a = BlockRNG(42, block_size=7)
+    b = BlockRNG(42, block_size=7)
+
+    assert [a.random() for _ in range(50)] == [b.random() for _ in range(50)]
+    assert [a.integers(10) for _ in range(50)] == [b.integers(10) for _ in range(50)]
+
+
+def test_spawned_streams_are_independent():
+    """Children spawned from the same parent differ from each other and are reproducible."""
+    first = [rng.random() for rng in BlockRNG(1).spawn(5)]
+    second = [rng.random() for rng in BlockRNG(1).spawn(5)]
+
+    assert first == second
+    assert len(set(first)) == 5
+
+
+def test_seeded_rewirers_reproducible():
+    """A fixed seed reproduces a rewiring run exactly."""
+    G = nx.fast_gnp_random_graph(30, 0.2, seed=0)
+
+    for rewirer, kwargs in [
+        (GlobalRewiring, {"p": 0.5, "timesteps": 20}),
+        (LocalEdgeRewiring, {"timesteps": 20}),
+        (NetworkXEdgeSwap, {"timesteps": 20}),
+    ]:
+        G1 = rewirer(seed=3).full_rewire(G, **kwargs)
+        G2 = rewirer(seed=3).full_rewire(G, **kwargs)
+        assert sorted(G1.edges()) == sorted(G2.edges())
+
+    G1 = KarrerRewirer(seed=3).rewire(G, 0.5)
+    G2 = KarrerRewirer(seed=3).rewire(G, 0.5)
+    assert sorted(G1.edges()) == sorted(G2.edges())
+
+
+def test_spawned_rewirers():
+    """Rewirers spawned for an ensemble produce different samples."""
+    G = nx.fast_gnp_random_graph(30, 0.2, seed=0)
+    samples = [
+        sorted(rw.full_rewire(G, timesteps=20).edges())
+        for rw in NetworkXEdgeSwap(seed=0).spawn(3)
+    ]
+
+    assert samples[0] != samples[1] or samples[1] != samples[2]
+    degrees = sorted(d for _, d in G.degree())
+    for s in samples:
+        H = nx.Graph(s)
+        H.add_nodes_from(G)
+        assert sorted(d for _, d in H.degree()) == degrees
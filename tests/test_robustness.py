@@ -0,0 +1,49 @@
+import networkx as nx
+import numpy as np
+import pytest
+from netrw.analysis import percolation_curves, schneider_robustness
+
+
+def _giant_fractions(G, order):
+    H = G.copy()
+    fractions = [max(map(len, nx.connected_components(H))) / len(G)]
+    for u in order:
+        H.remove_node(u)
+        fractions.append(max(map(len, nx.connected_components(H)), default=0) / len(G))
+    return fractions
+
+
+def test_percolation_curves():
+    """The Newman-Ziff curves are those of removing the nodes one by one."""
+    G = nx.gnm_random_graph(40, 60, seed=1)
+    G.add_edge(3, 3)
+    rng = np.random.default_rng(2)
+    orders = [rng.permutation(40).tolist() for _ in range(5)]
+    curves = percolation_curves(G, orders)
+    for order, curve in zip(orders, curves):
+        assert np.allclose(curve, _giant_fractions(G, order))
+
+    random = percolation_curves(G, "random", k=20, seed=3)
+    assert random.shape == (20, 41)
+    assert np.all(np.diff(random, axis=1) <= 0)
+
+    with pytest.raises(ValueError):
+        percolation_curves(G, "betweenness")
+
+
+def test_schneider_robustness():
+    star = nx.star_graph(9)
+    assert np.allclose(schneider_robustness(star), 9 / 100)
+    assert np.allclose(schneider_robustness(star, "degree", k=3), 9 / 100)
+
+    G = nx.barabasi_albert_graph(200, 2, seed=1)
+    adaptive = schneider_robustness(G, "adaptive", seed=1)[0]
+    degree = schneider_robustness(G, "degree", seed=1)[0]
+    random = schneider_robustness(G, "random", k=10, seed=1).mean()
+    assert adaptive <= degree < random < 0.5
+
+
+@pytest.mark.parametrize("attack", ["random", "degree", "adaptive"])
+def test_empty_graph(attack):
+    assert np.array_equal(percolation_curves(nx.Graph(), attack, k=3), np.zeros((3, 1)))
+    assert np.array_equal(schneider_robustness(nx.Graph(), attack, k=2), np.zeros(2))
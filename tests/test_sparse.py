@@ -0,0 +1,59 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from netrw.rewire import (
+    DirectedEdgeSwap,
+    LocalEdgeRewiring,
+    NetworkXEdgeSwap,
+    RandomizedWeightCM_swap,
+)
+
+
+def _weighted_adjacency(directed=False):
+    G = nx.gnm_random_graph(100, 400, seed=1, directed=directed)
+    for u, v in G.edges():
+        G.edges[u, v]["weight"] = 1.0 + u + v
+    return nx.to_scipy_sparse_array(G)
+
+
+def test_sparse_edge_swap_preserves_degrees_and_weights():
+    """Native sparse swaps keep the degrees, the entries and the format."""
+    A = _weighted_adjacency()
+    B = NetworkXEdgeSwap(seed=1).full_rewire(sp.csr_matrix(A), timesteps=500)
+
+    assert isinstance(B, sp.csr_matrix)
+    assert (abs(B - B.T)).nnz == 0
+    assert np.array_equal((A != 0).sum(axis=0), np.ravel((B != 0).sum(axis=0)))
+    assert sorted(A.data) == sorted(B.data)
+    assert (abs(A - B)).nnz > 0
+
+
+def test_sparse_directed_swap():
+    """Directed matrices keep their in- and out-degrees."""
+    A = _weighted_adjacency(directed=True).tocoo()
+    B = DirectedEdgeSwap(seed=1).full_rewire(A, timesteps=500)
+
+    assert B.format == "coo"
+    assert np.array_equal((A != 0).sum(axis=0), (B != 0).sum(axis=0))
+    assert np.array_equal((A != 0).sum(axis=1), (B != 0).sum(axis=1))
+
+
+def test_sparse_weight_swap_keeps_edges():
+    A = _weighted_adjacency()
+    B = RandomizedWeightCM_swap(seed=1).full_rewire(A)
+
+    assert ((A != 0) != (B != 0)).nnz == 0
+    assert (abs(B - B.T)).nnz == 0
+    assert np.isclose(A.sum(), B.sum())
+
+
+def test_sparse_fallback_matches_networkx():
+    """Rewirers without a native sparse path give the networkx result."""
+    A = _weighted_adjacency()
+    G = nx.from_scipy_sparse_array(A)
+
+    B = LocalEdgeRewiring(seed=3).full_rewire(A, timesteps=50)
+    H = LocalEdgeRewiring(seed=3).full_rewire(G, timesteps=50)
+
+    assert sp.issparse(B)
+    assert (abs(B - nx.to_scipy_sparse_array(H, nodelist=range(100)))).nnz == 0
@@ -0,0 +1,41 @@
+import networkx as nx
+import numpy as np
+from netrw.analysis import StreamingStats
+from netrw.analysis.properties_overtime import properties_overtime
+from netrw.rewire import NetworkXEdgeSwap
+
+
+def test_streaming_stats_match_the_full_ensemble():
+    """Merged accumulators give the moments and quantiles of all the rows."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3000, 20)) * np.arange(1, 21)
+
+    stats = StreamingStats(20)
+    for row in X[:1000]:
+        stats.add(row)
+    other = StreamingStats(20).add(X[1000:])
+    stats.merge(other).merge(StreamingStats(20))
+
+    assert stats.count == 3000
+    assert np.allclose(stats.mean, X.mean(axis=0))
+    assert np.allclose(stats.var(), X.var(axis=0))
+    assert np.allclose(stats.std(ddof=1), X.std(axis=0, ddof=1))
+    assert np.array_equal(stats.min, X.min(axis=0))
+    assert np.array_equal(stats.max, X.max(axis=0))
+
+    q = stats.quantile([0.1, 0.5, 0.9])
+    assert q.shape == (3, 20)
+    ranks = (X[:, None, :] <= q).mean(axis=0)
+    assert np.all(np.abs(ranks - [[0.1], [0.5], [0.9]]) < 0.03)
+    assert np.array_equal(stats.median(), q[1])
+
+
+def test_properties_overtime_streaming():
+    """The streaming summary agrees with the stored ensemble."""
+    G = nx.karate_club_graph()
+    args = (G, NetworkXEdgeSwap, nx.transitivity, 15, 8)
+    full = properties_overtime(*args, seed=3)["transitivity"]
+    stats = properties_overtime(*args, seed=3, streaming=True)["transitivity"]
+    assert stats.count == 8
+    assert np.allclose(stats.mean, full.mean(axis=0))
+    assert np.allclose(stats.std(), full.std(axis=0))
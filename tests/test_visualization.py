@@ -0,0 +1,75 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import networkx as nx
+import numpy as np
+from netrw.rewire import NetworkXEdgeSwap
+from netrw.visualization.visualization import (
+    animate_rewiring,
+    edge_diff,
+    layout,
+    rewiring_frames,
+)
+
+
+def test_edge_diff():
+    """Only the edges that changed are reported, in either orientation."""
+    G1 = nx.Graph([(0, 1), (1, 2), (2, 3)])
+    G2 = nx.Graph([(1, 0), (2, 3), (3, 1)])
+    removed, added = edge_diff(G1, G2)
+    assert removed == [(1, 2)]
+    assert added == [(1, 3)]
+
+
+def test_rewiring_frames():
+    """Frames follow the trajectory and report the edges added each step."""
+    G = nx.karate_club_graph()
+    frames = list(rewiring_frames(G, NetworkXEdgeSwap(seed=1), frames=5))
+    assert len(frames) == 6
+    assert len(frames[0][1]) == 0
+    for (before, _, _), (after, added, removed) in zip(frames, frames[1:]):
+        assert len(after) == G.number_of_edges()
+        assert len(added) == len(removed) <= 2
+        assert _edges(before) == (_edges(after) - _edges(added)) | _edges(removed)
+    assert G.number_of_edges() == len(frames[0][0])
+
+
+def _edges(edges):
+    return set(map(frozenset, edges.tolist()))
+
+
+def test_layout_is_cached_and_animation_renders(tmp_path):
+    """The layout is reused and every frame draws the edges of its graph."""
+    G = nx.cycle_graph(30)
+    pos = layout(G)
+    assert layout(G) is pos
+    xy = np.array([pos[u] for u in G])
+
+    anim = animate_rewiring(G, NetworkXEdgeSwap(seed=2), frames=3)
+    writer = _RecordingWriter()
+    anim.save(str(tmp_path / "anim.gif"), writer=writer)
+    expected = rewiring_frames(G, NetworkXEdgeSwap(seed=2), frames=3)
+
+    assert len(writer.frames) == 4
+    for (segments, new), (edges, added, _) in zip(writer.frames, expected):
+        assert len(segments) == len(edges) == 30
+        drawn = {frozenset(map(tuple, s.round(9).tolist())) for s in segments}
+        assert drawn == {frozenset(map(tuple, xy[e].round(9).tolist())) for e in edges}
+        assert len(new) == len(added)
+
+
+class _RecordingWriter(matplotlib.animation.AbstractMovieWriter):
+    """Draws every frame and records its segments, without a file."""
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi)
+        self.frames = []
+
+    def grab_frame(self, **savefig_kwargs):
+        self.fig.canvas.draw()
+        all_edges, new_edges = self.fig.axes[0].collections[1:]
+        self.frames.append((all_edges.get_segments(), new_edges.get_segments()))
+
+    def finish(self):
+        pass